@@ -0,0 +1,193 @@
+"""Compact serialisation of models for pickling and inter-process transfer
+
+Pickling a model normally stores every nested model as a dict of its fields
+along with a set of the fields that were set. Here each model is stored as a
+tuple of its field values in declaration order instead, with the nested
+models found from the field annotations, and rebuilt without validation.
+"""
+
+import hashlib
+import types
+from enum import Enum
+from operator import attrgetter
+from typing import (Annotated, Any, Callable, Dict, Iterator, List, Optional,
+                    Tuple, Type, Union, get_args, get_origin)
+
+from pydantic import BaseModel
+
+# Bump when the layout of the compact data changes
+FORMAT_VERSION = 1
+
+# Origins of Optional[X] and X | None, the latter only from Python 3.10
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+_ALL_SET = -1
+
+_Codec = Optional[Tuple[Callable[[Any], Any], Callable[[Any], Any]]]
+
+_object_setattr = object.__setattr__
+
+
+class _ModelCodec:
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.names = tuple(model.model_fields)
+        self.bits = {name: 1 << i for i, name in enumerate(self.names)}
+        # Set once the codecs of every field are known
+        self.codecs: List[_Codec] = []
+        self.plain = False
+
+    def encode(self, obj: BaseModel) -> tuple:
+        if type(obj) is not self.model:
+            # A subclass, such as the frozen models shared by flyweight
+            # loads, or a named tuple in place of the model, see PointTuple.
+            # These pickle as they are, keeping their type, and pickle only
+            # stores a shared one once.
+            return obj
+        values = obj.__dict__
+        fields_set = obj.__pydantic_fields_set__
+        if len(fields_set) == len(self.names):
+            mask = _ALL_SET
+        else:
+            mask = sum(self.bits[name] for name in fields_set)
+        return (mask,) + tuple(
+            values[name] if codec is None else codec[0](values[name])
+            for name, codec in zip(self.names, self.codecs)
+        )
+
+    def decode(self, data: tuple) -> BaseModel:
+        if type(data) is not tuple:
+            return data
+        obj = self.model.__new__(self.model)
+        mask = data[0]
+        if mask == _ALL_SET:
+            fields_set = set(self.names)
+        else:
+            fields_set = {name for name in self.names if mask & self.bits[name]}
+        if self.plain:
+            values = dict(zip(self.names, data[1:]))
+        else:
+            values = {
+                name: value if codec is None else codec[1](value)
+                for name, codec, value in zip(self.names, self.codecs, data[1:])
+            }
+        _object_setattr(obj, "__dict__", values)
+        _object_setattr(obj, "__pydantic_fields_set__", fields_set)
+        _object_setattr(obj, "__pydantic_extra__", None)
+        _object_setattr(obj, "__pydantic_private__", None)
+        return obj
+
+
+_model_codecs: Dict[Type[BaseModel], _ModelCodec] = {}
+_signatures: Dict[Type[BaseModel], str] = {}
+
+
+def _model_codec(model: Type[BaseModel]) -> _ModelCodec:
+    codec = _model_codecs.get(model)
+    if codec is None:
+        # Registered before the fields so that models can refer to themselves
+        codec = _model_codecs[model] = _ModelCodec(model)
+        codec.codecs = [_codec(f.annotation) for f in model.model_fields.values()]
+        codec.plain = all(c is None for c in codec.codecs)
+    return codec
+
+
+def _optional(codec: _Codec) -> _Codec:
+    encode, decode = codec
+    return (
+        lambda value: None if value is None else encode(value),
+        lambda value: None if value is None else decode(value),
+    )
+
+
+def _list(codec: _Codec) -> _Codec:
+    encode, decode = codec
+    return (
+        lambda values: [encode(value) for value in values],
+        lambda values: [decode(value) for value in values],
+    )
+
+
+def _codec(annotation: Any) -> _Codec:
+    """Return the encode and decode functions for values of an annotation
+
+    Returns None for values that are stored unchanged.
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Annotated:
+        return _codec(args[0])
+    if origin in _UNION_TYPES:
+        args = [arg for arg in args if arg is not type(None)]
+        if len(args) == 1:
+            codec = _codec(args[0])
+            return codec and _optional(codec)
+        return None
+    if origin is list:
+        codec = _codec(args[0])
+        return codec and _list(codec)
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            codec = _model_codec(annotation)
+            return codec.encode, codec.decode
+        if issubclass(annotation, Enum):
+            return attrgetter("value"), annotation
+    return None
+
+
+def _nested_models(annotation: Any) -> Iterator[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _nested_models(arg)
+
+
+def _annotation_name(annotation: Any) -> str:
+    # Unlike repr, the same in every process, as the validators of
+    # Annotated are left out
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _annotation_name(get_args(annotation)[0])
+    if origin is not None:
+        args = ", ".join(_annotation_name(arg) for arg in get_args(annotation))
+        return f"{_annotation_name(origin)}[{args}]"
+    if isinstance(annotation, type):
+        return f"{annotation.__module__}.{annotation.__qualname__}"
+    return repr(annotation)
+
+
+def _signature(model: Type[BaseModel]) -> str:
+    signature = _signatures.get(model)
+    if signature is None:
+        layout = {}
+        pending = [model]
+        while pending:
+            m = pending.pop()
+            name = f"{m.__module__}.{m.__qualname__}"
+            if name in layout:
+                continue
+            # Field types are included, so that a field changing type is
+            # caught as well as one being added or renamed
+            layout[name] = tuple(
+                (field_name, _annotation_name(field.annotation))
+                for field_name, field in m.model_fields.items()
+            )
+            for field in m.model_fields.values():
+                pending.extend(_nested_models(field.annotation))
+        digest = hashlib.sha256(repr(sorted(layout.items())).encode())
+        signature = _signatures[model] = digest.hexdigest()[:16]
+    return signature
+
+
+def to_compact(model: BaseModel) -> tuple:
+    """Convert a model and the models nested in it into plain tuples"""
+    cls = type(model)
+    return (FORMAT_VERSION, _signature(cls), _model_codec(cls).encode(model))
+
+
+def from_compact(cls: Type[BaseModel], data: tuple) -> BaseModel:
+    """Rebuild a model from the output of to_compact without validating it"""
+    version, signature, body = data
+    if version != FORMAT_VERSION or signature != _signature(cls):
+        raise ValueError(f"Compact data does not match the {cls.__name__} model")
+    return _model_codec(cls).decode(body)
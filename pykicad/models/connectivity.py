@@ -0,0 +1,251 @@
+"""Connectivity of a schematic, computed from the positions of its items
+
+Items are joined with union-find when they meet at a point: wire ends, wire
+ends or other items landing on the middle of a wire, junctions, labels and
+the pins of placed symbols. Wires that only cross are not connected. Labels
+join every other label of the same kind with the same name, and the pins of
+power symbols (those from a "power:" library) join the global labels named
+by the value of the symbol.
+"""
+
+import bisect
+import math
+from typing import (TYPE_CHECKING, Dict, Hashable, Iterator, List, NamedTuple,
+                    Optional, Tuple)
+
+from pykicad.models.spatial import SpatialIndex, _point_segment_distance
+
+if TYPE_CHECKING:
+    from pykicad.models.schematic import (Junction, Label, Schematic,
+                                          SchematicSymbol, Wire)
+
+# Coordinates are compared after rounding to this many decimal places
+PRECISION = 4
+
+_LABEL_KINDS = (
+    ("labels", "local"),
+    ("global_labels", "global"),
+    ("hierarchical_labels", "hierarchical"),
+)
+
+
+class PlacedPin(NamedTuple):
+    """A pin of a placed symbol at its position on the schematic"""
+
+    symbol: "SchematicSymbol"
+    number: str
+    x: float
+    y: float
+
+
+class SchematicNet:
+    """The items of a schematic that are connected together"""
+
+    def __init__(self):
+        self.wires: List["Wire"] = []
+        self.junctions: List["Junction"] = []
+        self.labels: List["Label"] = []
+        self.global_labels: List["Label"] = []
+        self.hierarchical_labels: List["Label"] = []
+        self.pins: List[PlacedPin] = []
+
+    def __repr__(self) -> str:
+        names = sorted({label.name for label in self.all_labels()})
+        return (
+            f"SchematicNet(labels={names}, pins={len(self.pins)}, "
+            f"wires={len(self.wires)})"
+        )
+
+    def all_labels(self) -> Iterator["Label"]:
+        """Iterate over the global, hierarchical and then local labels"""
+        yield from self.global_labels
+        yield from self.hierarchical_labels
+        yield from self.labels
+
+
+class _DisjointSet:
+    """Union-find over hashable keys with path halving and union by size"""
+
+    def __init__(self):
+        self._ids: Dict[Hashable, int] = {}
+        self._parent: List[int] = []
+        self._size: List[int] = []
+
+    def add(self, key: Hashable) -> int:
+        node = self._ids.get(key)
+        if node is None:
+            node = self._ids[key] = len(self._parent)
+            self._parent.append(node)
+            self._size.append(1)
+        return node
+
+    def find(self, node: int) -> int:
+        parent = self._parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, a: int, b: int):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self._size[a] < self._size[b]:
+            a, b = b, a
+        self._parent[b] = a
+        self._size[a] += self._size[b]
+
+
+def _point(x: float, y: float) -> Tuple[str, float, float]:
+    return "point", round(x, PRECISION), round(y, PRECISION)
+
+
+def _cos_sin(angle: float) -> Tuple[float, float]:
+    if angle % 90 == 0:
+        # Exact values for right angles, which are by far the most common
+        return [(1, 0), (0, 1), (-1, 0), (0, -1)][int(angle // 90) % 4]
+    radians = math.radians(angle)
+    return math.cos(radians), math.sin(radians)
+
+
+def _unit_number(unit_name: str) -> int:
+    # Library units are named "<symbol>_<unit>_<body style>", 0 for all units
+    return int(unit_name.rsplit("_", 2)[-2])
+
+
+def iter_placed_pins(schematic: "Schematic") -> Iterator[PlacedPin]:
+    """Iterate over the pins of the placed symbols at their positions
+
+    Pins are taken from the library symbol with the same lib_id, limited to
+    the unit of the placed symbol, then rotated, mirrored and moved to the
+    position of the placed symbol.
+    """
+    lib_pins: Dict[str, List[Tuple[int, str, float, float]]] = {}
+    for lib_symbol in schematic.lib_symbols or []:
+        lib_pins[lib_symbol.library] = [
+            (_unit_number(unit.name), pin.number, pin.at.x, pin.at.y)
+            for unit in lib_symbol.symbols
+            for pin in unit.pins
+        ]
+    for symbol in schematic.symbols or []:
+        at = symbol.at
+        cos, sin = _cos_sin(at.angle)
+        for unit, number, x, y in lib_pins.get(symbol.lib_id, []):
+            if unit and symbol.unit and unit != symbol.unit:
+                continue
+            # Library symbols are drawn with y pointing up
+            y = -y
+            x, y = x * cos + y * sin, y * cos - x * sin
+            if symbol.mirror == "x":
+                y = -y
+            elif symbol.mirror == "y":
+                x = -x
+            yield PlacedPin(symbol, number, at.x + x, at.y + y)
+
+
+def _join_points_on_segments(
+    nodes: _DisjointSet,
+    points: List[Tuple[float, float, int]],
+    segments: List[Tuple[float, float, float, float, int]],
+):
+    """Join every point that lies on a segment with the node of the segment
+
+    Nearly all wires are horizontal or vertical, so the points are sorted by
+    row and by column and found by bisection. Other wires search an index of
+    the points around them.
+    """
+    rows: Dict[float, List[Tuple[float, int]]] = {}
+    columns: Dict[float, List[Tuple[float, int]]] = {}
+    for x, y, node in points:
+        rows.setdefault(round(y, PRECISION), []).append((x, node))
+        columns.setdefault(round(x, PRECISION), []).append((y, node))
+    for line in (*rows.values(), *columns.values()):
+        line.sort()
+
+    tolerance = 0.5 * 10**-PRECISION
+    diagonal: Optional[SpatialIndex] = None
+    for x1, y1, x2, y2, segment in segments:
+        if round(y1, PRECISION) == round(y2, PRECISION):
+            line, low, high = rows.get(round(y1, PRECISION)), x1, x2
+        elif round(x1, PRECISION) == round(x2, PRECISION):
+            line, low, high = columns.get(round(x1, PRECISION)), y1, y2
+        else:
+            if diagonal is None:
+                diagonal = SpatialIndex()
+                for point in points:
+                    diagonal.add(point, [point[:2] * 2])
+            box = (
+                min(x1, x2) - tolerance,
+                min(y1, y2) - tolerance,
+                max(x1, x2) + tolerance,
+                max(y1, y2) + tolerance,
+            )
+            for x, y, node in diagonal.in_rect(*box):
+                if _point_segment_distance(x, y, (x1, y1, x2, y2)) <= tolerance:
+                    nodes.union(segment, node)
+            continue
+        if line is None:
+            continue
+        low, high = min(low, high) - tolerance, max(low, high) + tolerance
+        for i in range(bisect.bisect_left(line, (low,)), len(line)):
+            position, node = line[i]
+            if position > high:
+                break
+            nodes.union(segment, node)
+
+
+def compute_nets(schematic: "Schematic") -> List[SchematicNet]:
+    """Group the items of a schematic into the nets they form
+
+    Every item is in exactly one net, so unconnected pins and wires form
+    nets of their own. Nets are ordered by their first item, taking wires,
+    junctions, labels and then pins.
+    """
+    nodes = _DisjointSet()
+    # Each item is stored with the attribute of SchematicNet it belongs in
+    items: List[Tuple[str, object, int]] = []
+    # Positions where items can land on the middle of a wire
+    points: List[Tuple[float, float, int]] = []
+    segments: List[Tuple[float, float, float, float, int]] = []
+
+    for wire in schematic.wires or []:
+        if not wire.points:
+            continue
+        ends = [nodes.add(_point(p.x, p.y)) for p in wire.points]
+        for a, b in zip(ends, ends[1:]):
+            nodes.union(a, b)
+        for p, node in zip(wire.points, ends):
+            points.append((p.x, p.y, node))
+        for a, b in zip(wire.points, wire.points[1:]):
+            segments.append((a.x, a.y, b.x, b.y, ends[0]))
+        items.append(("wires", wire, ends[0]))
+
+    for junction in schematic.junctions or []:
+        node = nodes.add(_point(junction.at.x, junction.at.y))
+        points.append((junction.at.x, junction.at.y, node))
+        items.append(("junctions", junction, node))
+
+    for field, kind in _LABEL_KINDS:
+        for label in getattr(schematic, field):
+            node = nodes.add(_point(label.at.x, label.at.y))
+            nodes.union(node, nodes.add((kind, label.name)))
+            points.append((label.at.x, label.at.y, node))
+            items.append((field, label, node))
+
+    for pin in iter_placed_pins(schematic):
+        node = nodes.add(_point(pin.x, pin.y))
+        if pin.symbol.lib_id.startswith("power:") and pin.symbol.value:
+            nodes.union(node, nodes.add(("global", pin.symbol.value)))
+        points.append((pin.x, pin.y, node))
+        items.append(("pins", pin, node))
+
+    _join_points_on_segments(nodes, points, segments)
+
+    nets: Dict[int, SchematicNet] = {}
+    for field, item, node in items:
+        root = nodes.find(node)
+        net = nets.get(root)
+        if net is None:
+            net = nets[root] = SchematicNet()
+        getattr(net, field).append(item)
+    return list(nets.values())
@@ -0,0 +1,80 @@
+"""Sharing identical text effects and strokes between the items of a file
+
+Almost every property, pin and label of a schematic has the same text
+effects, and most wires and graphics have the same stroke. A LeafPool swaps
+the effects and stroke values of parsed data for frozen models, built once
+for each distinct value, so that equal values become a single object.
+
+Frozen models reject assignment, which keeps the sharing safe. To change the
+effects of one item, assign it a new model, for example
+`prop.effects = prop.effects.model_copy(update={"hide": True})`.
+"""
+
+from typing import Any, Dict, Hashable, Tuple, Type
+
+from pydantic import BaseModel
+
+from pykicad.models.schematic import FrozenEffects, FrozenStroke
+from pykicad.models.trusted import construct
+
+# Parsed keys whose values are shared, and the models they become
+_SHARED: Dict[str, Type[BaseModel]] = {
+    "effects": FrozenEffects,
+    "stroke": FrozenStroke,
+}
+
+
+def _key(value: Any) -> Hashable:
+    # Parsed values as nested tuples, which equal values map to
+    if isinstance(value, dict):
+        return tuple((name, _key(item)) for name, item in value.items())
+    if isinstance(value, list):
+        return tuple(_key(item) for item in value)
+    return value
+
+
+class LeafPool:
+    """Frozen effects and strokes built so far, one per distinct value
+
+    One pool is used for each load, so that its models are shared within
+    the file but not kept once the file is discarded. With `trusted`, the
+    models are built without being validated.
+    """
+
+    def __init__(self, trusted: bool = False):
+        self.trusted = trusted
+        self.models: Dict[Tuple[Type[BaseModel], Hashable], BaseModel] = {}
+
+    def get(self, model: Type[BaseModel], value: Any) -> BaseModel:
+        """Return the shared model for a parsed value, building it if needed"""
+        key = (model, _key(value))
+        shared = self.models.get(key)
+        if shared is None:
+            if self.trusted:
+                shared = construct(model, value)
+            else:
+                shared = model.model_validate(value)
+            self.models[key] = shared
+        return shared
+
+    def share(self, data: Any) -> Any:
+        """Replace the effects and strokes in parsed data, in place
+
+        The models of the data are then built around the shared instances,
+        since models given as field values are kept as they are.
+        """
+        stack = [data]
+        while stack:
+            items = stack.pop()
+            if type(items) is dict:
+                for name, value in items.items():
+                    model = _SHARED.get(name)
+                    if model is not None and type(value) is dict:
+                        items[name] = self.get(model, value)
+                    elif type(value) is dict or type(value) is list:
+                        stack.append(value)
+            elif type(items) is list:
+                for value in items:
+                    if type(value) is dict or type(value) is list:
+                        stack.append(value)
+        return data
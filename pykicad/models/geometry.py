@@ -0,0 +1,161 @@
+"""Columnar NumPy view of the geometry of a schematic
+
+Coordinates are in schematic units (millimetres) with y pointing down, as in
+the file. Angles are in degrees, counter-clockwise as seen on screen.
+"""
+
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+
+from pykicad.models.connectivity import iter_placed_pins
+
+if TYPE_CHECKING:
+    from pykicad.models.schematic import Schematic
+
+# Names of the arrays that hold coordinates, as flat (x, y, x, y, ...) rows
+_COORDINATES = ("wire_segments", "junctions", "polyline_segments", "pins")
+
+
+def _segments(points_lists: List[List[Tuple[float, float]]]) -> np.ndarray:
+    rows = [
+        (a[0], a[1], b[0], b[1])
+        for points in points_lists
+        for a, b in zip(points, points[1:])
+    ]
+    return np.array(rows, dtype=float).reshape(-1, 4)
+
+
+def _cos_sin(angle: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    radians = np.radians(angle)
+    cos, sin = np.cos(radians), np.sin(radians)
+    # Keep right angles exact, which are by far the most common
+    right = np.remainder(angle, 90) == 0
+    return np.where(right, np.round(cos), cos), np.where(right, np.round(sin), sin)
+
+
+def _rotate(xy: np.ndarray, angle, origin=(0.0, 0.0)) -> np.ndarray:
+    """Rotate rows of (x, y) pairs counter-clockwise on screen about origin"""
+    cos, sin = _cos_sin(np.asarray(angle, dtype=float))
+    pairs = xy.reshape(-1, 2) - origin
+    x, y = pairs[:, 0], pairs[:, 1]
+    rotated = np.stack([x * cos + y * sin, y * cos - x * sin], axis=1) + origin
+    return rotated.reshape(xy.shape)
+
+
+def _pins(schematic: "Schematic") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    pins = list(iter_placed_pins(schematic))
+    return (
+        np.array([(pin.x, pin.y) for pin in pins], dtype=float).reshape(-1, 2),
+        np.array([pin.symbol.uuid for pin in pins], dtype=object),
+        np.array([pin.number for pin in pins], dtype=object),
+    )
+
+
+class Geometry:
+    """Coordinates of the items of a schematic as NumPy arrays
+
+    - `wire_segments` and `polyline_segments` are (N, 4) arrays of x1, y1,
+      x2, y2 rows, one per straight segment
+    - `junctions` and `pins` are (N, 2) arrays of x, y rows, where pins are
+      the connection points of the placed symbols
+    Each has a parallel array of the UUID of the item it came from, and the
+    pins also have `pin_numbers`.
+
+    The arrays are not linked back to the models, and the operations return
+    a new Geometry rather than changing this one.
+    """
+
+    def __init__(
+        self,
+        wire_segments: np.ndarray,
+        wire_uuids: np.ndarray,
+        junctions: np.ndarray,
+        junction_uuids: np.ndarray,
+        polyline_segments: np.ndarray,
+        polyline_uuids: np.ndarray,
+        pins: np.ndarray,
+        pin_symbol_uuids: np.ndarray,
+        pin_numbers: np.ndarray,
+    ):
+        self.wire_segments = wire_segments
+        self.wire_uuids = wire_uuids
+        self.junctions = junctions
+        self.junction_uuids = junction_uuids
+        self.polyline_segments = polyline_segments
+        self.polyline_uuids = polyline_uuids
+        self.pins = pins
+        self.pin_symbol_uuids = pin_symbol_uuids
+        self.pin_numbers = pin_numbers
+
+    @classmethod
+    def from_schematic(cls, schematic: "Schematic") -> "Geometry":
+        """Collect the geometry of a schematic in one pass over its items"""
+        wires = schematic.wires or []
+        wire_points = [[(p.x, p.y) for p in wire.points] for wire in wires]
+        polylines = schematic.polyline or []
+        polyline_points = [[(p.x, p.y) for p in x.points] for x in polylines]
+        junctions = schematic.junctions or []
+        pins, pin_symbol_uuids, pin_numbers = _pins(schematic)
+        return cls(
+            wire_segments=_segments(wire_points),
+            wire_uuids=np.array(
+                [w.uuid for w, p in zip(wires, wire_points) for _ in p[1:]],
+                dtype=object,
+            ),
+            junctions=np.array(
+                [(j.at.x, j.at.y) for j in junctions], dtype=float
+            ).reshape(-1, 2),
+            junction_uuids=np.array([j.uuid for j in junctions], dtype=object),
+            polyline_segments=_segments(polyline_points),
+            polyline_uuids=np.array(
+                [x.uuid for x, p in zip(polylines, polyline_points) for _ in p[1:]],
+                dtype=object,
+            ),
+            pins=pins,
+            pin_symbol_uuids=pin_symbol_uuids,
+            pin_numbers=pin_numbers,
+        )
+
+    def _replace(self, **coordinates: np.ndarray) -> "Geometry":
+        values = dict(vars(self))
+        values.update(coordinates)
+        return Geometry(**values)
+
+    def _map(self, func) -> "Geometry":
+        return self._replace(
+            **{name: func(getattr(self, name)) for name in _COORDINATES}
+        )
+
+    def points(self) -> np.ndarray:
+        """Return every coordinate as one (N, 2) array of x, y rows"""
+        return np.concatenate(
+            [getattr(self, name).reshape(-1, 2) for name in _COORDINATES]
+        )
+
+    def bounding_box(self) -> Optional[np.ndarray]:
+        """Return min x, min y, max x, max y of every item, or None if empty"""
+        points = self.points()
+        if not len(points):
+            return None
+        return np.concatenate([points.min(axis=0), points.max(axis=0)])
+
+    def translate(self, dx: float, dy: float) -> "Geometry":
+        """Move every item by dx, dy"""
+        return self._map(lambda xy: xy + np.tile((dx, dy), xy.shape[1] // 2))
+
+    def rotate(
+        self, angle: float, origin: Tuple[float, float] = (0.0, 0.0)
+    ) -> "Geometry":
+        """Rotate every item counter-clockwise on screen by angle about origin"""
+        return self._map(lambda xy: _rotate(xy, angle, origin))
+
+    def snap(self, grid: float = 1.27) -> "Geometry":
+        """Move every coordinate to the nearest multiple of grid"""
+        return self._map(lambda xy: np.round(xy / grid) * grid)
+
+    def off_grid(self, grid: float = 1.27, tolerance: float = 1e-6) -> np.ndarray:
+        """Return the points that are not on a multiple of grid"""
+        points = self.points()
+        error = np.abs(points - np.round(points / grid) * grid)
+        return points[(error > tolerance).any(axis=1)]
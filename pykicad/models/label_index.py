@@ -0,0 +1,75 @@
+"""Labels that join nets across the sheets of a design
+
+Global labels with the same name are on one net throughout a design. The
+hierarchical labels of a sheet instance are on the net of the pin with the
+same name on the sheet item that placed it. A LabelIndex holds the labels
+and sheet pins of each such net, added and removed one sheet instance at a
+time so that reloading a file only redoes the instances of that file.
+"""
+
+from typing import (TYPE_CHECKING, Dict, List, NamedTuple, Optional, Set,
+                    Tuple, Union)
+
+if TYPE_CHECKING:
+    from pykicad.models.schematic import Label, Schematic, SheetPin
+
+# The path of the sheet instance for hierarchical nets, None for global ones,
+# and the name of the net
+NetKey = Tuple[Optional[str], str]
+
+
+class LabelRef(NamedTuple):
+    """A label or sheet pin, with the path of the sheet instance holding it"""
+
+    path: str
+    item: Union["Label", "SheetPin"]
+
+
+class LabelIndex:
+    """The global and hierarchical label nets of a design
+
+    Instances are given by their instance path, see
+    pykicad.parser.design.SheetInstance. A sheet pin is on the hierarchical
+    net of the instance its sheet places, whose path is that of the instance
+    holding the sheet followed by the UUID of the sheet.
+    """
+
+    def __init__(self):
+        self.nets: Dict[NetKey, List[LabelRef]] = {}
+        # The nets each instance has items on, to remove them again
+        self._keys: Dict[str, Set[NetKey]] = {}
+
+    def _append(self, path: str, key: NetKey, item: Union["Label", "SheetPin"]):
+        self.nets.setdefault(key, []).append(LabelRef(path, item))
+        self._keys[path].add(key)
+
+    def add(self, path: str, schematic: "Schematic"):
+        """Add the labels and sheet pins of a sheet instance"""
+        if path in self._keys:
+            self.remove(path)
+        self._keys[path] = set()
+        for label in schematic.global_labels:
+            self._append(path, (None, label.name), label)
+        for label in schematic.hierarchical_labels:
+            self._append(path, (path, label.name), label)
+        for sheet in schematic.sheets:
+            for pin in sheet.pins:
+                self._append(path, (f"{path}/{sheet.uuid}", pin.name), pin)
+
+    def remove(self, path: str):
+        """Remove the labels and sheet pins of a sheet instance"""
+        for key in self._keys.pop(path, ()):
+            items = [ref for ref in self.nets[key] if ref.path != path]
+            if items:
+                self.nets[key] = items
+            else:
+                del self.nets[key]
+
+    def net(self, name: str, path: Optional[str] = None) -> List[LabelRef]:
+        """Return the labels and sheet pins on a net
+
+        Without `path`, this is the global net with that name. With it, it
+        is the hierarchical net of the instance with that path: its
+        hierarchical labels and the pin of the sheet placing it.
+        """
+        return list(self.nets.get((path, name), ()))
@@ -0,0 +1,90 @@
+"""Schematic whose sections are parsed on first use
+
+The loader of a LazySchematic is given a field name and returns the value of
+that field, parsed and validated from the text of the file, along with
+whether the file set it. Each field is loaded once, when it is first read,
+and then kept like any other field.
+"""
+
+from typing import Any, Callable, Optional, Tuple
+
+from pydantic import PrivateAttr
+
+from pykicad.models.schematic import Schematic
+
+_Loader = Callable[[str], Tuple[Any, bool]]
+
+
+class LazySchematic(Schematic):
+    """A Schematic that loads its sections when they are first read
+
+    Anything that needs every field, such as comparing, copying, pickling
+    or dumping the schematic, loads the remaining fields first.
+    """
+
+    _loader: Optional[_Loader] = PrivateAttr(default=None)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in type(self).model_fields and self.__pydantic_private__:
+            loader = self.__pydantic_private__.get("_loader")
+            if loader is not None:
+                value, is_set = loader(name)
+                self.__dict__[name] = value
+                if is_set:
+                    self.__pydantic_fields_set__.add(name)
+                if not self.unloaded_fields:
+                    # Let go of the text of the file
+                    self.__pydantic_private__["_loader"] = None
+                return value
+        return super().__getattr__(name)
+
+    @property
+    def unloaded_fields(self) -> Tuple[str, ...]:
+        """The fields that have not been loaded yet"""
+        fields = type(self).model_fields
+        return tuple(name for name in fields if name not in self.__dict__)
+
+    def load_all(self) -> "LazySchematic":
+        """Load every field that has not been loaded yet"""
+        for name in self.unloaded_fields:
+            getattr(self, name)
+        return self
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Schematic):
+            return NotImplemented
+        # Equal to an eager Schematic with the same fields
+        fields = type(self).model_fields
+        return all(getattr(self, name) == getattr(other, name) for name in fields)
+
+    def __iter__(self):
+        self.load_all()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self.load_all()
+        return super().__repr_args__()
+
+    def __copy__(self):
+        self.load_all()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo=None):
+        self.load_all()
+        return super().__deepcopy__(memo)
+
+    def __reduce__(self):
+        self.load_all()
+        return super().__reduce__()
+
+    def model_copy(self, *args, **kwargs):
+        self.load_all()
+        return super().model_copy(*args, **kwargs)
+
+    def model_dump(self, *args, **kwargs):
+        self.load_all()
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args, **kwargs):
+        self.load_all()
+        return super().model_dump_json(*args, **kwargs)
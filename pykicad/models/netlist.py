@@ -1,7 +1,11 @@
-from typing import Annotated, Dict, List, Optional
+from functools import cached_property
+from typing import Annotated, Any, Callable, Dict, List, Optional, Union
 
 from pydantic import BaseModel, BeforeValidator, Field, model_validator
 
+from pykicad.models.compact import from_compact, to_compact
+from pykicad.models.netlist_index import NetlistIndex
+
 
 def _get_fields(data: dict) -> Dict[str, str]:
     cleaned = {}
@@ -16,7 +20,35 @@ def _get_properties(data: dict) -> Dict[str, str]:
     return {p["name"]: p["value"] for p in data}
 
 
+def _get_items(name: str) -> Callable[[Any], List[Any]]:
+    # The parser pluralises the key of repeated items, so a container holds
+    # either a list under the plural name or a single item under the name
+    plural = name + "s"
+
+    def get_items(data: Any) -> List[Any]:
+        if not isinstance(data, dict):
+            return data
+        if plural in data:
+            return data[plural]
+        if name in data:
+            return [data[name]]
+        return []
+
+    return get_items
+
+
+def _get_library(data: dict) -> dict:
+    if not isinstance(data, dict):
+        return data
+    if "library" in data:
+        return data["library"]
+    # Only the first of several libraries is kept
+    return data["libraries"][0]
+
+
 def _get_footprints(data: dict) -> List[str]:
+    if isinstance(data, list):
+        return data
     if "fp" in data:
         return [data["fp"]]
     elif "fps" in data:
@@ -37,6 +69,13 @@ class TitleBlock(BaseModel):
     source: Optional[str] = None
     comments: List[Comment] = []
 
+    @model_validator(mode="before")
+    @classmethod
+    def convert_single_comment(cls, data):
+        if isinstance(data, dict) and "comment" in data:
+            data["comments"] = [data.pop("comment")]
+        return data
+
 
 class Sheet(BaseModel):
     number: str
@@ -86,8 +125,8 @@ class LibPart(BaseModel):
     description: str
     docs: Optional[str] = None
     footprints: Annotated[List[str], BeforeValidator(_get_footprints)] = []
-    fields: Annotated[Dict[str, str], BeforeValidator(_get_fields)] = []
-    pins: Annotated[List[Pin], BeforeValidator(lambda x: x["pins"])] = []
+    fields: Annotated[Dict[str, str], BeforeValidator(_get_fields)] = {}
+    pins: Annotated[List[Pin], BeforeValidator(_get_items("pin"))] = []
 
 
 class Library(BaseModel):
@@ -113,13 +152,63 @@ class Net(BaseModel):
     def convert_class_field(cls, data):
         if isinstance(data, dict) and "class" in data:
             data["class_name"] = data.pop("class")
+        if isinstance(data, dict) and "node" in data:
+            data["nodes"] = [data.pop("node")]
         return data
 
 
 class Netlist(BaseModel):
+    """A KiCad netlist
+
+    The lookups, such as component_by_ref and net_of_pin, use tables built
+    on first use. They are built again after the components or nets lists
+    are replaced, or after items are added to or removed from them or from
+    the nodes of a net. They are not built again after the attributes of an
+    item change, such as the refdes of a component or the name of a net,
+    or after the nodes list of a net is replaced.
+
+    To notice those changes, the first lookup swaps the components, nets
+    and nodes lists for list subclasses that count their changes, so these
+    fields are no longer the list objects the netlist was built with.
+    """
+
     design: Design
-    components: Annotated[List[Component], BeforeValidator(lambda x: x["comps"])] = []
-    libparts: Annotated[List[LibPart], BeforeValidator(lambda x: x["libparts"])] = []
-    libraries: Annotated[Library, BeforeValidator(lambda x: x["library"])]
-    nets: Annotated[List[Net], BeforeValidator(lambda x: x["nets"])]
+    components: Annotated[List[Component], BeforeValidator(_get_items("comp"))] = []
+    libparts: Annotated[List[LibPart], BeforeValidator(_get_items("libpart"))] = []
+    libraries: Annotated[Optional[Library], BeforeValidator(_get_library)] = None
+    nets: Annotated[List[Net], BeforeValidator(_get_items("net"))] = []
     version: str
+
+    @cached_property
+    def _index(self) -> NetlistIndex:
+        return NetlistIndex(self)
+
+    def _current_index(self) -> NetlistIndex:
+        index = self._index
+        if not index.is_current(self):
+            index = self.__dict__["_index"] = NetlistIndex(self)
+        return index
+
+    def component_by_ref(self, ref: str) -> Optional[Component]:
+        """Return the component with a reference designator, or None"""
+        return self._current_index().components.get(ref)
+
+    def net_by_name(self, name: str) -> Optional[Net]:
+        """Return the net with a name, or None"""
+        return self._current_index().nets_by_name.get(name)
+
+    def net_by_code(self, code: Union[str, int]) -> Optional[Net]:
+        """Return the net with a code, or None"""
+        return self._current_index().nets_by_code.get(str(code))
+
+    def net_of_pin(self, ref: str, pin: str) -> Optional[Net]:
+        """Return the net a pin of a component is on, or None"""
+        return self._current_index().pins.get((ref, pin))
+
+    def nets_of_component(self, ref: str) -> List[Net]:
+        """Return the nets the pins of a component are on, in netlist order"""
+        return list(self._current_index().component_nets.get(ref, []))
+
+    def __reduce__(self):
+        # Pickle as plain tuples, which is smaller and faster to load
+        return from_compact, (type(self), to_compact(self))
@@ -0,0 +1,107 @@
+"""Lookup tables over the components and nets of a netlist
+
+The tables are built on first use. The component, net and node lists they
+are built from are swapped for lists that count the changes made to them,
+so that after such a change, or after a list is replaced, the next lookup
+rebuilds the tables.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+
+if TYPE_CHECKING:
+    from pykicad.models.netlist import Component, Net, Netlist
+
+
+class _Changes:
+    """Counter shared by the lists of one index"""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+
+class _TrackedList(list):
+    """List that counts the changes made to it"""
+
+    def __init__(self, items: Iterable[Any], changes: _Changes):
+        super().__init__(items)
+        self.changes = changes
+
+
+def _tracking(name: str):
+    method = getattr(list, name)
+
+    def tracked(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.changes.count += 1
+        return result
+
+    tracked.__name__ = name
+    return tracked
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "clear",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(_TrackedList, _name, _tracking(_name))
+
+
+def _track(model: Any, field: str, changes: _Changes) -> _TrackedList:
+    # Set through __dict__ so that the field is not validated again
+    items = _TrackedList(getattr(model, field), changes)
+    model.__dict__[field] = items
+    return items
+
+
+class NetlistIndex:
+    """Components by reference and nets by name, code and pin
+
+    Where several components or nets share a key, the first one is kept.
+    """
+
+    def __init__(self, netlist: "Netlist"):
+        self.changes = _Changes()
+        self.components_list = _track(netlist, "components", self.changes)
+        self.nets_list = _track(netlist, "nets", self.changes)
+
+        self.components: Dict[str, "Component"] = {}
+        for component in self.components_list:
+            self.components.setdefault(component.refdes, component)
+
+        self.nets_by_name: Dict[str, "Net"] = {}
+        self.nets_by_code: Dict[str, "Net"] = {}
+        self.pins: Dict[Tuple[str, str], "Net"] = {}
+        self.component_nets: Dict[str, List["Net"]] = {}
+        for net in self.nets_list:
+            self.nets_by_name.setdefault(net.name, net)
+            self.nets_by_code.setdefault(net.code, net)
+            refs = {}
+            for node in _track(net, "nodes", self.changes):
+                self.pins.setdefault((node.ref, node.pin), net)
+                refs[node.ref] = None
+            for ref in refs:
+                self.component_nets.setdefault(ref, []).append(net)
+        self.count = self.changes.count
+
+    def is_current(self, netlist: "Netlist") -> bool:
+        """Return whether the netlist is unchanged since it was indexed
+
+        Replacing the nodes list of a net is not noticed, but changing it is.
+        """
+        return (
+            netlist.components is self.components_list
+            and netlist.nets is self.nets_list
+            and self.changes.count == self.count
+        )
@@ -1,7 +1,18 @@
 from enum import Enum
-from typing import Annotated, Any, Dict, List, Optional, Union
+from typing import (TYPE_CHECKING, Annotated, Any, ClassVar, Dict, List,
+                    NamedTuple, Optional, Tuple, Union)
 
-from pydantic import BaseModel, BeforeValidator, Field, model_validator
+from pydantic import (BaseModel, BeforeValidator, Field,
+                      SerializerFunctionWrapHandler, model_serializer,
+                      model_validator)
+
+from pykicad.models.compact import from_compact, to_compact
+from pykicad.models.schematic_netlist import schematic_to_netlist
+from pykicad.models.spatial import SpatialIndex
+
+if TYPE_CHECKING:
+    from pykicad.models.geometry import Geometry
+    from pykicad.models.netlist import Netlist
 
 ColorType = tuple[int, int, int, int]
 
@@ -31,11 +42,20 @@ def _correct_dict(symbol: Dict[str, Dict[str, str]]) -> Dict[str, str]:
 
 
 class BaseListModel(BaseModel):
+    # Field names in declaration order, which is the order of the list items
+    positional_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.positional_fields = tuple(cls.model_fields)
+
     @model_validator(mode="before")
     @classmethod
     def convert(cls, data: list) -> Any:
-        var_names = cls.model_json_schema()["properties"].keys()
-        return dict(zip(var_names, data))
+        if isinstance(data, dict):
+            return data
+        return dict(zip(cls.positional_fields, data))
 
 
 class NamedModel(BaseModel):
@@ -94,11 +114,21 @@ class Effects(BaseModel):
     hide: bool = False
 
 
+def _serialize_point(self: Any, handler: SerializerFunctionWrapHandler) -> Any:
+    # Fields loaded with `point_tuples` hold a PointTuple or PositionTuple,
+    # which is written like the model it stands for
+    if isinstance(self, tuple):
+        return self._asdict()
+    return handler(self)
+
+
 class Position(BaseListModel):
     x: float
     y: float
     angle: float
 
+    _serialize = model_serializer(mode="wrap")(_serialize_point)
+
 
 class Point(BaseModel):
     x: float
@@ -109,6 +139,57 @@ class Point(BaseModel):
     def convert(cls, data: Any) -> Any:
         return {"x": data[0], "y": data[1]}
 
+    _serialize = model_serializer(mode="wrap")(_serialize_point)
+
+
+def _equal_to_model(self: tuple, other: Any) -> Any:
+    # Point and position tuples are also equal to the model they stand for
+    if isinstance(other, BaseModel):
+        if not isinstance(other, self.model):
+            return False
+        other = tuple(other.__dict__[name] for name in self._fields)
+    return tuple.__eq__(self, other)
+
+
+def _not_equal_to_model(self: tuple, other: Any) -> Any:
+    equal = _equal_to_model(self, other)
+    return equal if equal is NotImplemented else not equal
+
+
+class PointTuple(NamedTuple):
+    """A Point as a plain tuple, for loading with `point_tuples`"""
+
+    x: float
+    y: float
+
+    model = Point
+    __eq__ = _equal_to_model
+    __ne__ = _not_equal_to_model
+    __hash__ = tuple.__hash__
+
+    @classmethod
+    def from_data(cls, data: Any) -> "PointTuple":
+        """Build from parsed data, the same as Point.model_validate"""
+        return cls(float(data[0]), float(data[1]))
+
+
+class PositionTuple(NamedTuple):
+    """A Position as a plain tuple, for loading with `point_tuples`"""
+
+    x: float
+    y: float
+    angle: float
+
+    model = Position
+    __eq__ = _equal_to_model
+    __ne__ = _not_equal_to_model
+    __hash__ = tuple.__hash__
+
+    @classmethod
+    def from_data(cls, data: Any) -> "PositionTuple":
+        """Build from parsed data, the same as Position.model_validate"""
+        return cls(float(data[0]), float(data[1]), float(data[2]))
+
 
 class Points(BaseModel):
     points: List[Point]
@@ -119,6 +200,37 @@ class Stroke(BaseModel):
     type: str
 
 
+class _Frozen:
+    # Base of the frozen copies of leaf models, of which one instance stands
+    # for every equal value in a file, see pykicad.models.flyweight. They are
+    # equal to the plain model they copy, which is their second base.
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, type(self).__bases__[1]):
+            return self.__dict__ == other.__dict__
+        return NotImplemented
+
+
+class FrozenFontSize(_Frozen, FontSize, frozen=True):
+    pass
+
+
+class FrozenFont(_Frozen, Font, frozen=True):
+    size: FrozenFontSize
+
+
+class FrozenJustify(_Frozen, Justify, frozen=True):
+    pass
+
+
+class FrozenEffects(_Frozen, Effects, frozen=True):
+    font: Optional[FrozenFont] = None
+    justify: Optional[FrozenJustify] = None
+
+
+class FrozenStroke(_Frozen, Stroke, frozen=True):
+    pass
+
+
 class Fill(BaseModel):
     type: FillType
 
@@ -205,7 +317,8 @@ class Text(BaseModel):
 
 class SchematicSymbol(BaseModel):
     lib_id: str
-    at: Point
+    at: Position
+    mirror: Optional[str] = None
     unit: Optional[int] = None
     value: Optional[str] = None
     footprint: Optional[str] = None
@@ -230,6 +343,69 @@ class Label(NamedModel):
     uuid: Optional[str] = None
 
 
+class SheetPin(NamedModel):
+    name: str
+    type: str = Field(alias="_required")
+    at: Position
+    effects: Optional[Effects] = None
+    uuid: Optional[str] = None
+
+
+class Sheet(BaseModel):
+    at: Point
+    size: Tuple[float, float]
+    uuid: Optional[str] = None
+    properties: List[Annotated[Property, BeforeValidator(_get_property)]] = []
+    pins: List[SheetPin] = []
+
+    @model_validator(mode="before")
+    @classmethod
+    def convert(cls, data: Any) -> Any:
+        # A lone pin is found under its own name, with its name and type
+        # left as a list rather than split off as for repeated pins
+        if isinstance(data, dict) and "pin" in data:
+            data = dict(data)
+            pin = dict(data.pop("pin"))
+            name, pin_type = pin.pop("_requireds")
+            data["pins"] = [{name: {"_required": pin_type, **pin}}]
+        return data
+
+    def _property(self, *names: str) -> Optional[str]:
+        for prop in self.properties:
+            if prop.name in names:
+                return prop.value
+        return None
+
+    @property
+    def name(self) -> Optional[str]:
+        """The name of the sheet, unique among the sheets of its parent"""
+        # KiCad 6 writes the property names with a space
+        return self._property("Sheetname", "Sheet name")
+
+    @property
+    def file(self) -> Optional[str]:
+        """The file of the schematic placed by the sheet, as written"""
+        return self._property("Sheetfile", "Sheet file")
+
+
+# The list fields the geometry and the spatial index are built from
+_GEOMETRY_SOURCES = ("wires", "polyline", "junctions", "symbols", "lib_symbols")
+_SPATIAL_SOURCES = (
+    "wires",
+    "junctions",
+    "labels",
+    "global_labels",
+    "hierarchical_labels",
+)
+
+
+class _Derived(NamedTuple):
+    # A value built from list fields of a schematic, with each list and its
+    # length at the time
+    sources: Tuple[Tuple[Any, int], ...]
+    value: Any
+
+
 class Schematic(BaseModel):
     version: int
     generator: str
@@ -248,4 +424,60 @@ class Schematic(BaseModel):
     global_labels: List[Label] = []
     hierarchical_labels: List[Label] = []
     labels: List[Label] = []
+    sheets: List[Sheet] = []
     sheet_instances: Optional[Any] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def convert(cls, data: Any) -> Any:
+        # Keys are only made plural when an item repeats, so a lone sheet
+        # is found under its own name
+        if isinstance(data, dict) and "sheet" in data:
+            data = dict(data)
+            data["sheets"] = [data.pop("sheet")]
+        return data
+
+    @property
+    def geometry(self) -> "Geometry":
+        """Coordinates of the wires, junctions, polylines and pins as arrays
+
+        Built on first use and requires numpy. Built again after the lists
+        of those items or of the symbols are replaced or change length, but
+        items changed in place are not noticed.
+        """
+        from pykicad.models.geometry import Geometry
+
+        return self._derived("_geometry", _GEOMETRY_SOURCES, Geometry.from_schematic)
+
+    def _derived(self, name: str, fields: Tuple[str, ...], build) -> Any:
+        # Kept in __dict__ like a cached property, and built again once one
+        # of the lists it was built from is replaced, as by model_copy, or
+        # has items added or removed
+        sources = tuple(
+            (items, len(items or ())) for items in (getattr(self, f) for f in fields)
+        )
+        derived = self.__dict__.get(name)
+        if derived is None or any(
+            items is not old or length != old_length
+            for (items, length), (old, old_length) in zip(sources, derived.sources)
+        ):
+            derived = self.__dict__[name] = _Derived(sources, build(self))
+        return derived.value
+
+    def spatial_index(self) -> SpatialIndex:
+        """Index of the wires, junctions and labels by position
+
+        Built on first use and again after those lists are replaced or
+        change length. Items changed in place are not noticed.
+        """
+        return self._derived(
+            "_spatial_index", _SPATIAL_SOURCES, SpatialIndex.from_schematic
+        )
+
+    def __reduce__(self):
+        # Pickle as plain tuples, which is smaller and faster to load
+        return from_compact, (type(self), to_compact(self))
+
+    def to_netlist(self, source: str = "") -> "Netlist":
+        """Build the netlist of this sheet from the connectivity of its items"""
+        return schematic_to_netlist(self, source=source)
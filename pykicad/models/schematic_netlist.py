@@ -0,0 +1,198 @@
+"""Building a Netlist from the connectivity of a schematic
+
+Follows what KiCad exports for a single sheet: power symbols and symbols
+whose reference starts with "#" are not components, nets are named after
+their labels or else after one of their pins, and nets without component
+pins are left out.
+"""
+
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from pykicad.models import netlist as kicad_netlist
+from pykicad.models.connectivity import PlacedPin, SchematicNet, compute_nets
+
+if TYPE_CHECKING:
+    from pykicad.models.schematic import LibrarySymbol, Schematic, SchematicSymbol
+
+
+def _natural_key(text: str) -> List[Union[int, str]]:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", text)]
+
+
+def _property(
+    item: Union["SchematicSymbol", "LibrarySymbol"], name: str
+) -> Optional[str]:
+    for prop in item.properties:
+        if prop.name == name:
+            return prop.value
+    return None
+
+
+def _is_power(symbol: "SchematicSymbol") -> bool:
+    return symbol.lib_id.startswith("power:")
+
+
+def _reference(symbol: "SchematicSymbol") -> Optional[str]:
+    """Return the reference of a symbol that is a component, else None"""
+    reference = _property(symbol, "Reference")
+    if not reference or reference.startswith("#") or _is_power(symbol):
+        return None
+    return reference
+
+
+def _net_name(net: SchematicNet, pins: List[Tuple[str, str]]) -> str:
+    if net.global_labels:
+        return min(label.name for label in net.global_labels)
+    power = [pin.symbol.value for pin in net.pins if _is_power(pin.symbol)]
+    if any(power):
+        return min(value for value in power if value)
+    local = net.labels or net.hierarchical_labels
+    if local:
+        return "/" + min(label.name for label in local)
+    reference, number = pins[0]
+    prefix = "Net" if len(pins) > 1 else "unconnected"
+    return f"{prefix}-({reference}-Pad{number})"
+
+
+def _title_block(schematic: "Schematic", source: str) -> kicad_netlist.TitleBlock:
+    title_block = schematic.title_block
+    if title_block is None:
+        return kicad_netlist.TitleBlock(source=source)
+    comments = [
+        kicad_netlist.Comment(number=str(number), value=str(value))
+        for number, value in title_block.comments or []
+    ]
+    return kicad_netlist.TitleBlock(
+        title=title_block.title,
+        company=title_block.company,
+        rev=title_block.rev,
+        date=title_block.date,
+        source=source,
+        comments=comments,
+    )
+
+
+def _libpart(lib_symbol: "LibrarySymbol") -> kicad_netlist.LibPart:
+    lib, _, part = lib_symbol.library.rpartition(":")
+    filters = _property(lib_symbol, "ki_fp_filters")
+    pins = {pin.number: pin for unit in lib_symbol.symbols for pin in unit.pins}
+    return kicad_netlist.LibPart(
+        lib=lib,
+        part=part,
+        description=_property(lib_symbol, "Description") or "",
+        docs=_property(lib_symbol, "Datasheet"),
+        footprints=filters.split() if filters else [],
+        pins=[
+            kicad_netlist.Pin(
+                num=number,
+                name="" if pins[number].name == "~" else pins[number].name,
+                type=pins[number].type.value,
+            )
+            for number in sorted(pins, key=_natural_key)
+        ],
+    )
+
+
+def schematic_to_netlist(
+    schematic: "Schematic", source: str = "", date: str = "", tool: str = "pykicad"
+) -> kicad_netlist.Netlist:
+    """Build the Netlist of a schematic from its connectivity
+
+    `source`, `date` and `tool` fill in the design section, which the
+    schematic itself does not record.
+    """
+    lib_symbols = {symbol.library: symbol for symbol in schematic.lib_symbols or []}
+    lib_pins = {
+        (library, pin.number): pin
+        for library, symbol in lib_symbols.items()
+        for unit in symbol.symbols
+        for pin in unit.pins
+    }
+
+    components: Dict[str, kicad_netlist.Component] = {}
+    for symbol in schematic.symbols or []:
+        reference = _reference(symbol)
+        if reference is None or reference in components:
+            # Further units of a symbol are the same component
+            continue
+        library = lib_symbols.get(symbol.lib_id)
+        lib, _, part = symbol.lib_id.rpartition(":")
+        description = _property(symbol, "Description")
+        if description is None and library is not None:
+            description = _property(library, "Description")
+        components[reference] = kicad_netlist.Component(
+            ref=reference,
+            value=_property(symbol, "Value") or symbol.value or "",
+            footprint=_property(symbol, "Footprint") or symbol.footprint,
+            datasheet=_property(symbol, "Datasheet"),
+            libsource=kicad_netlist.LibSource(
+                lib=lib, part=part, description=description or ""
+            ),
+            sheetpath=kicad_netlist.SheetPath(names="/", tstamps="/"),
+        )
+
+    named_nets = []
+    for net in compute_nets(schematic):
+        pins: List[Tuple[str, str, PlacedPin]] = []
+        for pin in net.pins:
+            reference = _reference(pin.symbol)
+            if reference is not None:
+                pins.append((reference, pin.number, pin))
+        if not pins:
+            continue
+        pins.sort(key=lambda entry: (_natural_key(entry[0]), _natural_key(entry[1])))
+        name = _net_name(net, [(reference, number) for reference, number, _ in pins])
+        named_nets.append((name, pins))
+    named_nets.sort(key=lambda entry: _natural_key(entry[0]))
+
+    nets = []
+    for code, (name, pins) in enumerate(named_nets, 1):
+        nodes = []
+        for reference, number, pin in pins:
+            lib_pin = lib_pins.get((pin.symbol.lib_id, number))
+            function = lib_pin.name if lib_pin is not None else None
+            nodes.append(
+                kicad_netlist.Node(
+                    ref=reference,
+                    pin=number,
+                    pinfunction=None if function in (None, "", "~") else function,
+                    pintype=lib_pin.type.value if lib_pin is not None else None,
+                )
+            )
+        nets.append(
+            kicad_netlist.Net(
+                code=str(code), name=name, class_name="Default", nodes=nodes
+            )
+        )
+
+    used = sorted(
+        {c.libsource.lib + ":" + c.libsource.part for c in components.values()}
+    )
+    libparts = [_libpart(lib_symbols[i]) for i in used if i in lib_symbols]
+    nicknames = sorted({lib_id.partition(":")[0] for lib_id in used})
+
+    return kicad_netlist.Netlist(
+        version="E",
+        design=kicad_netlist.Design(
+            source=source,
+            date=date,
+            tool=tool,
+            sheet=kicad_netlist.Sheet(
+                number="1",
+                name="/",
+                tstamps="/",
+                title_block=_title_block(schematic, source),
+            ),
+        ),
+        components=sorted(components.values(), key=lambda c: _natural_key(c.refdes)),
+        libparts=libparts,
+        libraries=(
+            # The Netlist model keeps a single library, and the schematic
+            # does not record where libraries are found
+            kicad_netlist.Library(logical=nicknames[0], uri="")
+            if nicknames
+            else None
+        ),
+        nets=nets,
+    )
@@ -0,0 +1,160 @@
+"""Uniform grid index over the positioned items of a schematic
+
+Wires are indexed as the segments between their points, and junctions and
+labels as their positions. Queries return the model objects themselves, in
+the order they were added and without duplicates.
+"""
+
+import math
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from pykicad.models.schematic import Schematic
+
+_Segment = Tuple[float, float, float, float]
+_Cell = Tuple[int, int]
+
+
+def _point_segment_distance(x: float, y: float, segment: _Segment) -> float:
+    x1, y1, x2, y2 = segment
+    dx, dy = x2 - x1, y2 - y1
+    length = dx * dx + dy * dy
+    if length:
+        t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length))
+        x1, y1 = x1 + t * dx, y1 + t * dy
+    return math.hypot(x - x1, y - y1)
+
+
+def _segment_in_rect(
+    segment: _Segment, x1: float, y1: float, x2: float, y2: float
+) -> bool:
+    # Liang-Barsky clipping of the segment against the rectangle
+    sx, sy, ex, ey = segment
+    dx, dy = ex - sx, ey - sy
+    low, high = 0.0, 1.0
+    for p, q in ((-dx, sx - x1), (dx, x2 - sx), (-dy, sy - y1), (dy, y2 - sy)):
+        if p == 0:
+            if q < 0:
+                return False
+        elif p < 0:
+            low = max(low, q / p)
+        else:
+            high = min(high, q / p)
+        if low > high:
+            return False
+    return True
+
+
+class SpatialIndex:
+    """Hit-testing and proximity queries over wires, junctions and labels
+
+    Items are stored in every square cell of `cell_size` that their bounding
+    box overlaps, so a query only looks at the items near it.
+    """
+
+    def __init__(self, cell_size: float = 10.0):
+        self.cell_size = cell_size
+        # Each entry is an item and its segments, points being zero length
+        self._entries: List[Tuple[BaseModel, List[_Segment]]] = []
+        self._cells: Dict[_Cell, List[int]] = {}
+
+    @classmethod
+    def from_schematic(
+        cls, schematic: "Schematic", cell_size: float = 10.0
+    ) -> "SpatialIndex":
+        """Index the wires, junctions and labels of a schematic"""
+        index = cls(cell_size)
+        for wire in schematic.wires or []:
+            points = wire.points
+            index.add(
+                wire,
+                [(a.x, a.y, b.x, b.y) for a, b in zip(points, points[1:])],
+            )
+        for junction in schematic.junctions or []:
+            index.add(junction, [(junction.at.x, junction.at.y) * 2])
+        for labels in (
+            schematic.labels,
+            schematic.global_labels,
+            schematic.hierarchical_labels,
+        ):
+            for label in labels:
+                index.add(label, [(label.at.x, label.at.y) * 2])
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, item: BaseModel, segments: List[_Segment]):
+        """Add an item made of segments, given as x1, y1, x2, y2"""
+        position = len(self._entries)
+        self._entries.append((item, segments))
+        cells = set()
+        for x1, y1, x2, y2 in segments:
+            x1, x2 = min(x1, x2), max(x1, x2)
+            y1, y2 = min(y1, y2), max(y1, y2)
+            cells.update(self._cells_in(x1, y1, x2, y2))
+        for cell in cells:
+            self._cells.setdefault(cell, []).append(position)
+
+    def _cell_range(
+        self, x1: float, y1: float, x2: float, y2: float
+    ) -> Tuple[range, range]:
+        size = self.cell_size
+        return (
+            range(math.floor(x1 / size), math.floor(x2 / size) + 1),
+            range(math.floor(y1 / size), math.floor(y2 / size) + 1),
+        )
+
+    def _cells_in(self, x1: float, y1: float, x2: float, y2: float) -> Iterator[_Cell]:
+        columns, rows = self._cell_range(x1, y1, x2, y2)
+        for i in columns:
+            for j in rows:
+                yield i, j
+
+    def _candidates(self, x1: float, y1: float, x2: float, y2: float) -> List[int]:
+        columns, rows = self._cell_range(x1, y1, x2, y2)
+        if len(columns) * len(rows) > len(self._cells):
+            # Cheaper to check the occupied cells for large areas
+            cells = [
+                items
+                for (i, j), items in self._cells.items()
+                if i in columns and j in rows
+            ]
+        else:
+            cells = [
+                self._cells.get(cell, ()) for cell in self._cells_in(x1, y1, x2, y2)
+            ]
+        found = set()
+        for items in cells:
+            found.update(items)
+        return sorted(found)
+
+    def near(self, x: float, y: float, radius: float) -> List[BaseModel]:
+        """Return the items within radius of a point"""
+        return [
+            self._entries[i][0]
+            for i in self._candidates(x - radius, y - radius, x + radius, y + radius)
+            if any(
+                _point_segment_distance(x, y, segment) <= radius
+                for segment in self._entries[i][1]
+            )
+        ]
+
+    def at(self, x: float, y: float, tolerance: float = 1e-6) -> List[BaseModel]:
+        """Return the items that touch a point, such as a pin or junction"""
+        return self.near(x, y, tolerance)
+
+    def in_rect(self, x1: float, y1: float, x2: float, y2: float) -> List[BaseModel]:
+        """Return the items that overlap a rectangle"""
+        x1, x2 = min(x1, x2), max(x1, x2)
+        y1, y2 = min(y1, y2), max(y1, y2)
+        return [
+            self._entries[i][0]
+            for i in self._candidates(x1, y1, x2, y2)
+            if any(
+                _segment_in_rect(segment, x1, y1, x2, y2)
+                for segment in self._entries[i][1]
+            )
+        ]
@@ -0,0 +1,219 @@
+"""Building models from trusted data without validating it
+
+For files that are known to be valid, such as ones written by KiCad or
+already loaded once, the checks made by pydantic are wasted work. Here the
+same object graph is built directly: the `before` model validators and
+BeforeValidator annotations are still applied, as are aliases, defaults and
+the conversions between the parsed values and the field types, but nothing
+is checked. Data that would fail validation gives an undefined result.
+"""
+
+import types
+from enum import Enum
+from typing import (Annotated, Any, Callable, Dict, List, Optional, Tuple,
+                    Type, Union, get_args, get_origin)
+
+from pydantic import BaseModel, BeforeValidator
+
+_Builder = Optional[Callable[[Any], Any]]
+# Models built by other functions instead, as pairs of model and function
+_Substitutes = Tuple[Tuple[Type[BaseModel], Callable[[Any], Any]], ...]
+
+# Origins of Optional[X] and X | None, the latter only from Python 3.10
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+_TRUE = {"1", "on", "t", "true", "y", "yes"}
+_FALSE = {"0", "off", "f", "false", "n", "no"}
+
+_object_setattr = object.__setattr__
+# Setting the slots through their descriptors skips the attribute lookup
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def _to_bool(value: Any) -> Any:
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+        return value
+    return bool(value)
+
+
+_SCALARS: Dict[Any, Callable[[Any], Any]] = {
+    bool: _to_bool,
+    float: float,
+    int: int,
+}
+
+# Defaults that can be shared between instances without being copied
+_IMMUTABLE = (type(None), bool, int, float, str, tuple, frozenset, Enum)
+
+
+class _ModelBuilder:
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        decorators = model.__pydantic_decorators__
+        self.validators = [
+            d.func
+            for d in decorators.model_validators.values()
+            if d.info.mode == "before"
+        ]
+        # Positional models (see BaseListModel) are built straight from lists
+        self.positional = getattr(model, "positional_fields", None)
+        # Set once the builders of every field are known
+        self.fields: List[Tuple[str, str, _Builder]] = []
+        self.field_info = model.model_fields
+        self.defaults = {
+            name: field.default
+            for name, field in model.model_fields.items()
+            if field.default_factory is None and isinstance(field.default, _IMMUTABLE)
+        }
+
+    def build(self, data: Any) -> BaseModel:
+        if isinstance(data, self.model):
+            # Kept as it is, like pydantic does with model instances
+            return data
+        if self.positional and isinstance(data, list):
+            values = {
+                name: value if build is None else build(value)
+                for (name, _, build), value in zip(self.fields, data)
+            }
+        else:
+            for validator in self.validators:
+                data = validator(data)
+            values = {
+                name: data[key] if build is None else build(data[key])
+                for name, key, build in self.fields
+                if key in data
+            }
+        fields_set = set(values)
+        if len(values) != len(self.fields):
+            values = self._with_defaults(values)
+        obj = self.model.__new__(self.model)
+        _object_setattr(obj, "__dict__", values)
+        _set_fields_set(obj, fields_set)
+        _set_extra(obj, None)
+        _set_private(obj, None)
+        return obj
+
+    def _with_defaults(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        # Rebuilt to keep the fields in declaration order, like pydantic
+        complete = {}
+        for name, _, _ in self.fields:
+            if name in values:
+                complete[name] = values[name]
+                continue
+            if name in self.defaults:
+                complete[name] = self.defaults[name]
+                continue
+            field = self.field_info[name]
+            if field.is_required():
+                raise ValueError(f"{self.model.__name__}.{name} is required")
+            complete[name] = field.get_default(
+                call_default_factory=True, validated_data=complete
+            )
+        return complete
+
+
+_model_builders: Dict[Tuple[Type[BaseModel], _Substitutes], _ModelBuilder] = {}
+
+
+def _model_builder(
+    model: Type[BaseModel], substitutes: _Substitutes = ()
+) -> _ModelBuilder:
+    key = (model, substitutes)
+    builder = _model_builders.get(key)
+    if builder is None:
+        # Registered before the fields so that models can refer to themselves
+        builder = _model_builders[key] = _ModelBuilder(model)
+        for name, field in model.model_fields.items():
+            build = _builder(field.annotation, substitutes)
+            build = _with_validators(build, field.metadata)
+            builder.fields.append((name, field.alias or name, build))
+    return builder
+
+
+def _with_validators(build: _Builder, metadata: List[Any]) -> _Builder:
+    # Like pydantic, the innermost (last) validator runs first
+    for item in reversed(metadata):
+        if isinstance(item, BeforeValidator):
+            build = _chain(item.func, build)
+    return build
+
+
+def _chain(validator: Callable[[Any], Any], build: _Builder) -> _Builder:
+    if build is None:
+        return validator
+    return lambda value: build(validator(value))
+
+
+def _optional(build: Callable[[Any], Any]) -> _Builder:
+    return lambda value: None if value is None else build(value)
+
+
+def _list(build: _Builder) -> _Builder:
+    if build is None:
+        return list
+    return lambda values: [build(value) for value in values]
+
+
+def _tuple(builds: List[_Builder]) -> _Builder:
+    builds = [b or (lambda value: value) for b in builds]
+    return lambda values: tuple(b(value) for b, value in zip(builds, values))
+
+
+def _builder(annotation: Any, substitutes: _Substitutes = ()) -> _Builder:
+    """Return the function that builds values of an annotation
+
+    Returns None for values that are used unchanged.
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Annotated:
+        build = _builder(args[0], substitutes)
+        return _with_validators(build, list(args[1:]))
+    if origin in _UNION_TYPES:
+        args = [arg for arg in args if arg is not type(None)]
+        if len(args) == 1:
+            build = _builder(args[0], substitutes)
+            return build and _optional(build)
+        return None
+    if origin is list:
+        return _list(_builder(args[0], substitutes))
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            build = _builder(args[0], substitutes)
+            if build is None:
+                return tuple
+            return lambda values: tuple(map(build, values))
+        return _tuple([_builder(arg, substitutes) for arg in args])
+    if annotation in _SCALARS:
+        return _SCALARS[annotation]
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            for model, build in substitutes:
+                if annotation is model:
+                    return build
+            return _model_builder(annotation, substitutes).build
+        if issubclass(annotation, Enum):
+            return annotation
+    return None
+
+
+def construct(
+    model: Type[BaseModel],
+    data: Any,
+    substitutes: Optional[Dict[Type[BaseModel], Callable[[Any], Any]]] = None,
+) -> BaseModel:
+    """Build a model from trusted data, skipping validation
+
+    Gives an equal result to model.model_validate(data) for valid data.
+    `substitutes` maps nested models to functions that build something
+    else from their data in their place, such as PointTuple.from_data.
+    """
+    key = tuple(substitutes.items()) if substitutes else ()
+    return _model_builder(model, key).build(data)
@@ -0,0 +1,83 @@
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional
+
+from pykicad.parser import kicad_sexp
+
+
+class LoadResult(NamedTuple):
+    """The outcome of loading one file in a batch
+
+    Exactly one of `model` and `error` is set.
+    """
+
+    path: str
+    model: Optional[Any] = None
+    error: Optional[BaseException] = None
+
+
+def _load_schematic(path: str, fields: Optional[List[str]]) -> Any:
+    return kicad_sexp.read_in_schematic_from_kicad_sch(path, fields=fields)
+
+
+def _load_netlist(path: str) -> Any:
+    return kicad_sexp.read_in_netlist_from_netlist(path)
+
+
+def _result(path: str, future: Future) -> LoadResult:
+    error = future.exception()
+    if error is not None:
+        return LoadResult(path, error=error)
+    return LoadResult(path, model=future.result())
+
+
+def _run(
+    load, paths: Iterable[str], args: tuple, workers: Optional[int], ordered: bool
+) -> Iterator[LoadResult]:
+    paths = list(paths)
+    if workers == 1:
+        # Parse in this process, which is simpler to debug and profile
+        for path in paths:
+            try:
+                yield LoadResult(path, model=load(path, *args))
+            except Exception as e:
+                yield LoadResult(path, error=e)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(load, path, *args): path for path in paths}
+        for future in futures if ordered else as_completed(futures):
+            yield _result(futures[future], future)
+    finally:
+        # Stopping early drops files that have not started parsing yet
+        executor.shutdown(cancel_futures=True)
+
+
+def read_many_schematics(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    fields: Optional[Iterable[str]] = None,
+) -> Iterator[LoadResult]:
+    """Read and parse many KiCad schematic files in parallel
+
+    Files are parsed by a pool of `workers` processes, defaulting to one per
+    CPU, and `workers=1` parses in the calling process. Results are yielded
+    in the order of `paths`, or as soon as each file is done when `ordered`
+    is False. A file that fails to load is reported through the `error` of
+    its result without stopping the others. `fields` is passed on to
+    read_in_schematic_from_kicad_sch.
+    """
+    if fields is not None:
+        fields = list(fields)
+    return _run(_load_schematic, paths, (fields,), workers, ordered)
+
+
+def read_many_netlists(
+    paths: Iterable[str], workers: Optional[int] = None, ordered: bool = True
+) -> Iterator[LoadResult]:
+    """Read and parse many KiCad netlist files in parallel
+
+    See read_many_schematics for how the files are parsed and reported.
+    """
+    return _run(_load_netlist, paths, (), workers, ordered)
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+import pykicad.models.compact as compact
+import pykicad.models.netlist as kicad_netlist
+import pykicad.models.schematic as sch_types
+from pykicad.parser import kicad_sexp
+
+# Models and modules whose changes invalidate cached entries
+_MODELS = [sch_types.Schematic, kicad_netlist.Netlist]
+_MODULES = [sch_types, kicad_netlist, compact, kicad_sexp]
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version("pykicad")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _schema_fingerprint() -> str:
+    # Covers the model schemas as well as the validators and parser code,
+    # which change the result without changing the schema
+    digest = hashlib.sha256(_package_version().encode())
+    for model in _MODELS:
+        schema = json.dumps(model.model_json_schema(), sort_keys=True)
+        digest.update(schema.encode())
+    for module in _MODULES:
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """On-disk cache of validated models, keyed by the content of the file
+
+    Entries are pickled into `directory`, which must only be writable by
+    trusted users. Keys include the pykicad version and a fingerprint of the
+    models and parser, so entries are never reused after either changes.
+    Once the entries take up more than `max_bytes`, the least recently used
+    ones are removed.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 256 << 20):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._fingerprint = _schema_fingerprint()
+
+    def read_in_schematic_from_kicad_sch(
+        self, file_path: str, fields: Optional[Iterable[str]] = None
+    ) -> sch_types.Schematic:
+        """Cached version of kicad_sexp.read_in_schematic_from_kicad_sch"""
+        with open(file_path, "r") as f:
+            content = f.read()
+        if fields is not None:
+            fields = sorted(fields)
+        key = self._key("schematic", json.dumps(fields), content)
+        return self._get(
+            key,
+            lambda: kicad_sexp.read_in_schematic_from_string(content, fields=fields),
+        )
+
+    def read_in_netlist_from_netlist(self, file_path: str) -> kicad_netlist.Netlist:
+        """Cached version of kicad_sexp.read_in_netlist_from_netlist"""
+        with open(file_path, "r") as f:
+            content = f.read()
+        key = self._key("netlist", content)
+        return self._get(key, lambda: kicad_sexp.read_in_netlist_from_string(content))
+
+    def clear(self):
+        """Remove every entry from the cache"""
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+    def _key(self, *parts: str) -> str:
+        digest = hashlib.sha256(self._fingerprint.encode())
+        for part in parts:
+            digest.update(hashlib.sha256(part.encode()).digest())
+        return digest.hexdigest()
+
+    def _get(self, key: str, parse: Callable[[], Any]) -> Any:
+        path = self.directory / f"{key}.pickle"
+        try:
+            with open(path, "rb") as f:
+                model = pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Unreadable entries, e.g. from an interrupted write, are replaced
+            path.unlink(missing_ok=True)
+        else:
+            self.hits += 1
+            # The modification time records when the entry was last used
+            os.utime(path)
+            return model
+
+        self.misses += 1
+        model = parse()
+        self._store(path, model)
+        return model
+
+    def _store(self, path: Path, model: Any):
+        # Write to a temporary file first so readers never see partial entries
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:
+                continue
+        total = sum(stat.st_size for stat, _ in entries)
+        entries.sort(key=lambda entry: entry[0].st_mtime_ns)
+        for stat, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
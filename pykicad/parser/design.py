@@ -0,0 +1,230 @@
+"""Loading a root schematic together with every sheet under it
+
+Each sheet item of a schematic places another schematic file, and a file
+can be placed many times, such as one file for a channel placed once per
+channel. read_in_design follows the sheets down from the root file, parses
+each file once, and describes each placement as a SheetInstance that refers
+to the schematic of its file rather than holding a copy of it.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import cached_property
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+import pykicad.models.schematic as sch_types
+from pykicad.models.label_index import LabelIndex
+from pykicad.parser import kicad_sexp
+
+
+class SheetInstance(NamedTuple):
+    """One placement of a schematic file in the sheet tree
+
+    `path` is the instance path KiCad uses for symbols: the UUID of the root
+    schematic followed by the UUID of each sheet item down to this one.
+    `names` is the same path made of sheet names, "/" for the root. `sheet`
+    is the sheet item placing the file, and `parent` the path of the
+    instance holding that sheet item. Both are None for the root.
+    """
+
+    path: str
+    names: str
+    file: str
+    sheet: Optional[sch_types.Sheet] = None
+    parent: Optional[str] = None
+
+
+class Design:
+    """A root schematic and the schematics placed under it
+
+    `schematics` holds one Schematic per file, by its real path, and
+    `instances` every placement of a file, depth first from the root.
+    `trusted` is used when files are reloaded.
+    """
+
+    def __init__(
+        self,
+        root_file: str,
+        schematics: Dict[str, sch_types.Schematic],
+        instances: List[SheetInstance],
+        trusted: bool = False,
+    ):
+        self.root_file = root_file
+        self.schematics = schematics
+        self.instances = instances
+        self.trusted = trusted
+        self._by_path = {instance.path: instance for instance in instances}
+
+    @property
+    def root(self) -> sch_types.Schematic:
+        """The schematic of the root file"""
+        return self.schematics[self.root_file]
+
+    def instance(self, path: str) -> Optional[SheetInstance]:
+        """Return the instance with a path, or None"""
+        return self._by_path.get(path)
+
+    def schematic_of(self, instance: SheetInstance) -> sch_types.Schematic:
+        """Return the schematic of an instance, the same for its whole file"""
+        return self.schematics[instance.file]
+
+    def instances_of(self, file_path: str) -> List[SheetInstance]:
+        """Return the instances of a file, in the order of `instances`"""
+        file = os.path.realpath(file_path)
+        return [instance for instance in self.instances if instance.file == file]
+
+    def children(self, instance: SheetInstance) -> List[SheetInstance]:
+        """Return the instances placed by the sheets of an instance"""
+        return [i for i in self.instances if i.parent == instance.path]
+
+    @cached_property
+    def _label_index(self) -> LabelIndex:
+        index = LabelIndex()
+        for instance in self.instances:
+            index.add(instance.path, self.schematic_of(instance))
+        return index
+
+    def label_index(self) -> LabelIndex:
+        """Index of the global and hierarchical label nets of the design
+
+        Built on first use and kept up to date by reload.
+        """
+        return self._label_index
+
+    def reload(self, file_path: str) -> sch_types.Schematic:
+        """Parse a file of the design again, after it has changed
+
+        Files placed by new sheets of the file are loaded, and files that
+        are no longer placed are dropped. The label index, once built, is
+        only updated for the instances of the file and the instances that
+        appeared or went away.
+        """
+        file = os.path.realpath(file_path)
+        if file not in self.schematics:
+            raise ValueError(f"{file_path} is not part of the design")
+        self.schematics[file] = _load(file, self.trusted)
+        _load_sheets(self.schematics, [file], self.trusted)
+
+        old = self._by_path
+        self.instances = _instances(self.root_file, self.schematics)
+        self._by_path = {instance.path: instance for instance in self.instances}
+        placed = {instance.file for instance in self.instances}
+        for unused in set(self.schematics) - placed:
+            del self.schematics[unused]
+
+        if "_label_index" in self.__dict__:
+            # Instances of other files that are placed by an unchanged sheet
+            # are equal before and after, and keep their items
+            index = self._label_index
+            for path, instance in old.items():
+                if instance.file == file or self._by_path.get(path) != instance:
+                    index.remove(path)
+            for path, instance in self._by_path.items():
+                if instance.file == file or old.get(path) != instance:
+                    index.add(path, self.schematic_of(instance))
+        return self.schematics[file]
+
+
+def _load(path: str, trusted: bool) -> sch_types.Schematic:
+    return kicad_sexp.read_in_schematic_from_kicad_sch(path, trusted=trusted)
+
+
+def _sheet_file(parent_file: str, sheet: sch_types.Sheet) -> str:
+    # Like KiCad, relative sheet files are found from the parent file
+    if not sheet.file:
+        raise ValueError(f"Sheet {sheet.uuid} in {parent_file} has no file")
+    return os.path.realpath(os.path.join(os.path.dirname(parent_file), sheet.file))
+
+
+def _sheet_files(path: str, schematic: sch_types.Schematic) -> Iterator[str]:
+    for sheet in schematic.sheets:
+        yield _sheet_file(path, sheet)
+
+
+def _load_sheets(
+    schematics: Dict[str, sch_types.Schematic], pending: List[str], trusted: bool
+):
+    # Load the files placed by the pending files, and the files placed by
+    # those, that are not loaded yet
+    while pending:
+        path = pending.pop()
+        for file in _sheet_files(path, schematics[path]):
+            if file not in schematics:
+                schematics[file] = _load(file, trusted)
+                pending.append(file)
+
+
+def _load_files(
+    root_file: str, workers: Optional[int], trusted: bool
+) -> Dict[str, sch_types.Schematic]:
+    # Files are loaded as they are found, so each is parsed once however
+    # many times it is placed
+    if workers == 1:
+        schematics = {root_file: _load(root_file, trusted)}
+        _load_sheets(schematics, [root_file], trusted)
+        return schematics
+
+    schematics: Dict[str, sch_types.Schematic] = {}
+    found = {root_file}
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(_load, root_file, trusted): root_file}
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = futures.pop(future)
+                schematic = schematics[path] = future.result()
+                for file in _sheet_files(path, schematic):
+                    if file not in found:
+                        found.add(file)
+                        futures[executor.submit(_load, file, trusted)] = file
+    finally:
+        executor.shutdown(cancel_futures=True)
+    return schematics
+
+
+def _instances(
+    root_file: str, schematics: Dict[str, sch_types.Schematic]
+) -> List[SheetInstance]:
+    root = SheetInstance("/" + schematics[root_file].uuid, "/", root_file)
+    instances = []
+    # Each entry also holds the files of the instances above it
+    stack = [(root, (root_file,))]
+    while stack:
+        instance, files = stack.pop()
+        instances.append(instance)
+        children = []
+        for sheet in schematics[instance.file].sheets:
+            file = _sheet_file(instance.file, sheet)
+            if file in files:
+                raise ValueError(f"{file} is placed inside itself")
+            child = SheetInstance(
+                f"{instance.path}/{sheet.uuid}",
+                f"{instance.names}{sheet.name}/",
+                file,
+                sheet,
+                instance.path,
+            )
+            children.append((child, files + (file,)))
+        stack.extend(reversed(children))
+    return instances
+
+
+def read_in_design(
+    root_path: str, workers: Optional[int] = 1, trusted: bool = False
+) -> Design:
+    """Read a root schematic and every schematic placed under it by sheets
+
+    Each file is parsed once, however many times it is placed. With
+    `workers` other than 1, files are parsed by a pool of that many
+    processes, or one per CPU for None, each file starting as soon as the
+    sheet placing it has been read. With `trusted`, the models are built
+    without being validated, see read_in_schematic_from_kicad_sch.
+
+    A missing sheet file raises FileNotFoundError, and a file placed inside
+    itself raises a ValueError.
+    """
+    root_file = os.path.realpath(root_path)
+    schematics = _load_files(root_file, workers, trusted)
+    instances = _instances(root_file, schematics)
+    return Design(root_file, schematics, instances, trusted)
@@ -0,0 +1,340 @@
+"""Updating a loaded schematic from a new version of its text
+
+update finds the top-level items of the new text and compares a digest of
+the text of each with the digests kept from the previous version. Only the
+items whose text changed are parsed. Items of the list fields, such as
+symbols and wires, are matched by UUID, or by their text for items without
+one, and the items that did not change are kept as the same objects. The
+other items, such as title_block and lib_symbols, are parsed again together
+when any of them changed.
+
+The previous text is kept as well, so that only the part of the new text
+between the start and end it has in common with the previous one has to be
+scanned for items.
+"""
+
+import bisect
+import hashlib
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+import pykicad.models.schematic as sch_types
+from pykicad.models.trusted import construct
+from pykicad.parser import item_index, kicad_sexp
+from pykicad.parser.item_index import IndexEntry
+
+# The state of the last update of a schematic is kept in its __dict__, like
+# the values of its cached properties
+_STATE_KEY = "_update_state"
+
+# Schematic list fields by the name of their items in the file
+_LIST_FIELDS = {item: field for field, item in kicad_sexp._SCHEMATIC_ITEMS.items()}
+
+# An item's UUID and the digest of its text
+_ItemKey = Tuple[Optional[str], bytes]
+
+# Bytes compared at a time when looking for the start and end two texts
+# have in common
+_CHUNK = 1 << 16
+
+
+class _State(NamedTuple):
+    # A text, its top-level items and the key of each item
+    content: bytes
+    entries: List[IndexEntry]
+    keys: List[_ItemKey]
+
+
+class SchematicUpdate(NamedTuple):
+    """The changes made by update
+
+    `added` and `removed` hold items of the list fields, and `changed` the
+    old and new versions of the items whose text changed, matched by UUID.
+    `fields` names the other fields given a new value, such as title_block.
+    """
+
+    added: List[BaseModel]
+    removed: List[BaseModel]
+    changed: List[Tuple[BaseModel, BaseModel]]
+    fields: List[str]
+
+
+def _digest(data: memoryview) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _keys(content: bytes, entries: List[IndexEntry]) -> List[_ItemKey]:
+    view = memoryview(content)
+    return [(entry.uuid, _digest(view[entry.start : entry.end])) for entry in entries]
+
+
+def _state(content: bytes) -> _State:
+    entries = item_index._scan(content)
+    return _State(content, entries, _keys(content, entries))
+
+
+def _common_prefix(first: bytes, second: bytes) -> int:
+    # Compared a chunk at a time, then by halving the chunk that differs,
+    # as comparing bytes is much faster than looping over them
+    size = min(len(first), len(second))
+    low = 0
+    while low < size and first[low : low + _CHUNK] == second[low : low + _CHUNK]:
+        low += _CHUNK
+    high = min(low + _CHUNK, size)
+    start = low
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[start:middle] == second[start:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return min(low, size)
+
+
+def _common_suffix(first: bytes, second: bytes, size: int) -> int:
+    # The same from the end, up to `size`
+    first_end, second_end = len(first), len(second)
+    low = 0
+    while low < size and (
+        first[max(first_end - low - _CHUNK, 0) : first_end - low]
+        == second[max(second_end - low - _CHUNK, 0) : second_end - low]
+    ):
+        low += _CHUNK
+    high = min(low + _CHUNK, size)
+    start = low
+    while low < high:
+        middle = (low + high + 1) // 2
+        if (
+            first[first_end - middle : first_end - start]
+            == second[second_end - middle : second_end - start]
+        ):
+            low = middle
+        else:
+            high = middle - 1
+    return min(low, size)
+
+
+def _rescan(old: _State, content: bytes) -> _State:
+    # Items that lie wholly in the start or the end the texts have in common
+    # are the same, so only the items in between are scanned
+    prefix = _common_prefix(old.content, content)
+    suffix = _common_suffix(
+        old.content, content, min(len(old.content), len(content)) - prefix
+    )
+    entries = old.entries
+    # bisect only takes a key from Python 3.10
+    ends = [entry.end for entry in entries]
+    starts = [entry.start for entry in entries]
+    first = bisect.bisect_right(ends, prefix)
+    last = bisect.bisect_left(starts, len(old.content) - suffix, first)
+    if first == 0:
+        # The change reaches into the start of the top-level list
+        return _state(content)
+    shift = len(content) - len(old.content)
+    start = entries[first - 1].end
+    end = entries[last].start + shift if last < len(entries) else None
+    try:
+        scanned, depth = item_index._scan_items(content, start, end)
+    except ValueError:
+        return _state(content)
+    if depth != (0 if end is None else 1):
+        # The change is not made of whole items, such as an unclosed list
+        return _state(content)
+    moved = [
+        IndexEntry(entry.name, entry.start + shift, entry.end + shift, entry.uuid)
+        for entry in entries[last:]
+    ]
+    return _State(
+        content,
+        entries[:first] + scanned + moved,
+        old.keys[:first] + _keys(content, scanned) + old.keys[last:],
+    )
+
+
+def _other_digest(state: _State) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for entry, (_, item_digest) in zip(state.entries, state.keys):
+        if entry.name not in _LIST_FIELDS:
+            digest.update(item_digest)
+    return digest.digest()
+
+
+def _by_name(state: _State) -> Dict[str, Tuple[List[IndexEntry], List[_ItemKey]]]:
+    groups: Dict[str, Tuple[List[IndexEntry], List[_ItemKey]]] = {}
+    for entry, key in zip(state.entries, state.keys):
+        entries, keys = groups.setdefault(entry.name, ([], []))
+        entries.append(entry)
+        keys.append(key)
+    return groups
+
+
+def _text(content: bytes, entry: IndexEntry) -> str:
+    return content[entry.start : entry.end].decode()
+
+
+def _build_from(
+    content: bytes, entries: List[IndexEntry], trusted: bool
+) -> sch_types.Schematic:
+    # Build a schematic from some of the items of the text, as a full load
+    # would build them
+    text = f"(kicad_sch {' '.join(_text(content, entry) for entry in entries)})"
+    parsed = kicad_sexp.read_sexp_from_string(text)["kicad_sch"]
+    return kicad_sexp._build_schematic(parsed, trusted)
+
+
+def _set_field(schematic: sch_types.Schematic, name: str, value: Any, is_set: bool):
+    schematic.__dict__[name] = value
+    if is_set:
+        schematic.__pydantic_fields_set__.add(name)
+    else:
+        schematic.__pydantic_fields_set__.discard(name)
+
+
+def _update_other(
+    schematic: sch_types.Schematic,
+    content: bytes,
+    entries: List[IndexEntry],
+    trusted: bool,
+    result: SchematicUpdate,
+):
+    rebuilt = _build_from(
+        content, [entry for entry in entries if entry.name not in _LIST_FIELDS], trusted
+    )
+    list_fields = set(_LIST_FIELDS.values())
+    for name in type(schematic).model_fields:
+        if name in list_fields:
+            continue
+        value = rebuilt.__dict__[name]
+        if getattr(schematic, name) != value:
+            _set_field(schematic, name, value, name in rebuilt.model_fields_set)
+            result.fields.append(name)
+
+
+def _update_list(
+    schematic: sch_types.Schematic,
+    field: str,
+    content: bytes,
+    entries: List[IndexEntry],
+    header: List[IndexEntry],
+    keys: List[_ItemKey],
+    old_keys: Optional[List[_ItemKey]],
+    trusted: bool,
+    atoms: Dict[str, Any],
+    result: SchematicUpdate,
+):
+    current = getattr(schematic, field) or []
+    if old_keys is None or len(old_keys) != len(current):
+        # The items cannot be told apart by their text, as for a schematic
+        # loaded with `fields` or not updated before. They are matched by
+        # UUID, or in order without one, and compared once built.
+        old_keys = [(item.uuid, None) for item in current]
+    by_key: Dict[Any, List[int]] = {}
+    for index, (uuid, digest) in enumerate(old_keys):
+        by_key.setdefault(digest if uuid is None else uuid, []).append(index)
+
+    if len(entries) < 2:
+        # A lone item is parsed differently from repeated ones, so it is
+        # built the way a full load builds it, even where that drops it
+        rebuilt = _build_from(content, header + entries, trusted)
+        built = list(rebuilt.__dict__[field] or [])
+        keys = keys[: len(built)]
+        is_set = field in rebuilt.model_fields_set
+    else:
+        built = None
+        is_set = True
+
+    items = []
+    matched = set()
+    for position, (uuid, digest) in enumerate(keys):
+        candidates = by_key.get(digest if uuid is None else uuid)
+        if not candidates and uuid is None:
+            candidates = by_key.get(None)
+        index = candidates.pop(0) if candidates else None
+        matched.add(index)
+        if index is not None and old_keys[index][1] == digest:
+            items.append(current[index])
+            continue
+        if built is not None:
+            item = built[position]
+        else:
+            entry = entries[position]
+            _, data = kicad_sexp._read_item_from_string(_text(content, entry), atoms)
+            model = item_index._MODELS[entry.name]
+            item = construct(model, data) if trusted else model.model_validate(data)
+        if index is None:
+            result.added.append(item)
+        elif item == current[index]:
+            # Only the layout of the text changed
+            item = current[index]
+        else:
+            result.changed.append((current[index], item))
+        items.append(item)
+
+    result.removed.extend(
+        item for index, item in enumerate(current) if index not in matched
+    )
+    if len(items) != len(current) or any(
+        new is not old for new, old in zip(items, current)
+    ):
+        _set_field(schematic, field, items, is_set)
+
+
+def update(
+    schematic: sch_types.Schematic,
+    new_text: str,
+    old_text: Optional[str] = None,
+    trusted: bool = False,
+) -> SchematicUpdate:
+    """Update a schematic in place to match a new version of its text
+
+    Only the items whose text changed are parsed and validated, or built
+    without validation with `trusted`. Unchanged items keep their objects,
+    and the geometry and spatial index are built again once a list they
+    cover changed. The new text and the digests of its items are kept on
+    the schematic for the next update.
+
+    Before its first update, a schematic has no digests. If `old_text` is
+    given, it is taken to be the text the schematic was loaded from and
+    its items give the digests. Otherwise every item of `new_text` is
+    parsed and compared with the items of the schematic. Items loaded as
+    flyweights or point tuples are replaced by plain models when they
+    change.
+    """
+    content = new_text.encode()
+    old = schematic.__dict__.get(_STATE_KEY)
+    compare_other = False
+    if old is None and old_text is not None:
+        old = _state(old_text.encode())
+        # The other fields are still compared by value, since they are not
+        # checked against the schematic like the lengths of the lists are
+        compare_other = True
+    new = _state(content) if old is None else _rescan(old, content)
+
+    result = SchematicUpdate([], [], [], [])
+    if old is None or compare_other or _other_digest(old) != _other_digest(new):
+        _update_other(schematic, content, new.entries, trusted, result)
+
+    required = set(kicad_sexp._schematic_item_names([]))
+    header = [entry for entry in new.entries if entry.name in required]
+    groups = _by_name(new)
+    old_groups = None if old is None else _by_name(old)
+    # Shared between the items parsed, as a full load shares them
+    atoms: Dict[str, Any] = {}
+    for name, field in _LIST_FIELDS.items():
+        entries, keys = groups.get(name, ([], []))
+        _update_list(
+            schematic,
+            field,
+            content,
+            entries,
+            header,
+            keys,
+            None if old_groups is None else old_groups.get(name, ([], []))[1],
+            trusted,
+            atoms,
+            result,
+        )
+
+    schematic.__dict__[_STATE_KEY] = new
+    return result
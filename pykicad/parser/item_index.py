@@ -0,0 +1,240 @@
+"""Byte offsets of the top-level items of a file, for reading single items
+
+An ItemIndex records where each item directly inside the top-level list
+starts and ends, along with its UUID, from one scan that only matches
+parentheses. With it, a single item is read by seeking to it and parsing
+just its text. The index can be saved next to the file, as
+`<file>.idx`, so that it is only built once per version of the file.
+"""
+
+import json
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+import pykicad.models.schematic as sch_types
+from pykicad.models.trusted import construct
+from pykicad.parser import kicad_sexp
+
+# Bump when the layout of saved indexes changes
+INDEX_VERSION = 1
+SIDECAR_SUFFIX = ".idx"
+# Files whose indexes index_file keeps in memory at most
+MAX_INDEXES = 64
+
+_STRUCTURE_RE = re.compile(kicad_sexp._STRUCTURE_RE.pattern.encode(), re.DOTALL)
+_LIST_NAME_RE = re.compile(kicad_sexp._LIST_NAME_RE.pattern.encode(), re.DOTALL)
+_UUID_RE = re.compile(rb"""\(\s*uuid\s+("(?:[^"\\]|\\.)*"|[^\s()"]+)""")
+
+# Models of the schematic items that can be read on their own. The Polyline
+# and Text models do not validate the top-level polylines and text of a
+# schematic, so those are left out.
+_MODELS: Dict[str, Type[BaseModel]] = {
+    "symbol": sch_types.SchematicSymbol,
+    "wire": sch_types.Wire,
+    "junction": sch_types.Junction,
+    "label": sch_types.Label,
+    "global_label": sch_types.Label,
+    "hierarchical_label": sch_types.Label,
+    "sheet": sch_types.Sheet,
+}
+
+
+class IndexEntry(NamedTuple):
+    """A top-level item: its name, byte range and UUID if it has one"""
+
+    name: str
+    start: int
+    end: int
+    uuid: Optional[str]
+
+
+def _file_stamp(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _scan(content: bytes) -> List[IndexEntry]:
+    # Like kicad_sexp._top_level_items, on bytes so that offsets can be used
+    # to seek, and also picking up the (uuid ...) directly inside each item
+    root = _LIST_NAME_RE.search(content)
+    if root is None:
+        return []
+    entries, _ = _scan_items(content, root.start() + 1)
+    return entries
+
+
+def _scan_items(
+    content: bytes, pos: int, endpos: Optional[int] = None
+) -> Tuple[List[IndexEntry], int]:
+    # Scan from `pos`, which is inside the top-level list and between its
+    # items, up to `endpos`. Also returns the depth reached, which is 1 when
+    # stopping between items and 0 once the top-level list is closed.
+    entries = []
+    depth = 1
+    start = 0
+    uuid = None
+    if endpos is None:
+        tokens = _STRUCTURE_RE.finditer(content, pos)
+    else:
+        tokens = _STRUCTURE_RE.finditer(content, pos, endpos)
+    for match in tokens:
+        token = match.group()
+        if token == b"(":
+            depth += 1
+            if depth == 2:
+                start, uuid = match.start(), None
+            elif depth == 3 and uuid is None:
+                found = _UUID_RE.match(content, match.start())
+                if found is not None:
+                    uuid = kicad_sexp._unquote(found.group(1).decode())
+        elif token == b")":
+            if depth == 2:
+                name = _LIST_NAME_RE.match(content, start)
+                if name is not None:
+                    entries.append(
+                        IndexEntry(name.group(1).decode(), start, match.end(), uuid)
+                    )
+            depth -= 1
+            if depth == 0:
+                break
+        elif token in (b'"', b"'"):
+            raise ValueError("Unclosed quote in S-expression")
+    return entries, depth
+
+
+class ItemIndex:
+    """Byte offsets and UUIDs of the top-level items of a file
+
+    `size` and `mtime_ns` are those of the file when it was scanned, and
+    tell whether the index still matches it.
+    """
+
+    def __init__(self, entries: Iterable[IndexEntry], size: int, mtime_ns: int):
+        self.entries = list(entries)
+        self.size = size
+        self.mtime_ns = mtime_ns
+        # The first item is kept if several share a UUID
+        self.by_uuid: Dict[str, IndexEntry] = {}
+        for entry in reversed(self.entries):
+            if entry.uuid is not None:
+                self.by_uuid[entry.uuid] = entry
+
+    @classmethod
+    def build(cls, file_path: str) -> "ItemIndex":
+        """Scan a file for its top-level items"""
+        size, mtime_ns = _file_stamp(file_path)
+        with open(file_path, "rb") as f:
+            content = f.read()
+        return cls(_scan(content), size, mtime_ns)
+
+    @classmethod
+    def load(cls, index_path: str) -> "ItemIndex":
+        """Read an index saved with save"""
+        with open(index_path, "r") as f:
+            data = json.load(f)
+        if data["version"] != INDEX_VERSION:
+            raise ValueError(f"{index_path} is not a version {INDEX_VERSION} index")
+        entries = [IndexEntry(*entry) for entry in data["items"]]
+        return cls(entries, data["size"], data["mtime_ns"])
+
+    def save(self, index_path: str):
+        """Write the index to a file, replacing it in one step"""
+        data = {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "items": [list(entry) for entry in self.entries],
+        }
+        directory = os.path.dirname(os.path.abspath(index_path))
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(f.name, index_path)
+
+    def is_current(self, file_path: str) -> bool:
+        """Return whether the file is unchanged since it was scanned"""
+        return _file_stamp(file_path) == (self.size, self.mtime_ns)
+
+    def read_text(self, file_path: str, entry: IndexEntry) -> str:
+        """Read the text of one item from the file"""
+        with open(file_path, "rb") as f:
+            f.seek(entry.start)
+            return f.read(entry.end - entry.start).decode()
+
+
+# Indexes already used in this process, by absolute file path
+# By absolute path, least recently used first
+_indexes: "OrderedDict[str, ItemIndex]" = OrderedDict()
+
+
+def clear_indexes():
+    """Drop the indexes kept in memory by index_file"""
+    _indexes.clear()
+
+
+def index_file(file_path: str, sidecar: bool = False) -> ItemIndex:
+    """Return the index of a file, building it only if needed
+
+    The indexes of the last MAX_INDEXES files used are kept in memory. With
+    `sidecar`, the index is also read from and saved to `<file>.idx`, if the
+    directory is writable. Either copy is rebuilt once the size or
+    modification time of the file changes.
+    """
+    key = os.path.abspath(file_path)
+    index = _indexes.get(key)
+    if index is not None and index.is_current(file_path):
+        _indexes.move_to_end(key)
+        return index
+
+    index_path = file_path + SIDECAR_SUFFIX
+    index = None
+    if sidecar:
+        try:
+            index = ItemIndex.load(index_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, unreadable or from another version, so rebuilt
+            index = None
+        if index is not None and not index.is_current(file_path):
+            index = None
+    if index is None:
+        index = ItemIndex.build(file_path)
+        if sidecar:
+            try:
+                index.save(index_path)
+            except OSError:
+                pass
+    _indexes[key] = index
+    _indexes.move_to_end(key)
+    while len(_indexes) > MAX_INDEXES:
+        _indexes.popitem(last=False)
+    return index
+
+
+def get_element_by_uuid(
+    file_path: str, uuid: str, sidecar: bool = False, trusted: bool = False
+) -> Optional[BaseModel]:
+    """Read the top-level item of a schematic with a UUID, or None
+
+    Only the text of that item is read and parsed, using the index from
+    index_file. Symbols, wires, junctions, labels and sheets are returned
+    as the same models a Schematic holds. Items of other kinds, such as
+    polylines and text, raise a ValueError.
+    """
+    index = index_file(file_path, sidecar)
+    entry = index.by_uuid.get(uuid)
+    if entry is None:
+        return None
+    model = _MODELS.get(entry.name)
+    if model is None:
+        raise ValueError(f"{entry.name} items cannot be read on their own")
+    # Validated from the same dict a Schematic list field receives
+    _, data = kicad_sexp._read_item_from_string(index.read_text(file_path, entry))
+    if trusted:
+        return construct(model, data)
+    return model.model_validate(data)
@@ -1,10 +1,18 @@
+import mmap
+import os
+import re
+import sys
 from collections import Counter
-from typing import Dict, List
+from typing import (Any, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, TextIO, Tuple, Type, Union)
 
-from simp_sexp import Sexp
+from pydantic import BaseModel
 
 import pykicad.models.netlist as kicad_netlist
 import pykicad.models.schematic as sch_types
+from pykicad.models.flyweight import LeafPool
+from pykicad.models.lazy import LazySchematic
+from pykicad.models.trusted import construct
 
 
 def _plural(word: str) -> str:
@@ -54,7 +62,8 @@ def _strip_single_element_lists(sexp: List) -> List:
     return sexp
 
 
-def parse_sexp(sexp: List) -> Dict:
+def _parse_sexp_recursive(sexp: List) -> Dict:
+    # Reference implementation of parse_sexp, kept for comparison and tests
     sexp = _normalized_bools(sexp)
     sexp = _strip_single_element_lists(sexp)
     is_list_items = [isinstance(s, list) for s in sexp]
@@ -68,7 +77,7 @@ def parse_sexp(sexp: List) -> Dict:
     elif not is_list_items[0] and all(is_list_items[1:]):
         # First values is string and the rest are lists
         # Named object where the first value is the name and the rest are the content
-        return {sexp[0]: parse_sexp(sexp[1:])}
+        return {sexp[0]: _parse_sexp_recursive(sexp[1:])}
     elif first is not None and first > 1 and all(is_list_items[first:]):
         # Sometimes objects have required fields that aren't key, value pairs
         # First value is the name of the object, then the args are strings
@@ -76,7 +85,7 @@ def parse_sexp(sexp: List) -> Dict:
         for i, item in enumerate(sexp[1:]):
             if isinstance(item, str):
                 sexp[i + 1] = ["_required", item]
-        return {sexp[0]: parse_sexp(sexp[1:])}
+        return {sexp[0]: _parse_sexp_recursive(sexp[1:])}
     elif all(is_list_items):
         # If all items are lists, then convert to key value pairs
         result = {}
@@ -87,11 +96,11 @@ def parse_sexp(sexp: List) -> Dict:
                 name = _plural(item[0])
                 if name not in result:
                     result[name] = []
-                result[name].append(parse_sexp(item[1:]))
+                result[name].append(_parse_sexp_recursive(item[1:]))
             elif not any(is_list_item):
                 result.update(_parse_all_strings(item))
             else:
-                result.update(parse_sexp(item))
+                result.update(_parse_sexp_recursive(item))
         return result
     elif len(sexp[0]) == 2 and isinstance(sexp[1], str):
         # Fields are structured like this
@@ -99,20 +108,929 @@ def parse_sexp(sexp: List) -> Dict:
     raise ValueError("Invalid sexp to parse: ", sexp)
 
 
-def read_sexp_from_file(file_path: str) -> Dict:
+# Parentheses, quoted strings (an unterminated quote matches on its own so it
+# can be reported) and bare atoms, where a backslash escapes the next character
+_TOKEN_RE = re.compile(
+    r"""[()]|"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|["']|(?:[^\s()"'\\]|\\.|\\\Z)+""",
+    re.DOTALL,
+)
+_ESCAPE_RE = re.compile(r"""\\(["'\\])""")
+_MISSING = object()
+# The same tokens in UTF-8 bytes, where only ASCII whitespace separates atoms
+_BYTES_TOKEN_RE = re.compile(_TOKEN_RE.pattern.encode(), re.DOTALL)
+
+# Parentheses and quoted strings, skipping escaped characters, which is all
+# that is needed to find where lists start and end
+_STRUCTURE_RE = re.compile(
+    r"""\\.|[()]|"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|["']""", re.DOTALL
+)
+# The first atom of a list
+_LIST_NAME_RE = re.compile(r"""\(\s*((?:[^\s()"'\\]|\\.)+)""", re.DOTALL)
+
+# Schematic fields whose items use a different name in the file
+_SCHEMATIC_ITEMS = {
+    "symbols": "symbol",
+    "wires": "wire",
+    "junctions": "junction",
+    "global_labels": "global_label",
+    "hierarchical_labels": "hierarchical_label",
+    "labels": "label",
+    "sheets": "sheet",
+}
+
+# Models loaded as tuples with `point_tuples`
+_POINT_TUPLES = {
+    sch_types.Point: sch_types.PointTuple.from_data,
+    sch_types.Position: sch_types.PositionTuple.from_data,
+}
+
+# Netlist containers streamed by stream_netlist, and the models of the items
+# inside them
+_NETLIST_CONTAINERS = {"components", "libparts", "nets"}
+_NETLIST_MODELS = {
+    "comp": kicad_netlist.Component,
+    "libpart": kicad_netlist.LibPart,
+    "net": kicad_netlist.Net,
+}
+
+# Events produced by iter_sexp_events
+OPEN = "open"
+ATOM = "atom"
+CLOSE = "close"
+# Characters read at a time when streaming a file
+CHUNK_SIZE = 1 << 16
+# Parsed atoms kept between the items of a stream, which bounds the memory
+# used by files with many distinct unquoted atoms
+_MAX_SHARED_ATOMS = 1 << 12
+# Quoted strings up to this length, quotes included, are shared between
+# their occurrences. Names, references and values repeat throughout a file,
+# while longer strings are mostly UUIDs, paths and text that do not.
+_MAX_SHARED_STRING = 32
+
+
+def _unquote(token: str) -> str:
+    # Quoted tokens still carry their quotes, a lone quote was never closed
+    if len(token) == 1:
+        raise ValueError("Unclosed quote in S-expression")
+    token = token[1:-1]
+    if "\\" in token:
+        token = _ESCAPE_RE.sub(r"\1", token)
+    return token
+
+
+def _parse_atom(token: str) -> Union[int, float, str]:
+    # Unquoted atoms become numbers whenever Python can read them as one.
+    # Escaped whitespace can end up at the edges of a token, which is dropped
+    if "\\" in token:
+        token = token.strip()
+    try:
+        return int(token, 0)
+    except ValueError:
+        try:
+            return float(token)
+        except ValueError:
+            # Keywords, interned so that they are the same strings as the
+            # dict keys and field names they are looked up with
+            return sys.intern(token)
+
+
+class _Node(list):
+    # A list holding at least one nested list. The tokenizer builds the parse
+    # result of each node as soon as it is closed, so by the time a parent is
+    # closed every child value it needs is already memoised and nothing has
+    # to be walked a second time.
+    __slots__ = ("_full", "_body", "_named")
+
+    def full(self):
+        # Equivalent to parse_sexp(self)
+        try:
+            return self._full
+        except AttributeError:
+            pass
+        head = self[0]
+        if self._named and isinstance(head, (int, float, str)) and head != "hide":
+            # Named object, the content is exactly what the body evaluates to
+            result = {head: self.body()}
+        else:
+            result = _build(list(self))
+        self._full = result
+        return result
+
+    def body(self):
+        # Equivalent to parse_sexp(self[1:])
+        try:
+            return self._body
+        except AttributeError:
+            pass
+        self._body = _build(self[1:])
+        return self._body
+
+    def _prime(self):
+        # The body evaluates every child the same way the full node does, so
+        # building it here leaves all child values ready for the parent.
+        # Invalid bodies only matter if they are actually used, so errors are
+        # left to be raised on access.
+        items = self[1:]
+        # Items that are all lists surviving _strip_single_element_lists are
+        # plain key value pairs
+        self._named = bool(items)
+        for item in items:
+            if not isinstance(item, list) or len(item) == 1:
+                self._named = False
+                break
+        try:
+            self._body = _build_pairs(items) if self._named else _build(items)
+        except Exception:
+            pass
+
+
+def _build(sexp: List):
+    # parse_sexp for a single level, taking the values of nested lists from
+    # their memoised results instead of recursing into them. `sexp` must be a
+    # list owned by the caller since it is modified in place.
+    if "hide" in sexp:
+        sexp = _normalized_bools(sexp)
+    # Strip single element lists while classifying the items
+    is_list_items = []
+    for i, item in enumerate(sexp):
+        if isinstance(item, list) and len(item) == 1:
+            item = sexp[i] = item[0]
+        is_list_items.append(isinstance(item, list))
+
+    if True not in is_list_items:
+        return _parse_all_strings(sexp)
+    elif not is_list_items[0] and all(is_list_items[1:]):
+        return {sexp[0]: _build(sexp[1:])}
+    first = is_list_items.index(True)
+    if first > 1 and all(is_list_items[first:]):
+        for i, item in enumerate(sexp[1:]):
+            if isinstance(item, str):
+                sexp[i + 1] = ["_required", item]
+        return {sexp[0]: _build(sexp[1:])}
+    elif all(is_list_items):
+        return _build_pairs(sexp)
+    elif len(sexp[0]) == 2 and isinstance(sexp[1], str):
+        return {sexp[0][1]: sexp[1]}
+    raise ValueError("Invalid sexp to parse: ", sexp)
+
+
+def _build_pairs(sexp: List) -> Dict:
+    # The key value pair case of _build, where every item is a list
+    result = {}
+    names = {}
+    for name in [s[0] for s in sexp]:
+        names[name] = names.get(name, 0) + 1
+    for item in sexp:
+        name = item[0]
+        if names[name] > 1:
+            name = _plural(name)
+            if name not in result:
+                result[name] = []
+            if type(item) is _Node:
+                result[name].append(item.body())
+            elif "hide" in item[1:]:
+                result[name].append(_build(item[1:]))
+            else:
+                result[name].append(_parse_all_strings(item[1:]))
+        elif type(item) is _Node:
+            result.update(item.full())
+        elif len(item) == 2 and isinstance(name, str):
+            result[name] = item[1]
+        else:
+            result.update(_parse_all_strings(item))
+    return result
+
+
+def _finish(items: List, nested: bool) -> List:
+    # Lists holding other lists become nodes with their body built up front
+    if not nested:
+        return items
+    node = _Node(items)
+    node._prime()
+    return node
+
+
+def parse_sexp(sexp: List) -> Dict:
+    """Convert a nested S-expression list into dicts
+
+    Lists are rebuilt bottom-up with an explicit stack, so the nesting depth
+    is not limited by the interpreter recursion limit. The input is left
+    unmodified.
+    """
+    if not isinstance(sexp, list):
+        return _parse_sexp_recursive(sexp)
+    # Each frame is [iterator over the source list, rebuilt items, nested]
+    stack = [[iter(sexp), [], False]]
+    while True:
+        frame = stack[-1]
+        for item in frame[0]:
+            if isinstance(item, list):
+                stack.append([iter(item), [], False])
+                break
+            frame[1].append(item)
+        else:
+            stack.pop()
+            node = _finish(frame[1], frame[2])
+            if not stack:
+                break
+            stack[-1][1].append(node)
+            stack[-1][2] = True
+    if type(node) is _Node:
+        return node.full()
+    return _build(node)
+
+
+def read_sexp_from_string(content: str) -> Dict:
+    """Parse S-expression text straight into the dict shape of parse_sexp
+
+    Tokenizing and building happen in a single pass: each list is turned into
+    its dict form when its closing parenthesis is read.
+    """
+    return _read_sexp_from_string(content, {})
+
+
+def _read_sexp_from_string(content: str, atoms: Dict[str, Any]) -> Dict:
+    # `atoms` caches the parsed value of each unquoted token, and can be
+    # shared between calls that parse pieces of the same file
+    root = _read_tree(content, atoms)
+    if type(root) is _Node:
+        return root.full()
+    return _build(list(root))
+
+
+def _read_item_from_string(
+    content: str, atoms: Optional[Dict[str, Any]] = None
+) -> Tuple[Any, Any]:
+    # Parse the text of one item into its name and the value it has in the
+    # list of a repeated key, the shape the list fields of a model receive
+    root = _read_tree(content, {} if atoms is None else atoms)
+    if type(root) is _Node:
+        return root[0], root.body()
+    elif "hide" in root[1:]:
+        return root[0], _build(root[1:])
+    return root[0], _parse_all_strings(root[1:])
+
+
+def _read_tree(content: str, atoms: Dict[str, Any]) -> List:
+    # Tokenize text into nested lists, with the value of each list that
+    # holds other lists built as it is closed, see _Node
+    top = []
+    current = top
+    nested = False
+    stack = []
+    for token in _TOKEN_RE.findall(content):
+        char = token[0]
+        if char == "(":
+            stack.append((current, nested))
+            current = []
+            nested = False
+        elif char == ")":
+            # Unbalanced closing parentheses are ignored
+            if stack:
+                node = _finish(current, nested)
+                current, nested = stack.pop()
+                current.append(node)
+                nested = True
+        elif char == '"' or char == "'":
+            # Quoted tokens keep their quotes, so they never clash with
+            # unquoted atoms in the cache
+            atom = atoms.get(token)
+            if atom is None:
+                atom = _unquote(token)
+                if len(token) <= _MAX_SHARED_STRING:
+                    atoms[token] = atom
+            current.append(atom)
+        else:
+            atom = atoms.get(token, _MISSING)
+            if atom is _MISSING:
+                atom = _parse_atom(token)
+                # NaN never equals itself, so each one has to stay distinct
+                if atom == atom:
+                    atoms[token] = atom
+            current.append(atom)
+
+    # Lists left open at the end of the text are closed implicitly
+    while stack:
+        node = _finish(current, nested)
+        current, nested = stack.pop()
+        current.append(node)
+        nested = True
+
+    return _root(top)
+
+
+def _root(top: List) -> List:
+    root = top[0] if len(top) == 1 else top
+    if not isinstance(root, list):
+        # A lone atom is read as a sequence, matching simp_sexp
+        root = list(root)
+    return root
+
+
+def _read_tree_from_buffer(buffer: Any, atoms: Dict[bytes, Any]) -> List:
+    # _read_tree over UTF-8 bytes, such as a memory-mapped file. Tokens are
+    # matched one at a time rather than all collected first, and only the
+    # atoms that are kept are decoded.
+    top = []
+    current = top
+    nested = False
+    stack = []
+    for match in _BYTES_TOKEN_RE.finditer(buffer):
+        token = match.group()
+        char = token[0]
+        if char == 40:  # (
+            stack.append((current, nested))
+            current = []
+            nested = False
+        elif char == 41:  # )
+            if stack:
+                node = _finish(current, nested)
+                current, nested = stack.pop()
+                current.append(node)
+                nested = True
+        elif char == 34 or char == 39:  # " or '
+            atom = atoms.get(token)
+            if atom is None:
+                text = token
+                if b"\r" in text:
+                    # Newlines as reading the file as text translates them
+                    text = text.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                atom = _unquote(text.decode())
+                if len(token) <= _MAX_SHARED_STRING:
+                    atoms[token] = atom
+            current.append(atom)
+        else:
+            atom = atoms.get(token, _MISSING)
+            if atom is _MISSING:
+                atom = _parse_atom(token.decode())
+                if atom == atom:
+                    atoms[token] = atom
+            current.append(atom)
+
+    while stack:
+        node = _finish(current, nested)
+        current, nested = stack.pop()
+        current.append(node)
+        nested = True
+    return _root(top)
+
+
+def _read_mapped_file(file_path: str) -> Dict:
+    # read_sexp_from_string over the file mapped into memory, so that the
+    # text is never held as a string
+    with open(file_path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            # Empty files cannot be mapped
+            return read_sexp_from_string("")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            root = _read_tree_from_buffer(mapped, {})
+    if type(root) is _Node:
+        return root.full()
+    return _build(list(root))
+
+
+def _top_level_items(content: str) -> Tuple[Optional[str], List[Tuple[str, int, int]]]:
+    # Find the name of the top-level list and the name, start and end of
+    # each item directly inside it. Items are jumped over by matching
+    # parentheses, without tokenizing their content.
+    root = _LIST_NAME_RE.search(content)
+    if root is None:
+        return None, []
+    items = []
+    depth = 0
+    for match in _STRUCTURE_RE.finditer(content, root.start()):
+        token = match.group()
+        if token == "(":
+            depth += 1
+            if depth == 2:
+                start = match.start()
+        elif token == ")":
+            if depth == 2:
+                name = _LIST_NAME_RE.match(content, start)
+                if name is not None:
+                    items.append((name.group(1), start, match.end()))
+            elif depth == 1:
+                break
+            depth -= 1
+        elif token in ('"', "'"):
+            raise ValueError("Unclosed quote in S-expression")
+    return root.group(1), items
+
+
+def _select_items(content: str, names: Iterable[str]) -> str:
+    # Reduce the text to the top-level list holding only the items named in
+    # `names`
+    names = set(names)
+    root, items = _top_level_items(content)
+    if root is None:
+        return content
+    kept = [content[start:end] for name, start, end in items if name in names]
+    return f"({root} {' '.join(kept)})"
+
+
+def read_sexp_from_file(
+    file_path: str, names: Optional[Iterable[str]] = None, memory_map: bool = False
+) -> Dict:
+    """Parse an S-expression file into dicts
+
+    If `names` is given, only the items directly inside the top-level list
+    whose first atom is in `names` are parsed.
+
+    With `memory_map`, the file is mapped into memory and tokenized as UTF-8
+    bytes instead of being read into a string, so that peak memory use is
+    mostly that of the result. Unquoted atoms are then only separated by
+    ASCII whitespace. It cannot be combined with `names`.
+    """
+    if memory_map:
+        if names is not None:
+            raise ValueError("names cannot be combined with memory mapping")
+        return _read_mapped_file(file_path)
     with open(file_path, "r") as f:
         content = f.read()
-    sexp = Sexp(content)
-    return parse_sexp(sexp)
+    if names is not None:
+        content = _select_items(content, names)
+    return read_sexp_from_string(content)
+
+
+def _iter_tokens(f: TextIO, chunk_size: int) -> Iterator[str]:
+    # Tokenize a file a chunk at a time. A token touching the end of the
+    # buffer, or a quote whose string is not closed yet, may continue in the
+    # next chunk so it is carried over instead of being yielded.
+    carry = ""
+    while True:
+        chunk = f.read(chunk_size)
+        buffer = carry + chunk
+        carry = ""
+        for match in _TOKEN_RE.finditer(buffer):
+            token = match.group()
+            if chunk and (match.end() == len(buffer) or token in ('"', "'")):
+                carry = buffer[match.start() :]
+                break
+            yield token
+        if not chunk:
+            return
+
+
+def iter_sexp_events(
+    file_path: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """Stream the S-expression in a file as (event, value) pairs
+
+    Events are OPEN and CLOSE for parentheses, with a value of None, and ATOM
+    for strings and numbers. The file is read in chunks of `chunk_size`
+    characters, so memory use does not depend on the file size, and reading
+    stops as soon as the caller stops iterating.
+    """
+    depth = 0
+    with open(file_path, "r") as f:
+        for token in _iter_tokens(f, chunk_size):
+            char = token[0]
+            if char == "(":
+                depth += 1
+                yield OPEN, None
+            elif char == ")":
+                # Unbalanced closing parentheses are ignored
+                if depth:
+                    depth -= 1
+                    yield CLOSE, None
+            elif char == '"' or char == "'":
+                yield ATOM, _unquote(token)
+            else:
+                yield ATOM, _parse_atom(token)
+    # Lists left open at the end of the file are closed implicitly
+    for _ in range(depth):
+        yield CLOSE, None
+
+
+def _collect_list(events: Iterator[Tuple[str, Any]], items: List) -> bool:
+    # Gather the events up to the CLOSE of an already opened list into
+    # nested lists, returning whether it holds other lists
+    stack = []
+    current = items
+    nested = False
+    for event, value in events:
+        if event == ATOM:
+            current.append(value)
+        elif event == OPEN:
+            stack.append((current, nested))
+            current = []
+            nested = False
+        elif stack:
+            child = current
+            current, nested = stack.pop()
+            current.append(child)
+            nested = True
+        else:
+            break
+    return nested
+
+
+def _iter_top_level_items(
+    file_path: str, names: Iterable[str], chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[List, bool]]:
+    # Yield the items directly inside the top-level list whose first atom is
+    # in `names` as nested lists, along with whether they hold other lists.
+    # Every other item is skipped without being built.
+    names = set(names)
+    events = iter_sexp_events(file_path, chunk_size)
+    depth = 0
+    try:
+        for event, value in events:
+            if event == CLOSE:
+                depth -= 1
+            elif event == OPEN:
+                depth += 1
+                if depth != 2:
+                    continue
+                # Items are identified by their first atom
+                event, value = next(events, (CLOSE, None))
+                if event == OPEN:
+                    depth += 1
+                    continue
+                elif event == CLOSE:
+                    depth -= 1
+                    continue
+                elif value not in names:
+                    continue
+                item = [value]
+                nested = _collect_list(events, item)
+                depth -= 1
+                # A lone atom is not a key value pair
+                if len(item) > 1:
+                    yield item, nested
+    finally:
+        events.close()
+
+
+def read_sexp_fields(
+    file_path: str, names: Iterable[str], chunk_size: int = CHUNK_SIZE
+) -> Dict:
+    """Parse only the named items directly inside the top-level list
+
+    Returns a dict shaped like the content of the top-level list from
+    read_sexp_from_file, holding the first item found for each name. Other
+    items are skipped without being parsed and reading stops once every name
+    has been found.
+    """
+    wanted = set(names)
+    result = {}
+    items = _iter_top_level_items(file_path, wanted, chunk_size)
+    for item, nested in items:
+        if item[0] not in wanted:
+            continue
+        elif nested:
+            result.update(parse_sexp(item))
+        else:
+            result.update(_parse_all_strings(item))
+        wanted.discard(item[0])
+        if not wanted:
+            items.close()
+            break
+    return result
+
+
+def _iter_models(file_path: str, name: str, model: Type[BaseModel]) -> Iterator:
+    # Items are validated from the same dict a Schematic list field receives
+    for item, _ in _iter_top_level_items(file_path, [name]):
+        yield model.model_validate(parse_sexp(item[1:]))
+
+
+def iter_wires(file_path: str) -> Iterator[sch_types.Wire]:
+    """Yield the wires of a schematic one at a time"""
+    return _iter_models(file_path, "wire", sch_types.Wire)
+
+
+def iter_junctions(file_path: str) -> Iterator[sch_types.Junction]:
+    """Yield the junctions of a schematic one at a time"""
+    return _iter_models(file_path, "junction", sch_types.Junction)
+
+
+def iter_symbols(file_path: str) -> Iterator[sch_types.SchematicSymbol]:
+    """Yield the symbols placed in a schematic one at a time"""
+    return _iter_models(file_path, "symbol", sch_types.SchematicSymbol)
+
+
+def iter_labels(file_path: str) -> Iterator[sch_types.Label]:
+    """Yield the local labels of a schematic one at a time"""
+    return _iter_models(file_path, "label", sch_types.Label)
+
+
+def iter_global_labels(file_path: str) -> Iterator[sch_types.Label]:
+    """Yield the global labels of a schematic one at a time"""
+    return _iter_models(file_path, "global_label", sch_types.Label)
+
+
+def iter_hierarchical_labels(file_path: str) -> Iterator[sch_types.Label]:
+    """Yield the hierarchical labels of a schematic one at a time"""
+    return _iter_models(file_path, "hierarchical_label", sch_types.Label)
+
+
+def _schematic_item_names(fields: Iterable[str]) -> List[str]:
+    # The item names to keep in the file to load the given Schematic fields
+    unknown = set(fields) - set(sch_types.Schematic.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown schematic fields: {sorted(unknown)}")
+    required = [
+        name
+        for name, field in sch_types.Schematic.model_fields.items()
+        if field.is_required()
+    ]
+    return [_SCHEMATIC_ITEMS.get(f, f) for f in [*required, *fields]]
+
+
+def _lazy_schematic(
+    content: str, trusted: bool, flyweight: bool, point_tuples: bool
+) -> LazySchematic:
+    # Only the positions of the items are found here. Each field is parsed
+    # later from its items and the required header items, which are small.
+    root, items = _top_level_items(content)
+    required = set(_schematic_item_names([]))
+    header = [content[start:end] for name, start, end in items if name in required]
+    texts: Dict[str, List[str]] = {}
+    for name, start, end in items:
+        if name not in required:
+            texts.setdefault(name, []).append(content[start:end])
+
+    # Shared by every field, so that equal values are shared between them
+    pool = LeafPool(trusted) if flyweight else None
+
+    def build(item_texts: List[str]) -> sch_types.Schematic:
+        text = f"({root} {' '.join(header + item_texts)})"
+        parsed = read_sexp_from_string(text)[root]
+        return _build_schematic(parsed, trusted, pool, point_tuples)
+
+    def load(field: str) -> Tuple[Any, bool]:
+        schematic = build(texts.get(_SCHEMATIC_ITEMS.get(field, field), []))
+        return schematic.__dict__[field], field in schematic.model_fields_set
+
+    schematic = build([])
+    lazy = LazySchematic.model_construct(
+        schematic.model_fields_set,
+        **{name: schematic.__dict__[name] for name in required},
+    )
+    for name in LazySchematic.model_fields:
+        if name not in required:
+            del lazy.__dict__[name]
+    lazy._loader = load
+    return lazy
+
+
+def _build_schematic(
+    parsed: Dict,
+    trusted: bool,
+    pool: Optional[LeafPool] = None,
+    point_tuples: bool = False,
+) -> sch_types.Schematic:
+    # `parsed` is the content of the kicad_sch list
+    if pool is not None:
+        parsed = pool.share(parsed)
+    if point_tuples:
+        return construct(sch_types.Schematic, parsed, _POINT_TUPLES)
+    if trusted:
+        return construct(sch_types.Schematic, parsed)
+    return sch_types.Schematic(**parsed)
+
+
+def _build_netlist(parsed: Dict, trusted: bool) -> kicad_netlist.Netlist:
+    if trusted:
+        return construct(kicad_netlist.Netlist, parsed.get("export"))
+    return kicad_netlist.Netlist(**parsed.get("export"))
+
+
+def read_in_schematic_from_string(
+    content: str,
+    *,
+    fields: Optional[Iterable[str]] = None,
+    trusted: bool = False,
+    lazy: bool = False,
+    flyweight: bool = False,
+    point_tuples: bool = False,
+) -> sch_types.Schematic:
+    """Parse the text of a KiCad schematic, see read_in_schematic_from_kicad_sch"""
+    if point_tuples and not trusted:
+        raise ValueError("point_tuples can only be used with trusted loading")
+    if lazy:
+        if fields is not None:
+            raise ValueError("fields cannot be combined with lazy loading")
+        return _lazy_schematic(content, trusted, flyweight, point_tuples)
+    if fields is not None:
+        content = _select_items(content, _schematic_item_names(fields))
+    return _build_schematic(
+        read_sexp_from_string(content).get("kicad_sch"),
+        trusted,
+        LeafPool(trusted) if flyweight else None,
+        point_tuples,
+    )
+
+
+def read_in_schematic_from_kicad_sch(
+    file_path: str,
+    *,
+    fields: Optional[Iterable[str]] = None,
+    trusted: bool = False,
+    lazy: bool = False,
+    memory_map: bool = False,
+    flyweight: bool = False,
+    point_tuples: bool = False,
+) -> sch_types.Schematic:
+    """Read and parse a KiCad schematic file
+
+    `fields` limits loading to the given Schematic fields, such as
+    {"symbols", "wires"}. The required header fields are always loaded and
+    every other field is left at its default without being parsed.
+
+    With `trusted`, the models are built without being validated, which is
+    only safe for files that are known to be valid.
+
+    With `lazy`, a LazySchematic is returned: only the header is parsed up
+    front, and every other field is parsed and validated when it is first
+    read. It cannot be combined with `fields`.
+
+    With `memory_map`, the file is parsed straight from memory-mapped bytes,
+    see read_sexp_from_file. It cannot be combined with `fields` or `lazy`.
+
+    With `flyweight`, equal text effects and strokes are built once and
+    shared as frozen models, see pykicad.models.flyweight.
+
+    With `point_tuples`, points and positions, such as the points of wires
+    and the positions of symbols, labels and properties, are loaded as
+    PointTuple and PositionTuple instead of Point and Position. These are
+    named tuples with the same attributes, which are much smaller and
+    quicker to build. Pydantic cannot validate tuples in place of models,
+    so it requires `trusted`. model_dump writes the tuples like the models.
+    """
+    if point_tuples and not trusted:
+        raise ValueError("point_tuples can only be used with trusted loading")
+    if memory_map:
+        if fields is not None or lazy:
+            raise ValueError("fields and lazy cannot be combined with memory mapping")
+        return _build_schematic(
+            _read_mapped_file(file_path).get("kicad_sch"),
+            trusted,
+            LeafPool(trusted) if flyweight else None,
+            point_tuples,
+        )
+    with open(file_path, "r") as f:
+        content = f.read()
+    return read_in_schematic_from_string(
+        content,
+        fields=fields,
+        trusted=trusted,
+        lazy=lazy,
+        flyweight=flyweight,
+        point_tuples=point_tuples,
+    )
+
+
+def read_in_netlist_from_string(
+    content: str, trusted: bool = False
+) -> kicad_netlist.Netlist:
+    """Parse the text of a KiCad netlist, see read_in_netlist_from_netlist"""
+    return _build_netlist(read_sexp_from_string(content), trusted)
+
+
+def read_in_netlist_from_netlist(
+    file_path: str, trusted: bool = False, memory_map: bool = False
+) -> kicad_netlist.Netlist:
+    """Read and parse a KiCad netlist file
+
+    With `trusted`, the models are built without being validated, which is
+    only safe for files that are known to be valid.
+
+    With `memory_map`, the file is parsed straight from memory-mapped bytes,
+    see read_sexp_from_file.
+    """
+    if memory_map:
+        return _build_netlist(_read_mapped_file(file_path), trusted)
+    with open(file_path, "r") as f:
+        content = f.read()
+    return read_in_netlist_from_string(content, trusted)
+
+
+class NetlistStream(NamedTuple):
+    """The header of a netlist and an iterator over the rest of its items"""
+
+    version: str
+    design: kicad_netlist.Design
+    items: Iterator[
+        Union[kicad_netlist.Component, kicad_netlist.LibPart, kicad_netlist.Net]
+    ]
+
+
+def _iter_netlist_items(file_path: str, chunk_size: int) -> Iterator[str]:
+    # Yield the text of the version and design items of a netlist, and of
+    # each item inside its components, libparts and nets. The file is read a
+    # chunk at a time and items are found by matching parentheses, so only
+    # the item being read is kept in memory.
+    depth = 0
+    # Start in the buffer of the open item directly inside the top-level
+    # list, until its name is known, and of the item being kept
+    outer_start: Optional[int] = None
+    outer_name: Optional[str] = None
+    start: Optional[int] = None
+    buffer = ""
+    position = 0
+    with open(file_path, "r") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            drop = min(p for p in (position, outer_start, start) if p is not None)
+            buffer = buffer[drop:] + chunk
+            position -= drop
+            if outer_start is not None:
+                outer_start -= drop
+            if start is not None:
+                start -= drop
+            for match in _STRUCTURE_RE.finditer(buffer, position):
+                token = match.group()
+                if chunk and token in ('"', "'"):
+                    # The string continues in the next chunk
+                    break
+                position = match.end()
+                if token == "(":
+                    depth += 1
+                    if depth == 2:
+                        outer_start, outer_name = match.start(), None
+                    elif depth == 3 and outer_start is not None:
+                        outer_name = _LIST_NAME_RE.match(buffer, outer_start).group(1)
+                        if outer_name in _NETLIST_CONTAINERS:
+                            outer_start = None
+                            start = match.start()
+                        elif outer_name not in ("version", "design"):
+                            outer_start = None
+                    elif depth == 3 and outer_name in _NETLIST_CONTAINERS:
+                        start = match.start()
+                elif token == ")":
+                    if depth == 3 and start is not None:
+                        yield buffer[start : match.end()]
+                        start = None
+                    elif depth == 2 and outer_start is not None:
+                        name = _LIST_NAME_RE.match(buffer, outer_start)
+                        if name is not None and name.group(1) in ("version", "design"):
+                            yield buffer[outer_start : match.end()]
+                        outer_start = None
+                    elif depth == 1:
+                        return
+                    depth = max(depth - 1, 0)
+                elif token in ('"', "'"):
+                    raise ValueError("Unclosed quote in S-expression")
+            if not chunk:
+                return
+
+
+def _iter_netlist_models(
+    texts: Iterator[str], first: Optional[str], trusted: bool
+) -> Iterator[
+    Union[kicad_netlist.Component, kicad_netlist.LibPart, kicad_netlist.Net]
+]:
+    atoms = {}
+    try:
+        text = first
+        while text is not None:
+            if len(atoms) > _MAX_SHARED_ATOMS:
+                atoms.clear()
+            # Items are validated from the same dict a Netlist list field
+            # receives
+            name, data = _read_item_from_string(text, atoms)
+            model = _NETLIST_MODELS.get(name)
+            if model is not None:
+                yield construct(model, data) if trusted else model.model_validate(data)
+            text = next(texts, None)
+    finally:
+        texts.close()
 
 
-def read_in_schematic_from_kicad_sch(file_path: str) -> sch_types.Schematic:
-    parsed = read_sexp_from_file(file_path)
-    return sch_types.Schematic(**parsed.get("kicad_sch"))
+def stream_netlist(
+    file_path: str, trusted: bool = False, chunk_size: int = CHUNK_SIZE
+) -> NetlistStream:
+    """Read a KiCad netlist one component, libpart and net at a time
 
+    The version and design are read up front, as they come first in the
+    file. The returned `items` then yields a Component, LibPart or Net model
+    for each item in the file, in file order, reading the file as it goes so
+    that memory use does not depend on the size of the netlist. Libraries
+    are skipped.
 
-def read_in_netlist_from_netlist(file_path: str):
-    """Read and parse a KiCad netlist file"""
-    parsed = read_sexp_from_file(file_path)
-    netlist = parsed.get("export")
-    return kicad_netlist.Netlist(**netlist)
+    With `trusted`, the models are built without being validated, which is
+    only safe for files that are known to be valid.
+    """
+    texts = _iter_netlist_items(file_path, chunk_size)
+    header = {}
+    text = next(texts, None)
+    while text is not None:
+        item = read_sexp_from_string(text)
+        if next(iter(item)) not in ("version", "design"):
+            break
+        header.update(item)
+        text = next(texts, None)
+    if "version" not in header or "design" not in header:
+        texts.close()
+        raise ValueError(f"{file_path} has no netlist version and design")
+    if trusted:
+        design = construct(kicad_netlist.Design, header["design"])
+    else:
+        design = kicad_netlist.Design.model_validate(header["design"])
+    return NetlistStream(
+        version=str(header["version"]),
+        design=design,
+        items=_iter_netlist_models(texts, text, trusted),
+    )
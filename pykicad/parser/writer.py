@@ -0,0 +1,149 @@
+from typing import Any, List, Optional
+
+import pykicad.models.netlist as kicad_netlist
+
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
+def _quote(value: Any) -> str:
+    return '"' + str(value).translate(_ESCAPES) + '"'
+
+
+def format_sexp(sexp: list, indent: int = 0) -> str:
+    """Format a nested list as KiCad formats its files
+
+    The first item of each list is written as a bare symbol and every other
+    atom as a quoted string. Lists holding other lists are split over
+    several lines, indented with tabs.
+    """
+    head, items = sexp[0], sexp[1:]
+    if not any(isinstance(item, list) for item in items):
+        return "(" + " ".join([str(head)] + [_quote(item) for item in items]) + ")"
+    inner = "\t" * (indent + 1)
+    lines = [f"({head}"]
+    for item in items:
+        if isinstance(item, list):
+            lines.append(inner + format_sexp(item, indent + 1))
+        else:
+            lines.append(inner + _quote(item))
+    lines.append("\t" * indent + ")")
+    return "\n".join(lines)
+
+
+def _optional(name: str, value: Optional[Any]) -> List[list]:
+    return [] if value is None else [[name, value]]
+
+
+def _container(name: str, items: List[list]) -> List[list]:
+    # Empty containers are left out, as the parser cannot read them
+    return [[name] + items] if items else []
+
+
+def _title_block(title_block: kicad_netlist.TitleBlock) -> list:
+    sexp = ["title_block"]
+    for name in ("title", "company", "rev", "date", "source"):
+        sexp += _optional(name, getattr(title_block, name))
+    for comment in title_block.comments:
+        sexp.append(["comment", ["number", comment.number], ["value", comment.value]])
+    return sexp
+
+
+def _component(component: kicad_netlist.Component) -> list:
+    sexp = ["comp", ["ref", component.refdes], ["value", component.value]]
+    sexp += _optional("footprint", component.footprint)
+    sexp += _optional("datasheet", component.datasheet)
+    sexp += _container(
+        "fields",
+        [["field", ["name", name], value] for name, value in component.fields.items()],
+    )
+    libsource = component.libsource
+    sexp.append(
+        [
+            "libsource",
+            ["lib", libsource.lib],
+            ["part", libsource.part],
+            ["description", libsource.description],
+        ]
+    )
+    for name, value in component.property.items():
+        sexp.append(["property", ["name", name], ["value", value]])
+    sheetpath = component.sheetpath
+    sexp.append(
+        ["sheetpath", ["names", sheetpath.names], ["tstamps", sheetpath.tstamps]]
+    )
+    return sexp
+
+
+def _libpart(libpart: kicad_netlist.LibPart) -> list:
+    sexp = [
+        "libpart",
+        ["lib", libpart.lib],
+        ["part", libpart.part],
+        ["description", libpart.description],
+    ]
+    sexp += _optional("docs", libpart.docs)
+    sexp += _container("footprints", [["fp", fp] for fp in libpart.footprints])
+    sexp += _container(
+        "fields",
+        [["field", ["name", name], value] for name, value in libpart.fields.items()],
+    )
+    sexp += _container(
+        "pins",
+        [
+            ["pin", ["num", pin.index], ["name", pin.name], ["type", pin.type]]
+            for pin in libpart.pins
+        ],
+    )
+    return sexp
+
+
+def _net(net: kicad_netlist.Net) -> list:
+    sexp = ["net", ["code", net.code], ["name", net.name], ["class", net.class_name]]
+    for node in net.nodes:
+        node_sexp = ["node", ["ref", node.ref], ["pin", node.pin]]
+        node_sexp += _optional("pinfunction", node.pinfunction)
+        node_sexp += _optional("pintype", node.pintype)
+        sexp.append(node_sexp)
+    return sexp
+
+
+def netlist_to_sexp(netlist: kicad_netlist.Netlist) -> list:
+    """Convert a Netlist into the nested lists of a KiCad netlist file"""
+    design = netlist.design
+    sheet = design.sheet
+    sexp = [
+        "export",
+        ["version", netlist.version],
+        [
+            "design",
+            ["source", design.source],
+            ["date", design.date],
+            ["tool", design.tool],
+            [
+                "sheet",
+                ["number", sheet.number],
+                ["name", sheet.name],
+                ["tstamps", sheet.tstamps],
+                _title_block(sheet.title_block),
+            ],
+        ],
+    ]
+    sexp += _container("components", [_component(c) for c in netlist.components])
+    sexp += _container("libparts", [_libpart(p) for p in netlist.libparts])
+    if netlist.libraries is not None:
+        library = netlist.libraries
+        entry = ["library", ["logical", library.logical], ["uri", library.uri]]
+        sexp.append(["libraries", entry])
+    sexp += _container("nets", [_net(net) for net in netlist.nets])
+    return sexp
+
+
+def write_netlist_to_string(netlist: kicad_netlist.Netlist) -> str:
+    """Format a Netlist as the text of a KiCad netlist file"""
+    return format_sexp(netlist_to_sexp(netlist)) + "\n"
+
+
+def write_netlist_to_netlist(netlist: kicad_netlist.Netlist, file_path: str):
+    """Write a Netlist to a KiCad netlist file"""
+    with open(file_path, "w") as f:
+        f.write(write_netlist_to_string(netlist))
@@ -0,0 +1,36 @@
+"""Fixtures shared by the tests"""
+
+import pytest
+
+from pykicad.models.schematic import Position, Wire
+from pykicad.parser.kicad_sexp import read_in_schematic_from_kicad_sch
+
+
+@pytest.fixture
+def schematic():
+    """The sample schematic, loaded again for each test"""
+    return read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+
+
+@pytest.fixture
+def place_symbol():
+    """A function copying a schematic with its first symbol placed differently"""
+
+    def place(schematic, angle, mirror=None):
+        symbol = schematic.symbols[0].model_copy(
+            update={"at": Position(x=100, y=90, angle=angle), "mirror": mirror}
+        )
+        return schematic.model_copy(update={"symbols": [symbol]})
+
+    return place
+
+
+@pytest.fixture
+def make_wire():
+    """A function building a straight wire between two points"""
+
+    def make(x1, y1, x2, y2):
+        stroke = {"width": 0, "type": "default"}
+        return Wire(pts={"xy": [[x1, y1], [x2, y2]]}, stroke=stroke)
+
+    return make
@@ -0,0 +1,53 @@
+import pytest
+
+from pykicad.parser.batch import (LoadResult, read_many_netlists,
+                                  read_many_schematics)
+from pykicad.parser.kicad_sexp import (read_in_netlist_from_netlist,
+                                       read_in_schematic_from_kicad_sch)
+
+
+@pytest.fixture
+def paths(tmp_path):
+    broken = tmp_path / "broken.kicad_sch"
+    broken.write_text("(kicad_sch (version 1))")
+    missing = tmp_path / "missing.kicad_sch"
+    return ["testdata/sample.kicad_sch", str(broken), str(missing)]
+
+
+class TestReadManySchematics:
+    """Test loading schematics in parallel"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_input_order(self, paths, workers):
+        """Test results follow the input order and errors are reported"""
+        results = list(read_many_schematics(paths * 2, workers=workers))
+        assert [r.path for r in results] == paths * 2
+
+        expected = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        for sample, broken, missing in [results[:3], results[3:]]:
+            assert sample == LoadResult(paths[0], model=expected)
+            assert broken.model is None
+            assert isinstance(broken.error, ValueError)
+            assert isinstance(missing.error, FileNotFoundError)
+
+    def test_as_completed(self, paths):
+        """Test unordered results cover every path"""
+        results = list(read_many_schematics(paths, workers=2, ordered=False))
+        assert sorted(r.path for r in results) == sorted(paths)
+
+    def test_fields(self, paths):
+        """Test fields are passed on to the loader"""
+        (result,) = read_many_schematics(paths[:1], workers=2, fields={"wires"})
+        assert len(result.model.wires) == 2
+        assert result.model.symbols == []
+
+
+class TestReadManyNetlists:
+    """Test loading netlists in parallel"""
+
+    def test_netlists(self):
+        """Test netlists load the same as one at a time"""
+        results = list(read_many_netlists(["testdata/sample.net"] * 3, workers=2))
+        expected = read_in_netlist_from_netlist("testdata/sample.net")
+        assert [r.model for r in results] == [expected] * 3
+        assert all(r.error is None for r in results)
@@ -0,0 +1,570 @@
+"""Timing comparisons between parser implementations
+
+Each benchmark checks that the implementations agree and prints how long
+they took. They are left out of the default run, so run them with
+`pytest tests/test_benchmarks.py -m benchmark -s` to see the timings.
+"""
+
+import copy
+import gc
+import os
+import time
+import tracemalloc
+
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, model_validator
+from simp_sexp import Sexp
+
+from pykicad.models.connectivity import compute_nets
+from pykicad.models.netlist import Netlist
+from pykicad.models.schematic import (Point, Points, PointTuple, Position,
+                                      Schematic)
+from pykicad.models.trusted import construct
+from pykicad.parser import item_index, kicad_sexp
+from pykicad.parser.design import read_in_design
+from pykicad.parser.incremental import update
+from pykicad.parser.kicad_sexp import (_parse_sexp_recursive, parse_sexp,
+                                       read_sexp_from_file,
+                                       read_in_netlist_from_netlist,
+                                       read_in_schematic_from_string,
+                                       stream_netlist)
+from pykicad.parser.writer import write_netlist_to_netlist
+
+pytestmark = pytest.mark.benchmark
+
+SAMPLE_FILE = "testdata/sample.kicad_sch"
+
+
+def _best_time(func, make_input, repeat=5):
+    """Return the fastest of several runs, preparing a fresh input for each"""
+    best = float("inf")
+    for _ in range(repeat):
+        data = make_input()
+        gc.collect()
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _large_schematic(copies=50):
+    """Build a larger schematic by repeating the items of the sample file"""
+    with open(SAMPLE_FILE) as f:
+        content = f.read()
+    start = content.index("\t(junction")
+    end = content.rindex(")")
+    return content[:start] + content[start:end] * copies + ")\n"
+
+
+class _SchemaPosition(BaseModel):
+    """Position decoded by generating the JSON schema for every instance"""
+
+    x: float
+    y: float
+    angle: float
+
+    @model_validator(mode="before")
+    @classmethod
+    def convert(cls, data: list) -> Any:
+        var_names = cls.model_json_schema()["properties"].keys()
+        return dict(zip(var_names, data))
+
+
+class TestParseSexpBenchmark:
+    """Compare the iterative parse_sexp with the recursive implementation"""
+
+    def test_iterative_vs_recursive(self):
+        """Time both implementations on a large schematic"""
+        sexp = Sexp(_large_schematic())
+        assert repr(parse_sexp(sexp)) == repr(_parse_sexp_recursive(copy.deepcopy(sexp)))
+
+        recursive = _best_time(_parse_sexp_recursive, lambda: copy.deepcopy(sexp))
+        iterative = _best_time(parse_sexp, lambda: sexp)
+        print(f"\nparse_sexp recursive: {recursive:.4f}s iterative: {iterative:.4f}s")
+
+
+class TestPositionalModelBenchmark:
+    """Compare positional decoding with generating the schema per instance"""
+
+    def test_position_construction(self):
+        """Time building Position models from positional lists"""
+        values = [[i, i / 2, 90] for i in range(2000)]
+        assert [_SchemaPosition.model_validate(v).model_dump() for v in values] == [
+            Position.model_validate(v).model_dump() for v in values
+        ]
+
+        def build(model):
+            return lambda data: [model.model_validate(v) for v in data]
+
+        schema = _best_time(build(_SchemaPosition), lambda: values, repeat=3)
+        positional = _best_time(build(Position), lambda: values, repeat=3)
+        print(
+            f"\nPosition per instance schema: {schema / len(values) * 1e6:.2f}us "
+            f"positional: {positional / len(values) * 1e6:.2f}us"
+        )
+
+
+def _wire_grid(segments):
+    """Build a schematic of rows of touching wires, one net per row"""
+    columns = int(segments**0.5)
+    wires = []
+    for i in range(segments):
+        row, column = divmod(i, columns)
+        x, y = column * 2.54, row * 2.54
+        wires.append(
+            {
+                "pts": {"xy": [[x, y], [x + 2.54, y]]},
+                "stroke": {"width": 0, "type": "default"},
+            }
+        )
+    header = {"version": 1, "generator": "", "generator_version": "", "uuid": ""}
+    return construct(Schematic, dict(header, paper="A4", wires=wires)), columns
+
+
+class TestConnectivityBenchmark:
+    """Check connectivity scales close to linearly with the number of wires"""
+
+    def test_compute_nets(self):
+        """Time compute_nets on increasingly large schematics"""
+        for segments in (10_000, 100_000):
+            schematic, columns = _wire_grid(segments)
+            elapsed = _best_time(compute_nets, lambda: schematic, repeat=1)
+            assert len(compute_nets(schematic)) == -(-segments // columns)
+            print(
+                f"\ncompute_nets {segments} segments: {elapsed:.3f}s "
+                f"({elapsed / segments * 1e6:.2f}us per segment)"
+            )
+
+
+def _large_netlist(components):
+    """Build a netlist of two-pin components chained into one net per pin"""
+    design = {
+        "source": "",
+        "date": "",
+        "tool": "",
+        "sheet": {
+            "number": "1",
+            "name": "/",
+            "tstamps": "/",
+            "title_block": {"source": "large.net"},
+        },
+    }
+    comps = [
+        {
+            "ref": f"R{i}",
+            "value": "10k",
+            "libsource": {"lib": "Device", "part": "R", "description": ""},
+            "sheetpath": {"names": "/", "tstamps": "/"},
+        }
+        for i in range(components)
+    ]
+    nets = [
+        {
+            "code": str(i + 1),
+            "name": f"N{i}",
+            "class_name": "Default",
+            "nodes": [{"ref": f"R{i}", "pin": "2"}, {"ref": f"R{i + 1}", "pin": "1"}],
+        }
+        for i in range(components - 1)
+    ]
+    return construct(
+        Netlist, {"version": "E", "design": design, "components": comps, "nets": nets}
+    )
+
+
+class TestNetlistIndexBenchmark:
+    """Compare indexed netlist lookups with scanning the lists"""
+
+    def test_net_of_every_pin(self):
+        """Time finding the net of every pin"""
+        netlist = _large_netlist(20_000)
+        pins = [(c.refdes, pin) for c in netlist.components[:500] for pin in "12"]
+
+        def scan(pins):
+            return [
+                next(
+                    (
+                        net
+                        for net in netlist.nets
+                        if any(n.ref == ref and n.pin == pin for n in net.nodes)
+                    ),
+                    None,
+                )
+                for ref, pin in pins
+            ]
+
+        def indexed(pins):
+            return [netlist.net_of_pin(ref, pin) for ref, pin in pins]
+
+        assert indexed(pins) == scan(pins)
+        scan_time = _best_time(scan, lambda: pins, repeat=1)
+        indexed_time = _best_time(indexed, lambda: pins)
+        print(
+            f"\nnet_of_pin for {len(pins)} pins: scanning {scan_time:.3f}s, "
+            f"indexed {indexed_time:.4f}s"
+        )
+
+
+def _peak_memory(func):
+    """Return the result of func and the peak memory it allocated"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _retained_memory(func):
+    """Return the result of func and the memory still allocated for it"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+class TestStreamNetlistBenchmark:
+    """Compare streaming a netlist with loading it whole"""
+
+    def test_stream_vs_load(self, tmp_path):
+        """Count the nodes of a large netlist both ways"""
+        path = str(tmp_path / "large.net")
+        write_netlist_to_netlist(_large_netlist(10_000), path)
+
+        def load(path):
+            netlist = read_in_netlist_from_netlist(path)
+            return sum(len(net.nodes) for net in netlist.nets)
+
+        def stream(path):
+            items = stream_netlist(path).items
+            return sum(len(item.nodes) for item in items if hasattr(item, "nodes"))
+
+        loaded, load_peak = _peak_memory(lambda: load(path))
+        streamed, stream_peak = _peak_memory(lambda: stream(path))
+        assert streamed == loaded
+        # Loading holds many times the size of the file, while streaming
+        # holds about one item at a time. The bound is loose, as tracemalloc
+        # peaks vary between runs.
+        assert stream_peak < os.path.getsize(path) < load_peak
+        load_time = _best_time(load, lambda: path, repeat=1)
+        stream_time = _best_time(stream, lambda: path, repeat=1)
+        print(
+            f"\nload: {load_time:.2f}s, {load_peak / 1e6:.1f}MB peak; "
+            f"stream: {stream_time:.2f}s, {stream_peak / 1e6:.1f}MB peak"
+        )
+
+
+class TestLazySchematicBenchmark:
+    """Compare loading a whole schematic with loading one section lazily"""
+
+    def test_lazy_vs_eager(self):
+        """Time reading the wires of a large schematic both ways"""
+        content = _large_schematic(copies=200)
+
+        def eager(content):
+            return read_in_schematic_from_string(content).wires
+
+        def lazy(content):
+            return read_in_schematic_from_string(content, lazy=True).wires
+
+        assert lazy(content) == eager(content)
+        eager_time = _best_time(eager, lambda: content)
+        lazy_time = _best_time(lazy, lambda: content)
+        print(
+            f"\nwires of a {len(content) / 1e6:.1f}MB schematic: "
+            f"eager {eager_time:.3f}s, lazy {lazy_time:.3f}s"
+        )
+
+
+class TestItemIndexBenchmark:
+    """Compare reading one item by UUID with loading the whole schematic"""
+
+    def test_get_element_by_uuid(self, tmp_path):
+        """Time fetching the last symbol of a large schematic"""
+        content = _large_schematic(copies=200)
+        path = str(tmp_path / "large.kicad_sch")
+        with open(path, "w") as f:
+            f.write(content)
+        uuid = read_in_schematic_from_string(content).symbols[-1].uuid
+
+        def full(path):
+            with open(path) as f:
+                schematic = read_in_schematic_from_string(f.read())
+            return [s for s in schematic.symbols if s.uuid == uuid][0]
+
+        def indexed(path):
+            return item_index.get_element_by_uuid(path, uuid, sidecar=True)
+
+        build_time = _best_time(item_index.ItemIndex.build, lambda: path, repeat=1)
+        assert indexed(path) == full(path)
+        full_time = _best_time(full, lambda: path)
+        indexed_time = _best_time(indexed, lambda: path)
+        item_index.clear_indexes()
+        sidecar_time = _best_time(
+            lambda path: item_index.index_file(path, sidecar=True),
+            lambda: path,
+            repeat=1,
+        )
+        print(
+            f"\nsymbol by uuid: full load {full_time:.3f}s, "
+            f"indexed {indexed_time * 1e3:.2f}ms "
+            f"(scan {build_time:.3f}s once, sidecar load {sidecar_time * 1e3:.1f}ms)"
+        )
+
+
+class TestMemoryMapBenchmark:
+    """Compare parsing a file from a string with parsing it memory-mapped"""
+
+    def test_memory_map_vs_read(self, tmp_path):
+        """Parse a large netlist both ways"""
+        path = str(tmp_path / "large.net")
+        write_netlist_to_netlist(_large_netlist(10_000), path)
+
+        def read(path):
+            return read_sexp_from_file(path)
+
+        def mapped(path):
+            return read_sexp_from_file(path, memory_map=True)
+
+        read_result, read_peak = _peak_memory(lambda: read(path))
+        mapped_result, mapped_peak = _peak_memory(lambda: mapped(path))
+        assert mapped_result == read_result
+        # The mapped parse never holds the text of the file as a string
+        assert mapped_peak < read_peak
+        read_time = _best_time(read, lambda: path, repeat=3)
+        mapped_time = _best_time(mapped, lambda: path, repeat=3)
+        print(
+            f"\nparse: read {read_time:.2f}s, {read_peak / 1e6:.1f}MB peak; "
+            f"memory mapped {mapped_time:.2f}s, {mapped_peak / 1e6:.1f}MB peak"
+        )
+
+
+class TestSharedStringsBenchmark:
+    """Compare a parsed schematic with and without sharing repeated strings"""
+
+    def test_shared_vs_distinct(self, monkeypatch):
+        """Measure the memory a parsed large schematic holds on to"""
+        content = _large_schematic(copies=200)
+
+        def load(content):
+            return read_in_schematic_from_string(content)
+
+        shared, shared_size = _retained_memory(lambda: load(content))
+        shared_time = _best_time(load, lambda: content, repeat=3)
+        monkeypatch.setattr(kicad_sexp, "_MAX_SHARED_STRING", 0)
+        distinct, distinct_size = _retained_memory(lambda: load(content))
+        distinct_time = _best_time(load, lambda: content, repeat=3)
+        assert shared == distinct
+        # The saving is small next to the models, so this only checks that
+        # sharing does not cost memory, allowing for tracemalloc noise
+        assert shared_size < distinct_size * 1.1
+        print(
+            f"\nparsed schematic: distinct strings {distinct_size / 1e6:.1f}MB "
+            f"in {distinct_time:.3f}s, shared {shared_size / 1e6:.1f}MB "
+            f"in {shared_time:.3f}s"
+        )
+
+
+class TestFlyweightBenchmark:
+    """Compare loading a schematic with and without shared effects and strokes"""
+
+    def test_flyweight_vs_plain(self):
+        """Measure time and retained memory of both loads, validated and trusted"""
+        content = _large_schematic(copies=200)
+        for trusted in (False, True):
+
+            def plain(content):
+                return read_in_schematic_from_string(content, trusted=trusted)
+
+            def shared(content):
+                return read_in_schematic_from_string(
+                    content, trusted=trusted, flyweight=True
+                )
+
+            plain_result, plain_size = _retained_memory(lambda: plain(content))
+            shared_result, shared_size = _retained_memory(lambda: shared(content))
+            assert shared_result == plain_result
+            # About half is measured, so this leaves room for tracemalloc noise
+            assert shared_size < plain_size * 0.75
+            plain_time = _best_time(plain, lambda: content, repeat=3)
+            shared_time = _best_time(shared, lambda: content, repeat=3)
+            print(
+                f"\n{'trusted' if trusted else 'validated'} load: "
+                f"plain {plain_time:.3f}s {plain_size / 1e6:.1f}MB, "
+                f"flyweight {shared_time:.3f}s {shared_size / 1e6:.1f}MB"
+            )
+
+
+class TestPointTuplesBenchmark:
+    """Compare points and positions as models and as named tuples"""
+
+    def test_many_points(self):
+        """Build 100k points each way and measure the memory of each point"""
+        count = 100_000
+        data = {"points": [[i * 0.5, i * 0.25] for i in range(count)]}
+        tuples = {Point: PointTuple.from_data}
+        builds = {
+            "validated models": lambda: Points.model_validate(data),
+            "trusted models": lambda: construct(Points, data),
+            "tuples": lambda: construct(Points, data, tuples),
+        }
+        results = {}
+        for name, build in builds.items():
+            result, size = _retained_memory(build)
+            build_time = _best_time(lambda _: build(), lambda: None, repeat=1)
+            results[name] = (result, size, build_time)
+        assert results["tuples"][0] == results["validated models"][0]
+        print()
+        for name, (_, size, build_time) in results.items():
+            print(
+                f"{count} points as {name}: {build_time:.2f}s, "
+                f"{size / count:.0f} bytes each"
+            )
+
+    def test_large_schematic(self):
+        """Load a large schematic with and without point tuples"""
+        content = _large_schematic(copies=200)
+
+        def models(content):
+            return read_in_schematic_from_string(content, trusted=True)
+
+        def tuples(content):
+            return read_in_schematic_from_string(
+                content, trusted=True, point_tuples=True
+            )
+
+        models_result, models_size = _retained_memory(lambda: models(content))
+        tuples_result, tuples_size = _retained_memory(lambda: tuples(content))
+        assert tuples_result == models_result
+        models_time = _best_time(models, lambda: content, repeat=3)
+        tuples_time = _best_time(tuples, lambda: content, repeat=3)
+        print(
+            f"\ntrusted schematic load: models {models_time:.3f}s "
+            f"{models_size / 1e6:.1f}MB, tuples {tuples_time:.3f}s "
+            f"{tuples_size / 1e6:.1f}MB"
+        )
+
+
+def _sheet(number, file):
+    """A sheet item placing a file"""
+    effects = "(effects (font (size 1.27 1.27)))"
+    return (
+        f"(sheet (at {number * 25} 50) (size 20 10) "
+        f'(uuid "aaaaaaaa-0000-0000-0000-{number:012d}") '
+        f'(property "Sheetname" "s{number}" (at 0 0 0) {effects}) '
+        f'(property "Sheetfile" "{file}" (at 0 0 0) {effects}))\n'
+    )
+
+
+class TestDesignBenchmark:
+    """Compare loading the files of a hierarchical design serially and in parallel"""
+
+    def test_serial_vs_pool(self, tmp_path):
+        """Load a root placing 8 large files, each placed 6 times"""
+        content = _large_schematic(copies=100)
+        end = content.rindex(")")
+        sheets = []
+        for number in range(48):
+            file = f"sheet{number % 8}.kicad_sch"
+            (tmp_path / file).write_text(content)
+            sheets.append(_sheet(number, file))
+        root = tmp_path / "root.kicad_sch"
+        root.write_text(content[:end] + "".join(sheets) + ")\n")
+
+        serial = read_in_design(str(root))
+        pooled = read_in_design(str(root), workers=None)
+        assert len(serial.schematics) == 9
+        assert len(serial.instances) == 49
+        assert pooled.schematics == serial.schematics
+        serial_time = _best_time(read_in_design, lambda: str(root), repeat=1)
+        pooled_time = _best_time(
+            lambda path: read_in_design(path, workers=None), lambda: str(root), repeat=1
+        )
+        print(
+            f"\ndesign of 9 files, 49 instances: serial {serial_time:.2f}s, "
+            f"process pool {pooled_time:.2f}s"
+        )
+
+
+def _scan_net(design, name):
+    """Find the labels of a global net by looking through every instance"""
+    return [
+        (instance.path, label)
+        for instance in design.instances
+        for label in design.schematic_of(instance).global_labels
+        if label.name == name
+    ]
+
+
+class TestLabelIndexBenchmark:
+    """Compare finding a global net by index and by scanning every sheet"""
+
+    def test_index_vs_scan(self, tmp_path):
+        """Find the VCC net of a root placing 8 files, each placed 6 times"""
+        content = _large_schematic(copies=20)
+        end = content.rindex(")")
+        sheets = []
+        for number in range(48):
+            file = f"sheet{number % 8}.kicad_sch"
+            (tmp_path / file).write_text(content)
+            sheets.append(_sheet(number, file))
+        root = tmp_path / "root.kicad_sch"
+        root.write_text(content[:end] + "".join(sheets) + ")\n")
+        design = read_in_design(str(root), trusted=True)
+
+        build_time = _best_time(
+            lambda d: d.label_index(),
+            lambda: read_in_design(str(root), trusted=True),
+            repeat=1,
+        )
+        index = design.label_index()
+        net = [(ref.path, ref.item) for ref in index.net("VCC")]
+        assert net == _scan_net(design, "VCC")
+        assert len(net) == 49 * 20
+        scan_time = _best_time(lambda d: _scan_net(d, "VCC"), lambda: design)
+        index_time = _best_time(lambda i: i.net("VCC"), lambda: index)
+        reload_time = _best_time(
+            design.reload, lambda: str(tmp_path / "sheet0.kicad_sch"), repeat=1
+        )
+        print(
+            f"\nVCC net over 49 instances: scan {scan_time * 1e3:.2f}ms, "
+            f"index {index_time * 1e3:.3f}ms (built in {build_time:.2f}s), "
+            f"reloading one file {reload_time:.2f}s"
+        )
+
+
+class TestIncrementalUpdateBenchmark:
+    """Compare reloading a schematic after a one-symbol edit with updating it"""
+
+    def test_update_vs_reload(self):
+        """Move one symbol of a large schematic"""
+        content = _large_schematic(copies=100)
+        edited = content.replace("(at 100 90 0)", "(at 120 90 0)", 1)
+        schematic = read_in_schematic_from_string(content)
+        update(schematic, content)
+        result = update(schematic, edited)
+        assert len(result.changed) == 1
+        assert schematic == read_in_schematic_from_string(edited)
+
+        def make_schematic():
+            schematic = read_in_schematic_from_string(content)
+            update(schematic, content)
+            return schematic
+
+        reload_time = _best_time(
+            read_in_schematic_from_string, lambda: edited, repeat=3
+        )
+        update_time = _best_time(
+            lambda schematic: update(schematic, edited), make_schematic, repeat=3
+        )
+        print(
+            f"\none symbol moved in {len(content) >> 10} KiB: "
+            f"reload {reload_time * 1e3:.0f}ms, update {update_time * 1e3:.1f}ms"
+        )
@@ -0,0 +1,107 @@
+import os
+import shutil
+
+import pytest
+
+from pykicad.parser.cache import ParseCache
+from pykicad.parser.kicad_sexp import (read_in_netlist_from_netlist,
+                                       read_in_schematic_from_kicad_sch)
+
+
+@pytest.fixture
+def schematic_path(tmp_path):
+    path = tmp_path / "sample.kicad_sch"
+    shutil.copy("testdata/sample.kicad_sch", path)
+    return path
+
+
+class TestParseCache:
+    """Test the on-disk parse cache"""
+
+    def test_hit_returns_equal_schematic(self, tmp_path, schematic_path):
+        """Test a second read is served from the cache"""
+        cache = ParseCache(tmp_path / "cache")
+        first = cache.read_in_schematic_from_kicad_sch(schematic_path)
+        second = cache.read_in_schematic_from_kicad_sch(schematic_path)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert first == second == read_in_schematic_from_kicad_sch(schematic_path)
+
+    def test_shared_between_instances(self, tmp_path, schematic_path):
+        """Test entries persist on disk for other cache instances"""
+        ParseCache(tmp_path / "cache").read_in_schematic_from_kicad_sch(schematic_path)
+        cache = ParseCache(tmp_path / "cache")
+        cache.read_in_schematic_from_kicad_sch(schematic_path)
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_changed_file_is_reparsed(self, tmp_path, schematic_path):
+        """Test a modified file does not reuse the old entry"""
+        cache = ParseCache(tmp_path / "cache")
+        cache.read_in_schematic_from_kicad_sch(schematic_path)
+        content = schematic_path.read_text().replace('(paper "A4")', '(paper "A3")')
+        schematic_path.write_text(content)
+        schematic = cache.read_in_schematic_from_kicad_sch(schematic_path)
+        assert schematic.paper == "A3"
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_fields_are_part_of_the_key(self, tmp_path, schematic_path):
+        """Test projected loads are cached separately from full loads"""
+        cache = ParseCache(tmp_path / "cache")
+        full = cache.read_in_schematic_from_kicad_sch(schematic_path)
+        wires = cache.read_in_schematic_from_kicad_sch(schematic_path, {"wires"})
+        assert wires.wires == full.wires
+        assert wires.symbols == []
+        assert cache.misses == 2
+
+    def test_fingerprint_change_invalidates(self, tmp_path, schematic_path):
+        """Test entries are not reused once the models change"""
+        cache = ParseCache(tmp_path / "cache")
+        cache.read_in_schematic_from_kicad_sch(schematic_path)
+        cache._fingerprint = "changed"
+        cache.read_in_schematic_from_kicad_sch(schematic_path)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, schematic_path):
+        """Test an unreadable entry is replaced"""
+        cache = ParseCache(tmp_path / "cache")
+        cache.read_in_schematic_from_kicad_sch(schematic_path)
+        for entry in (tmp_path / "cache").glob("*.pickle"):
+            entry.write_bytes(b"not a pickle")
+        schematic = cache.read_in_schematic_from_kicad_sch(schematic_path)
+        assert schematic.uuid == "11111111-1111-1111-1111-111111111111"
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_least_recently_used_is_evicted(self, tmp_path, schematic_path):
+        """Test the cache stays under its size limit by dropping old entries"""
+        paths = [schematic_path]
+        for paper in ["A3", "A2"]:
+            path = tmp_path / f"{paper}.kicad_sch"
+            content = schematic_path.read_text()
+            path.write_text(content.replace('(paper "A4")', f'(paper "{paper}")'))
+            paths.append(path)
+
+        cache = ParseCache(tmp_path / "cache")
+        cache.read_in_schematic_from_kicad_sch(paths[0])
+        (oldest,) = (tmp_path / "cache").glob("*.pickle")
+        os.utime(oldest, (0, 0))
+        cache.max_bytes = oldest.stat().st_size * 2
+        cache.read_in_schematic_from_kicad_sch(paths[1])
+        cache.read_in_schematic_from_kicad_sch(paths[2])
+
+        entries = list((tmp_path / "cache").glob("*.pickle"))
+        assert len(entries) == 2
+        assert oldest not in entries
+
+    def test_clear(self, tmp_path, schematic_path):
+        """Test clearing removes every entry"""
+        cache = ParseCache(tmp_path / "cache")
+        cache.read_in_schematic_from_kicad_sch(schematic_path)
+        cache.clear()
+        assert list((tmp_path / "cache").glob("*.pickle")) == []
+
+    def test_netlist(self, tmp_path):
+        """Test netlists are cached too"""
+        cache = ParseCache(tmp_path / "cache")
+        first = cache.read_in_netlist_from_netlist("testdata/sample.net")
+        second = cache.read_in_netlist_from_netlist("testdata/sample.net")
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert first == second == read_in_netlist_from_netlist("testdata/sample.net")
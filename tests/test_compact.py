@@ -0,0 +1,76 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+from pydantic import BaseModel
+
+from pykicad.models.compact import FORMAT_VERSION, from_compact, to_compact
+from pykicad.models.netlist import Netlist
+from pykicad.models.schematic import (PinType, Point, Position, Schematic,
+                                      Wire)
+from pykicad.parser.kicad_sexp import read_in_netlist_from_netlist
+
+
+class TestCompact:
+    """Test the compact representation of models"""
+
+    def test_round_trip(self, schematic):
+        """Test a schematic is rebuilt unchanged"""
+        rebuilt = from_compact(Schematic, to_compact(schematic))
+        assert rebuilt == schematic
+        assert rebuilt.model_dump() == schematic.model_dump()
+        assert rebuilt.model_dump(exclude_unset=True) == schematic.model_dump(
+            exclude_unset=True
+        )
+        pins = [p for s in rebuilt.lib_symbols for u in s.symbols for p in u.pins]
+        assert pins and all(isinstance(p.type, PinType) for p in pins)
+
+    def test_nested_models_are_tuples(self):
+        """Test nested models are stored as tuples of their values"""
+        wire = Wire(pts={"xy": [[0, 1], [2, 3]]}, stroke={"width": 0, "type": "default"})
+        _, _, body = to_compact(wire)
+        assert body[1] == [(-1, 0.0, 1.0), (-1, 2.0, 3.0)]
+        assert from_compact(Wire, to_compact(wire)) == wire
+
+    def test_mismatched_data(self, schematic):
+        """Test data for another version or model is rejected"""
+        _, signature, body = to_compact(schematic)
+        with pytest.raises(ValueError):
+            from_compact(Schematic, (FORMAT_VERSION + 1, signature, body))
+        with pytest.raises(ValueError):
+            from_compact(Point, (FORMAT_VERSION, signature, body))
+
+    def test_changed_field_type(self):
+        """Test data from a model whose field had another type is rejected"""
+
+        def make_item(at_type, end_type):
+            # The same field names and nested models either way round
+            class Item(BaseModel):
+                at: at_type
+                end: end_type
+
+            return Item
+
+        old = make_item(Point, Position)(at=[1, 2], end=[3, 4, 0])
+        with pytest.raises(ValueError):
+            from_compact(make_item(Position, Point), to_compact(old))
+
+    def test_signature_is_stable(self, schematic):
+        """Test the signature of models with validators is the same elsewhere"""
+        code = (
+            "from pykicad.models.compact import _signature; "
+            "from pykicad.models.schematic import Schematic; "
+            "print(_signature(Schematic))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == to_compact(schematic)[1]
+
+    def test_pickle(self, schematic):
+        """Test schematics and netlists pickle through the compact form"""
+        netlist = read_in_netlist_from_netlist("testdata/sample.net")
+        assert pickle.loads(pickle.dumps(schematic)) == schematic
+        assert pickle.loads(pickle.dumps(netlist)) == netlist
+        assert isinstance(pickle.loads(pickle.dumps(netlist)), Netlist)
@@ -0,0 +1,143 @@
+import pytest
+
+from pykicad.models.connectivity import compute_nets, iter_placed_pins
+from pykicad.models.schematic import Junction, Label
+
+
+def _label(name, x, y):
+    return Label.model_validate({name: {"at": [x, y, 0]}})
+
+
+def _net_of(nets, item):
+    """Return the net an item is in"""
+    (net,) = [
+        net
+        for net in nets
+        for items in (net.wires, net.junctions, net.pins, list(net.all_labels()))
+        if any(i is item for i in items)
+    ]
+    return net
+
+
+def _pins(net):
+    return sorted((pin.symbol.uuid[:2], pin.number) for pin in net.pins)
+
+
+class TestPlacedPins:
+    """Test pins are moved to the placement of their symbol"""
+
+    def test_sample(self, schematic):
+        """Test the pins of the sample symbols"""
+        pins = [(pin.number, pin.x, pin.y) for pin in iter_placed_pins(schematic)]
+        assert [number for number, _, _ in pins] == ["1", "2", "1", "2"]
+        assert [(x, y) for _, x, y in pins] == pytest.approx(
+            [(100, 86.19), (100, 93.81), (120, 96.19), (120, 103.81)]
+        )
+
+    @pytest.mark.parametrize(
+        "angle, mirror, expected",
+        [
+            (90, None, [(96.19, 90), (103.81, 90)]),
+            (270, None, [(103.81, 90), (96.19, 90)]),
+            (0, "x", [(100, 93.81), (100, 86.19)]),
+            (90, "y", [(103.81, 90), (96.19, 90)]),
+        ],
+    )
+    def test_rotated_and_mirrored(
+        self, schematic, place_symbol, angle, mirror, expected
+    ):
+        """Test the orientation of the symbol is applied to its pins"""
+        schematic = place_symbol(schematic, angle, mirror)
+        pins = [(pin.x, pin.y) for pin in iter_placed_pins(schematic)]
+        assert pins == pytest.approx(expected)
+
+
+class TestComputeNets:
+    """Test nets are derived from item positions"""
+
+    def test_sample(self, schematic):
+        """Test the nets of the sample schematic"""
+        nets = compute_nets(schematic)
+        signal = _net_of(nets, schematic.labels[0])
+        assert signal.wires == schematic.wires
+        assert signal.labels == schematic.labels
+        assert signal.pins == []
+        # Every unconnected item is a net of its own
+        assert len(nets) == 1 + 2 + 4 + 4
+
+    def test_wire_to_pin(self, schematic, make_wire):
+        """Test a wire ending on a pin connects it"""
+        wire = make_wire(100, 80, 100, 86.19)
+        schematic.wires.append(wire)
+        net = _net_of(compute_nets(schematic), wire)
+        assert _pins(net) == [("90", "1")]
+        assert [label.name for label in net.labels] == ["SIGNAL_A", "SIGNAL_B"]
+
+    def test_wire_ending_on_wire(self, schematic, make_wire):
+        """Test a wire ending in the middle of another connects to it"""
+        wire = make_wire(110, 70, 110, 80)
+        schematic.wires.append(wire)
+        assert _net_of(compute_nets(schematic), wire).wires == schematic.wires
+
+    def test_crossing_wires(self, schematic, make_wire):
+        """Test crossing wires only connect at a junction"""
+        wire = make_wire(110, 70, 110, 90)
+        schematic.wires.append(wire)
+        assert _net_of(compute_nets(schematic), wire).wires == [wire]
+
+        schematic.junctions.append(
+            Junction(at=[110, 80], diameter=0, color=(0, 0, 0, 0))
+        )
+        assert _net_of(compute_nets(schematic), wire).wires == schematic.wires
+
+    def test_pin_on_wire(self, schematic, make_wire):
+        """Test a pin in the middle of a wire connects to it"""
+        wire = make_wire(120, 90, 120, 110)
+        schematic.wires.append(wire)
+        net = _net_of(compute_nets(schematic), wire)
+        assert _pins(net) == [("c0", "1"), ("c0", "2")]
+
+    def test_labels_with_the_same_name(self, schematic, make_wire):
+        """Test labels of the same kind and name are connected"""
+        wire = make_wire(0, 0, 10, 0)
+        schematic.wires.append(wire)
+        schematic.labels.append(_label("SIGNAL_A", 10, 0))
+        nets = compute_nets(schematic)
+        assert _net_of(nets, wire) is _net_of(nets, schematic.labels[0])
+
+    def test_label_kinds_are_separate(self, schematic, make_wire):
+        """Test a global label does not join a local label of the same name"""
+        wire = make_wire(0, 0, 10, 0)
+        schematic.wires.append(wire)
+        schematic.global_labels.append(_label("SIGNAL_A", 10, 0))
+        nets = compute_nets(schematic)
+        assert _net_of(nets, wire) is not _net_of(nets, schematic.labels[0])
+
+    def test_power_symbol(self, schematic):
+        """Test the pins of power symbols join the global label of their value"""
+        library = schematic.lib_symbols[0].model_copy(
+            update={"library": "power:GND"}
+        )
+        symbol = schematic.symbols[0].model_copy(
+            update={"lib_id": "power:GND", "value": "GND"}
+        )
+        schematic = schematic.model_copy(
+            update={"lib_symbols": [library], "symbols": [symbol]}
+        )
+        net = _net_of(compute_nets(schematic), schematic.global_labels[1])
+        assert [pin.number for pin in net.pins] == ["1", "2"]
+
+    def test_diagonal_wire(self, schematic, make_wire):
+        """Test items on the middle of a diagonal wire connect to it"""
+        wire = make_wire(130, 70, 140, 80)
+        label = _label("DIAGONAL", 135, 75)
+        schematic.wires.append(wire)
+        schematic.labels.append(label)
+        assert _net_of(compute_nets(schematic), label).wires == [wire]
+
+    def test_chain_of_wires(self, schematic, make_wire):
+        """Test a long chain of wires forms a single net"""
+        wires = [make_wire(i, 200, i + 1, 200) for i in range(1000)]
+        schematic = schematic.model_copy(update={"wires": wires})
+        net = _net_of(compute_nets(schematic), wires[0])
+        assert net.wires == wires
@@ -0,0 +1,249 @@
+import pytest
+
+from pykicad.parser import kicad_sexp
+from pykicad.parser.design import read_in_design
+
+ROOT_UUID = "11111111-1111-1111-1111-111111111111"
+CHANNEL_UUID = "22222222-2222-2222-2222-222222222222"
+
+
+def _sheet(number, name, file):
+    return f"""
+	(sheet
+		(at {100 + number * 25} 50)
+		(size 20 10)
+		(stroke (width 0.1524) (type solid))
+		(fill (color 0 0 0 0.0000))
+		(uuid "aaaaaaaa-0000-0000-0000-{number:012d}")
+		(property "Sheetname" "{name}"
+			(at 100 49.2 0)
+			(effects (font (size 1.27 1.27)) (justify left bottom))
+		)
+		(property "Sheetfile" "{file}"
+			(at 100 60.5 0)
+			(effects (font (size 1.27 1.27)) (justify left top))
+		)
+		(pin "INPUT_B" input
+			(at {100 + number * 25} 55 180)
+			(effects (font (size 1.27 1.27)) (justify left))
+			(uuid "bbbbbbbb-0000-0000-0000-{number:012d}")
+		)
+	)
+"""
+
+
+def _write(path, uuid, sheets):
+    """Write the sample schematic with another UUID and the given sheets"""
+    with open("testdata/sample.kicad_sch") as f:
+        content = f.read().replace(ROOT_UUID, uuid, 1)
+    end = content.index("\t(sheet_instances")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content[:end] + "".join(sheets) + content[end:])
+    return path
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A root with channels placing one file, which places a file below it"""
+
+    def make(channels):
+        sheets = [_sheet(i, f"ch{i}", "channel.kicad_sch") for i in range(channels)]
+        root = _write(tmp_path / "root.kicad_sch", ROOT_UUID, sheets)
+        _write(
+            tmp_path / "channel.kicad_sch",
+            CHANNEL_UUID,
+            [_sheet(99, "filter", "sub/filter.kicad_sch")],
+        )
+        _write(
+            tmp_path / "sub" / "filter.kicad_sch",
+            "33333333-3333-3333-3333-333333333333",
+            [],
+        )
+        return str(root)
+
+    return make
+
+
+class TestReadInDesign:
+    """Test loading a root schematic with the sheets under it"""
+
+    def test_sheet_tree(self, project):
+        """Test instances follow the sheets depth first with their paths"""
+        loaded = read_in_design(project(2))
+        assert [i.names for i in loaded.instances] == [
+            "/",
+            "/ch0/",
+            "/ch0/filter/",
+            "/ch1/",
+            "/ch1/filter/",
+        ]
+        filter1 = loaded.instances[4]
+        assert filter1.path == (
+            f"/{ROOT_UUID}/aaaaaaaa-0000-0000-0000-000000000001"
+            "/aaaaaaaa-0000-0000-0000-000000000099"
+        )
+        assert filter1.file.endswith("filter.kicad_sch")
+        assert filter1.sheet.name == "filter"
+        assert loaded.instance(filter1.parent) is loaded.instances[3]
+        assert loaded.instance(filter1.path) is filter1
+        assert loaded.instance("/missing") is None
+        assert loaded.children(loaded.instances[0]) == [
+            loaded.instances[1],
+            loaded.instances[3],
+        ]
+        assert loaded.root.uuid == ROOT_UUID
+        assert len(loaded.root.sheets) == 2
+
+    def test_each_file_parsed_once(self, project, monkeypatch):
+        """Test repeated sheets share one parsed schematic"""
+        root = project(48)
+        loaded_files = []
+        read = kicad_sexp.read_in_schematic_from_kicad_sch
+
+        def counting_read(path, **kwargs):
+            loaded_files.append(path)
+            return read(path, **kwargs)
+
+        monkeypatch.setattr(
+            kicad_sexp, "read_in_schematic_from_kicad_sch", counting_read
+        )
+        loaded = read_in_design(root)
+        assert len(loaded_files) == 3
+        assert len(loaded.instances) == 1 + 48 * 2
+        channels = loaded.instances_of(str(loaded.instances[1].file))
+        assert len(channels) == 48
+        schematics = {id(loaded.schematic_of(i)) for i in channels}
+        assert schematics == {id(loaded.schematics[channels[0].file])}
+
+    def test_process_pool(self, project):
+        """Test loading in worker processes gives the same design"""
+        root = project(3)
+        serial = read_in_design(root)
+        parallel = read_in_design(root, workers=2, trusted=True)
+        assert parallel.schematics == serial.schematics
+        assert parallel.instances == serial.instances
+
+    def test_single_sheet(self, project):
+        """Test a schematic with one sheet, which the parser does not pluralise"""
+        loaded = read_in_design(project(1))
+        assert [i.names for i in loaded.instances] == ["/", "/ch0/", "/ch0/filter/"]
+
+    def test_missing_file(self, tmp_path):
+        """Test a sheet placing a missing file"""
+        root = _write(
+            tmp_path / "root.kicad_sch", ROOT_UUID, [_sheet(0, "a", "no.kicad_sch")]
+        )
+        with pytest.raises(FileNotFoundError):
+            read_in_design(str(root))
+
+    def test_recursive_sheets(self, tmp_path):
+        """Test a file placed inside itself"""
+        root = _write(
+            tmp_path / "root.kicad_sch", ROOT_UUID, [_sheet(0, "a", "root.kicad_sch")]
+        )
+        with pytest.raises(ValueError, match="inside itself"):
+            read_in_design(str(root))
+
+    def test_sheet_without_file(self, tmp_path):
+        """Test a sheet item missing its file property"""
+        sheet = _sheet(0, "a", "x.kicad_sch").replace("Sheetfile", "Other")
+        root = _write(tmp_path / "root.kicad_sch", ROOT_UUID, [sheet])
+        with pytest.raises(ValueError, match="has no file"):
+            read_in_design(str(root))
+
+
+def _nets(index):
+    return {
+        key: {(ref.path, ref.item.uuid) for ref in refs}
+        for key, refs in index.nets.items()
+    }
+
+
+class TestLabelIndex:
+    """Test the index of label nets across the sheets of a design"""
+
+    def test_global_net(self, project):
+        """Test a global label is found in every instance of every file"""
+        loaded = read_in_design(project(2))
+        vcc = loaded.label_index().net("VCC")
+        assert [ref.path for ref in vcc] == [i.path for i in loaded.instances]
+        assert all(ref.item.name == "VCC" for ref in vcc)
+        assert loaded.label_index() is loaded.label_index()
+        assert loaded.label_index().net("missing") == []
+
+    def test_hierarchical_net(self, project):
+        """Test a hierarchical label joins the pin of the sheet placing it"""
+        loaded = read_in_design(project(2))
+        channel = loaded.instances[3]
+        refs = loaded.label_index().net("INPUT_B", channel.path)
+        assert {ref.path for ref in refs} == {channel.parent, channel.path}
+        pin, label = sorted(refs, key=lambda ref: ref.path)
+        assert pin.item is channel.sheet.pins[0]
+        assert pin.item.type == "input"
+        assert label.item.name == "INPUT_B"
+        assert loaded.label_index().net("OUTPUT_A", channel.path)[0].path == (
+            channel.path
+        )
+
+    def test_remove_instance(self, project):
+        """Test removing an instance drops its items and emptied nets"""
+        loaded = read_in_design(project(1))
+        index = loaded.label_index()
+        channel = loaded.instances[1]
+        index.remove(channel.path)
+        assert len(index.net("VCC")) == 2
+        assert index.net("OUTPUT_A", channel.path) == []
+        assert [ref.path for ref in index.net("INPUT_B", channel.path)] == [
+            channel.parent
+        ]
+
+
+class TestReload:
+    """Test reloading one file of a design"""
+
+    def test_reload_updates_index(self, project, tmp_path):
+        """Test the index after a reload matches one built from scratch"""
+        loaded = read_in_design(project(2))
+        loaded.label_index()
+        channel = tmp_path / "channel.kicad_sch"
+        channel.write_text(channel.read_text().replace('"VCC"', '"VDD"'))
+        schematic = loaded.reload(str(channel))
+        assert schematic is loaded.schematic_of(loaded.instances[1])
+        assert len(loaded.label_index().net("VCC")) == 3
+        assert len(loaded.label_index().net("VDD")) == 2
+        assert _nets(loaded.label_index()) == _nets(
+            read_in_design(loaded.root_file).label_index()
+        )
+
+    def test_reload_changes_sheets(self, project, tmp_path):
+        """Test sheets added or removed by a reload update the instances"""
+        root = project(2)
+        loaded = read_in_design(root)
+        loaded.label_index()
+        _write(tmp_path / "other.kicad_sch", "44444444-4444-4444-4444-444444444444", [])
+        _write(
+            tmp_path / "root.kicad_sch",
+            ROOT_UUID,
+            [_sheet(0, "ch0", "channel.kicad_sch"), _sheet(5, "x", "other.kicad_sch")],
+        )
+        loaded.reload(root)
+        assert [i.names for i in loaded.instances] == [
+            "/",
+            "/ch0/",
+            "/ch0/filter/",
+            "/x/",
+        ]
+        assert len(loaded.schematics) == 4
+        assert _nets(loaded.label_index()) == _nets(read_in_design(root).label_index())
+
+        _write(tmp_path / "root.kicad_sch", ROOT_UUID, [])
+        loaded.reload(root)
+        assert len(loaded.instances) == 1
+        assert list(loaded.schematics) == [loaded.root_file]
+        assert len(loaded.label_index().net("VCC")) == 1
+
+    def test_reload_unknown_file(self, project, tmp_path):
+        """Test reloading a file that is not placed in the design"""
+        loaded = read_in_design(project(1))
+        with pytest.raises(ValueError, match="not part of the design"):
+            loaded.reload(str(tmp_path / "other.kicad_sch"))
@@ -1,7 +1,10 @@
+import sys
+
 import pytest
 
 from pykicad.parser.kicad_sexp import (_normalized_bools, _parse_all_strings,
-                                       _strip_single_element_lists, parse_sexp)
+                                       _strip_single_element_lists, parse_sexp,
+                                       read_sexp_from_string)
 
 
 class TestEdgeCases:
@@ -255,6 +258,29 @@ class TestBoundaryConditions:
         result = parse_sexp(deep_list)
         assert "level1" in result
 
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Test parsing lists nested deeper than the interpreter recursion limit"""
+        depth = sys.getrecursionlimit() * 2
+        deep_list = ["level0"]
+        current = deep_list
+        for i in range(1, depth):
+            current.append([f"level{i}", ["size", 1.27, 1.27]])
+            current = current[-1]
+
+        result = parse_sexp(deep_list)
+        for i in range(1, depth):
+            result = result[f"level{i - 1}"]
+        assert result[f"level{depth - 1}"] == {"size": [1.27, 1.27]}
+
+    def test_deep_text_nesting(self):
+        """Test parsing deeply nested effects from text"""
+        depth = sys.getrecursionlimit() * 2
+        text = "(effects (font " * depth + "(size 1.27 1.27)" + "))" * depth
+        result = read_sexp_from_string(text)
+        for _ in range(depth):
+            result = result["effects"]["font"]
+        assert result == {"size": [1.27, 1.27]}
+
     def test_large_number_of_elements(self):
         """Test parsing with a large number of elements"""
         # Create a list with many elements
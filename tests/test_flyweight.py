@@ -0,0 +1,110 @@
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from pykicad.models.flyweight import LeafPool
+from pykicad.models.schematic import (Effects, FrozenEffects, FrozenStroke,
+                                      Stroke)
+from pykicad.parser.kicad_sexp import read_in_schematic_from_kicad_sch
+
+SAMPLE_FILE = "testdata/sample.kicad_sch"
+
+
+def _all_effects(schematic):
+    effects = [p.effects for s in schematic.symbols for p in s.properties]
+    for symbol in schematic.lib_symbols:
+        effects += [p.effects for p in symbol.properties]
+        effects += [pin.effects for unit in symbol.symbols for pin in unit.pins]
+    return [e for e in effects if e is not None]
+
+
+class TestFlyweightLoading:
+    """Test loading schematics with shared effects and strokes"""
+
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"trusted": True}, {"lazy": True}, {"memory_map": True}],
+    )
+    def test_equal_to_plain_load(self, schematic, options):
+        """Test the shared load equals a plain one, both ways round"""
+        shared = read_in_schematic_from_kicad_sch(
+            SAMPLE_FILE, flyweight=True, **options
+        )
+        assert shared == schematic
+        assert schematic == shared
+
+    def test_equal_values_are_one_object(self):
+        """Test equal effects and strokes are the same frozen instance"""
+        schematic = read_in_schematic_from_kicad_sch(SAMPLE_FILE, flyweight=True)
+        effects = _all_effects(schematic)
+        assert all(isinstance(e, FrozenEffects) for e in effects)
+        assert len({id(e) for e in effects}) < len(effects)
+        for first in effects:
+            for second in effects:
+                assert (first == second) == (first is second)
+        strokes = [wire.stroke for wire in schematic.wires]
+        assert all(isinstance(s, FrozenStroke) for s in strokes)
+        assert len({id(s) for s in strokes}) == 1
+
+    def test_shared_models_are_frozen(self):
+        """Test shared models and the models inside them reject assignment"""
+        schematic = read_in_schematic_from_kicad_sch(SAMPLE_FILE, flyweight=True)
+        prop = schematic.symbols[0].properties[0]
+        with pytest.raises(ValidationError):
+            prop.effects.hide = True
+        with pytest.raises(ValidationError):
+            prop.effects.font.size.width = 2
+        with pytest.raises(ValidationError):
+            schematic.wires[0].stroke.width = 1
+
+    def test_replacing_one_items_effects(self):
+        """Test giving one item new effects leaves the others alone"""
+        schematic = read_in_schematic_from_kicad_sch(SAMPLE_FILE, flyweight=True)
+        first, second = schematic.symbols[0].properties[:2]
+        assert first.effects is second.effects
+        first.effects = first.effects.model_copy(update={"hide": True})
+        assert first.effects.hide and not second.effects.hide
+
+    def test_pickle(self, schematic):
+        """Test a shared load survives pickling, still frozen and shared"""
+        shared = read_in_schematic_from_kicad_sch(SAMPLE_FILE, flyweight=True)
+        loaded = pickle.loads(pickle.dumps(shared))
+        assert loaded == schematic
+        effects = _all_effects(loaded)
+        assert all(isinstance(e, FrozenEffects) for e in effects)
+        assert len({id(e) for e in effects}) == len(
+            {id(e) for e in _all_effects(shared)}
+        )
+        assert isinstance(loaded.wires[0].stroke, FrozenStroke)
+
+
+class TestLeafPool:
+    """Test the pool of shared models"""
+
+    def test_share_replaces_in_place(self):
+        """Test effects and strokes in nested data are replaced"""
+        effects = {"font": {"size": [1.27, 1.27]}}
+        data = {
+            "labels": [{"effects": dict(effects)}, {"effects": dict(effects)}],
+            "stroke": {"width": 0, "type": "default"},
+        }
+        pool = LeafPool()
+        assert pool.share(data) is data
+        first, second = data["labels"]
+        assert first["effects"] is second["effects"]
+        assert first["effects"] == Effects.model_validate(effects)
+        assert data["stroke"] == Stroke(width=0, type="default")
+
+    def test_frozen_models_are_hashable(self):
+        """Test frozen models hash equal when their values are equal"""
+        pool = LeafPool(trusted=True)
+        first = pool.get(FrozenStroke, {"width": 0, "type": "default"})
+        second = FrozenStroke(width=0, type="default")
+        assert first == second and hash(first) == hash(second)
+
+    def test_not_equal_to_other_models(self):
+        """Test frozen models only equal the model they copy"""
+        stroke = FrozenStroke(width=0, type="default")
+        assert stroke != Effects()
+        assert stroke != Stroke(width=1, type="default")
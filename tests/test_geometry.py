@@ -0,0 +1,88 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+class TestGeometry:
+    """Test the NumPy view of schematic geometry"""
+
+    def test_arrays(self, schematic):
+        """Test the arrays match the models"""
+        geometry = schematic.geometry
+        assert geometry.wire_segments.tolist() == [
+            [80, 80, 100, 80],
+            [100, 80, 120, 80],
+        ]
+        assert list(geometry.wire_uuids) == [w.uuid for w in schematic.wires]
+        assert geometry.junctions.tolist() == [[100, 100], [120, 120]]
+        assert list(geometry.junction_uuids) == [j.uuid for j in schematic.junctions]
+        assert geometry.polyline_segments.shape == (0, 4)
+        assert schematic.geometry is geometry
+
+    def test_pins(self, schematic):
+        """Test pins are placed at the connection points of the symbols"""
+        geometry = schematic.geometry
+        np.testing.assert_allclose(
+            geometry.pins,
+            [[100, 86.19], [100, 93.81], [120, 96.19], [120, 103.81]],
+        )
+        assert list(geometry.pin_numbers) == ["1", "2", "1", "2"]
+        assert list(geometry.pin_symbol_uuids) == [
+            schematic.symbols[0].uuid,
+            schematic.symbols[0].uuid,
+            schematic.symbols[1].uuid,
+            schematic.symbols[1].uuid,
+        ]
+
+    def test_copied_or_changed(self, schematic, place_symbol):
+        """Test the geometry is built again when its lists are replaced or grow"""
+        assert len(schematic.geometry.pins) == 4
+        assert len(place_symbol(schematic, 90).geometry.pins) == 2
+        assert len(schematic.model_copy(update={"wires": []}).geometry.wire_uuids) == 0
+        schematic.junctions.append(schematic.junctions[0])
+        assert len(schematic.geometry.junctions) == 3
+        assert len(schematic.geometry.pins) == 4
+
+    @pytest.mark.parametrize(
+        "angle, mirror, expected",
+        [
+            (90, None, [[96.19, 90], [103.81, 90]]),
+            (180, None, [[100, 93.81], [100, 86.19]]),
+            (0, "x", [[100, 93.81], [100, 86.19]]),
+            (90, "y", [[103.81, 90], [96.19, 90]]),
+        ],
+    )
+    def test_rotated_and_mirrored_pins(
+        self, schematic, place_symbol, angle, mirror, expected
+    ):
+        """Test symbol rotation and mirroring move the pins"""
+        geometry = place_symbol(schematic, angle, mirror).geometry
+        np.testing.assert_allclose(geometry.pins, expected)
+
+    def test_bounding_box(self, schematic):
+        """Test the bounding box covers every item"""
+        assert schematic.geometry.bounding_box().tolist() == [80, 80, 120, 120]
+
+    def test_translate_and_rotate(self, schematic):
+        """Test moving the geometry leaves the original unchanged"""
+        geometry = schematic.geometry
+        moved = geometry.translate(1, 2)
+        assert moved.wire_segments[0].tolist() == [81, 82, 101, 82]
+        np.testing.assert_allclose(moved.pins[0], [101, 88.19])
+        assert geometry.wire_segments[0].tolist() == [80, 80, 100, 80]
+
+        rotated = geometry.rotate(90, origin=(100, 80))
+        assert rotated.wire_segments.tolist() == [
+            [100, 100, 100, 80],
+            [100, 80, 100, 60],
+        ]
+        assert rotated.wire_uuids is geometry.wire_uuids
+
+    def test_snap(self, schematic):
+        """Test snapping moves every point onto the grid"""
+        geometry = schematic.geometry
+        assert len(geometry.off_grid(2.54)) == len(geometry.points())
+        snapped = geometry.snap(2.54)
+        assert len(snapped.off_grid(2.54)) == 0
+        expected = [[99.06, 99.06], [119.38, 119.38]]
+        np.testing.assert_allclose(snapped.junctions, expected)
@@ -0,0 +1,183 @@
+import pickle
+
+import pytest
+
+from pykicad.parser import kicad_sexp
+from pykicad.parser.incremental import update
+from pykicad.parser.kicad_sexp import read_in_schematic_from_string
+
+SYMBOL_UUID = "90123456-9012-9012-9012-901234567890"
+
+
+@pytest.fixture
+def text():
+    with open("testdata/sample.kicad_sch") as f:
+        return f.read()
+
+
+def _item(text, uuid):
+    """Return the start and end of the top-level item with a UUID"""
+    _, items = kicad_sexp._top_level_items(text)
+    for _, start, end in items:
+        if f'(uuid "{uuid}")' in text[start:end]:
+            return start, end
+    raise KeyError(uuid)
+
+
+def _edit(text, uuid, old, new):
+    start, end = _item(text, uuid)
+    return text[:start] + text[start:end].replace(old, new, 1) + text[end:]
+
+
+def _with_label(text, name, uuid):
+    end = text.index("\t(symbol\n")
+    label = f'\t(label "{name}" (at 10 10 0) (effects (font (size 1.27 1.27))) '
+    return text[:end] + label + f'(uuid "{uuid}"))\n' + text[end:]
+
+
+class TestUpdate:
+    """Test updating a loaded schematic from new text"""
+
+    @pytest.fixture
+    def schematic(self, text):
+        schematic = read_in_schematic_from_string(text)
+        update(schematic, text)
+        return schematic
+
+    def test_unchanged(self, schematic, text):
+        """Test the same text changes nothing and keeps every item"""
+        symbols = list(schematic.symbols)
+        result = update(schematic, text)
+        assert result == ([], [], [], [])
+        assert all(new is old for new, old in zip(schematic.symbols, symbols))
+
+    def test_changed_item(self, schematic, text, monkeypatch):
+        """Test only the edited item is parsed and replaced"""
+        first, second = schematic.symbols
+        labels = list(schematic.labels)
+        parsed = []
+        read_item = kicad_sexp._read_item_from_string
+
+        def counting_read_item(content, atoms=None):
+            parsed.append(content)
+            return read_item(content, atoms)
+
+        monkeypatch.setattr(kicad_sexp, "_read_item_from_string", counting_read_item)
+        new_text = _edit(text, SYMBOL_UUID, "(at 100 90 0)", "(at 120 90 0)")
+        result = update(schematic, new_text)
+        assert len(parsed) == 1
+        assert result.changed == [(first, schematic.symbols[0])]
+        assert result.added == result.removed == []
+        assert schematic.symbols[0].at.x == 120
+        assert schematic.symbols[1] is second
+        assert schematic.labels == labels and schematic.labels[0] is labels[0]
+        assert schematic == read_in_schematic_from_string(new_text)
+
+    def test_added_and_removed(self, schematic, text):
+        """Test items added to and removed from the text"""
+        new_text = _with_label(text, "EXTRA", "99999999-9999-9999-9999-999999999999")
+        result = update(schematic, new_text)
+        assert [label.name for label in result.added] == ["EXTRA"]
+        assert schematic == read_in_schematic_from_string(new_text)
+
+        result = update(schematic, text)
+        assert [label.name for label in result.removed] == ["EXTRA"]
+        assert result.added == [] and result.changed == []
+        assert schematic == read_in_schematic_from_string(text)
+
+    def test_other_fields(self, schematic, text):
+        """Test fields other than the item lists are set again when changed"""
+        new_text = text.replace('(paper "A4")', '(paper "A3")', 1)
+        assert new_text != text
+        result = update(schematic, new_text)
+        assert result.fields == ["paper"]
+        assert schematic.paper == "A3"
+
+    def test_lone_item(self, text):
+        """Test a field left with one item matches a full load"""
+        new_text = _with_label(text, "EXTRA", "99999999-9999-9999-9999-999999999999")
+        schematic = read_in_schematic_from_string(new_text)
+        update(schematic, new_text)
+        for uuid in ("cccccccc-cccc-cccc-cccc-cccccccccccc", SYMBOL_UUID):
+            start, end = _item(new_text, uuid)
+            new_text = new_text[:start] + new_text[end:]
+            update(schematic, new_text)
+            assert schematic == read_in_schematic_from_string(new_text)
+
+    def test_edits_at_start_and_end(self, schematic, text):
+        """Test changes to the first item and after the last item"""
+        new_text = text.replace("(version 20250824)", "(version 20250825)", 1)
+        assert update(schematic, new_text).fields == ["version"]
+        end = new_text.rindex(")")
+        label = '(label "END" (at 1 1 0) (uuid "99999999-0000-0000-0000-000000000000"))'
+        new_text = new_text[:end] + label + new_text[end:]
+        assert [label.name for label in update(schematic, new_text).added] == ["END"]
+        assert schematic == read_in_schematic_from_string(new_text)
+
+    def test_layout_only(self, schematic, text):
+        """Test an item whose text changed but not its values is kept"""
+        symbol = schematic.symbols[0]
+        new_text = _edit(text, SYMBOL_UUID, "(at 100 90 0)", "(at 100.0 90 0)")
+        assert update(schematic, new_text) == ([], [], [], [])
+        assert schematic.symbols[0] is symbol
+
+    def test_cached_properties_dropped(self, schematic, text):
+        """Test the spatial index is built again once an update changes its lists"""
+        index = schematic.spatial_index()
+        update(schematic, _edit(text, SYMBOL_UUID, "(at 100 90 0)", "(at 120 90 0)"))
+        assert schematic.spatial_index() is index
+        wire = "dddddddd-dddd-dddd-dddd-dddddddddddd"
+        update(schematic, _edit(text, wire, "(xy 120 80)", "(xy 130 80)"))
+        assert schematic.spatial_index() is not index
+        assert schematic.spatial_index().at(125, 80) == [schematic.wires[1]]
+
+    def test_pickle_and_dump(self, schematic, text):
+        """Test an updated schematic still pickles and dumps like a loaded one"""
+        new_text = _edit(text, SYMBOL_UUID, "(at 100 90 0)", "(at 120 90 0)")
+        update(schematic, new_text)
+        loaded = read_in_schematic_from_string(new_text)
+        assert pickle.loads(pickle.dumps(schematic)) == loaded
+        assert schematic.model_dump() == loaded.model_dump()
+
+
+class TestFirstUpdate:
+    """Test updating a schematic that has not been updated before"""
+
+    def test_without_old_text(self, text):
+        """Test items are compared once built when no digests are known"""
+        schematic = read_in_schematic_from_string(text)
+        second = schematic.symbols[1]
+        new_text = _edit(text, SYMBOL_UUID, "(at 100 90 0)", "(at 120 90 0)")
+        result = update(schematic, new_text)
+        assert [new.uuid for _, new in result.changed] == [SYMBOL_UUID]
+        assert result.added == result.removed == result.fields == []
+        assert schematic.symbols[1] is second
+
+    def test_with_old_text(self, text, monkeypatch):
+        """Test the text the schematic was loaded from gives the digests"""
+        schematic = read_in_schematic_from_string(text)
+        parsed = []
+        read_item = kicad_sexp._read_item_from_string
+        monkeypatch.setattr(
+            kicad_sexp,
+            "_read_item_from_string",
+            lambda content, atoms=None: parsed.append(content)
+            or read_item(content, atoms),
+        )
+        new_text = _edit(text, SYMBOL_UUID, "(at 100 90 0)", "(at 120 90 0)")
+        result = update(schematic, new_text, old_text=text)
+        assert len(parsed) == 1 and len(result.changed) == 1
+        assert schematic == read_in_schematic_from_string(new_text)
+
+    def test_trusted(self, text):
+        """Test trusted updates build the same items"""
+        schematic = read_in_schematic_from_string(text, trusted=True)
+        new_text = _edit(text, SYMBOL_UUID, "(at 100 90 0)", "(at 120 90 0)")
+        update(schematic, new_text, old_text=text, trusted=True)
+        assert schematic == read_in_schematic_from_string(new_text)
+
+    def test_partial_load(self, text):
+        """Test a schematic loaded with some fields gains the others"""
+        schematic = read_in_schematic_from_string(text, fields=["wires"])
+        update(schematic, text, old_text=text)
+        assert schematic == read_in_schematic_from_string(text)
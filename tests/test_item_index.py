@@ -0,0 +1,138 @@
+import os
+import shutil
+
+import pytest
+
+from pykicad.parser import item_index
+from pykicad.parser.item_index import (SIDECAR_SUFFIX, ItemIndex,
+                                       clear_indexes, get_element_by_uuid,
+                                       index_file)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "sample.kicad_sch")
+    shutil.copy("testdata/sample.kicad_sch", path)
+    yield path
+    clear_indexes()
+
+
+class TestItemIndex:
+    """Test the scan for top-level items"""
+
+    def test_entries(self, path):
+        """Test items are found with their names, offsets and UUIDs"""
+        index = ItemIndex.build(path)
+        names = [entry.name for entry in index.entries]
+        assert names[:7] == [
+            "version",
+            "generator",
+            "generator_version",
+            "uuid",
+            "paper",
+            "title_block",
+            "lib_symbols",
+        ]
+        with open(path, "rb") as f:
+            content = f.read()
+        for entry in index.entries:
+            text = content[entry.start : entry.end].decode()
+            assert text.startswith("(" + entry.name)
+            assert text.endswith(")")
+
+    def test_only_own_uuid(self, path, schematic):
+        """Test the UUIDs of nested items, such as pins, are not indexed"""
+        index = ItemIndex.build(path)
+        symbol = schematic.symbols[0]
+        assert index.by_uuid[symbol.uuid].name == "symbol"
+        lib_symbols = [e for e in index.entries if e.name == "lib_symbols"]
+        assert lib_symbols[0].uuid is None
+
+    def test_save_and_load(self, path, tmp_path):
+        """Test an index reads back equal from a file"""
+        index = ItemIndex.build(path)
+        index.save(str(tmp_path / "saved.idx"))
+        loaded = ItemIndex.load(str(tmp_path / "saved.idx"))
+        assert loaded.entries == index.entries
+        assert loaded.is_current(path)
+
+
+class TestIndexFile:
+    """Test indexes are reused while the file is unchanged"""
+
+    def test_sidecar_is_written(self, path):
+        """Test the index is saved next to the file when asked"""
+        index = index_file(path, sidecar=True)
+        assert os.path.exists(path + SIDECAR_SUFFIX)
+        clear_indexes()
+        assert index_file(path, sidecar=True).entries == index.entries
+
+    def test_no_sidecar(self, path):
+        """Test the index is kept in memory only by default"""
+        index_file(path)
+        get_element_by_uuid(path, "not-a-uuid")
+        assert not os.path.exists(path + SIDECAR_SUFFIX)
+
+    def test_least_recently_used_dropped(self, path, tmp_path, monkeypatch):
+        """Test only the last MAX_INDEXES files are kept in memory"""
+        monkeypatch.setattr(item_index, "MAX_INDEXES", 2)
+        other = str(tmp_path / "other.kicad_sch")
+        third = str(tmp_path / "third.kicad_sch")
+        shutil.copy(path, other)
+        shutil.copy(path, third)
+        index = index_file(path)
+        index_file(other)
+        assert index_file(path) is index
+        index_file(third)
+        assert index_file(path) is index
+        assert len(item_index._indexes) == 2
+        assert os.path.abspath(other) not in item_index._indexes
+
+    def test_memory_reuse(self, path):
+        """Test the same index is returned for an unchanged file"""
+        assert index_file(path) is index_file(path)
+
+    def test_rebuilt_after_change(self, path):
+        """Test a changed file is scanned again"""
+        index = index_file(path)
+        with open(path, "a") as f:
+            f.write("\n")
+        assert index_file(path) is not index
+        clear_indexes()
+        assert index_file(path).is_current(path)
+
+    def test_unreadable_sidecar(self, path):
+        """Test a broken sidecar is replaced"""
+        with open(path + SIDECAR_SUFFIX, "w") as f:
+            f.write("{")
+        assert index_file(path, sidecar=True).by_uuid
+        assert ItemIndex.load(path + SIDECAR_SUFFIX).is_current(path)
+
+
+class TestGetElementByUuid:
+    """Test reading single items by UUID"""
+
+    def test_matches_schematic(self, path, schematic):
+        """Test each item equals the one in the full schematic"""
+        items = [
+            *schematic.symbols,
+            *schematic.wires,
+            *schematic.junctions,
+            *schematic.labels,
+            *schematic.global_labels,
+            *schematic.hierarchical_labels,
+        ]
+        for item in items:
+            assert get_element_by_uuid(path, item.uuid) == item
+            assert get_element_by_uuid(path, item.uuid, trusted=True) == item
+        # Top-level polylines and text have no model a Schematic fills
+        index = ItemIndex.build(path)
+        graphics = [e for e in index.entries if e.name in ("polyline", "text")]
+        assert len(graphics) == 4
+        for entry in graphics:
+            with pytest.raises(ValueError, match="cannot be read on their own"):
+                get_element_by_uuid(path, entry.uuid)
+
+    def test_missing_uuid(self, path):
+        """Test an unknown UUID gives None"""
+        assert get_element_by_uuid(path, "not-a-uuid") is None
@@ -0,0 +1,119 @@
+import pytest
+
+from pykicad.models.schematic import Label
+from pykicad.parser.kicad_sexp import (read_in_netlist_from_netlist,
+                                       read_in_netlist_from_string)
+from pykicad.parser.writer import (format_sexp, write_netlist_to_netlist,
+                                   write_netlist_to_string)
+
+
+@pytest.fixture
+def netlist():
+    return read_in_netlist_from_netlist("testdata/sample.net")
+
+
+def _nets(netlist):
+    return {net.name: [(n.ref, n.pin) for n in net.nodes] for net in netlist.nets}
+
+
+class TestFormatSexp:
+    """Test nested lists are written as S-expressions"""
+
+    def test_flat_list(self):
+        """Test a list of atoms is written on one line"""
+        assert format_sexp(["ref", "R1"]) == '(ref "R1")'
+
+    def test_nested_list(self):
+        """Test nested lists are indented with tabs"""
+        text = format_sexp(["comp", ["ref", "R1"], ["value", "10k"]])
+        assert text == '(comp\n\t(ref "R1")\n\t(value "10k")\n)'
+
+    def test_escaping(self):
+        """Test quotes and backslashes are escaped"""
+        assert format_sexp(["name", 'a "b" \\c']) == '(name "a \\"b\\" \\\\c")'
+
+
+class TestWriteNetlist:
+    """Test netlists are written back to files"""
+
+    def test_round_trip(self, netlist):
+        """Test a written netlist reads back equal"""
+        assert read_in_netlist_from_string(write_netlist_to_string(netlist)) == netlist
+
+    def test_write_file(self, netlist, tmp_path):
+        """Test writing a netlist to a file"""
+        path = tmp_path / "out.net"
+        write_netlist_to_netlist(netlist, str(path))
+        assert read_in_netlist_from_netlist(str(path)) == netlist
+
+
+class TestSchematicToNetlist:
+    """Test netlists are built from the connectivity of a schematic"""
+
+    def test_sample(self, schematic):
+        """Test the netlist of the sample schematic"""
+        netlist = schematic.to_netlist("sample.kicad_sch")
+        assert netlist.design.source == "sample.kicad_sch"
+        assert netlist.design.sheet.title_block.title == "Sample Schematic"
+        assert len(netlist.design.sheet.title_block.comments) == 4
+        assert [c.refdes for c in netlist.components] == ["C1", "R1"]
+        r1 = netlist.components[1]
+        assert (r1.value, r1.footprint) == ("10k", "Resistor_SMD:R_0805_2012Metric")
+        assert (r1.libsource.lib, r1.libsource.part) == ("Device", "R")
+        assert [(p.lib, p.part) for p in netlist.libparts] == [
+            ("Device", "C"),
+            ("Device", "R"),
+        ]
+        assert netlist.libraries.logical == "Device"
+        # No pin is connected, and the labelled wire has no pins
+        assert _nets(netlist) == {
+            "unconnected-(C1-Pad1)": [("C1", "1")],
+            "unconnected-(C1-Pad2)": [("C1", "2")],
+            "unconnected-(R1-Pad1)": [("R1", "1")],
+            "unconnected-(R1-Pad2)": [("R1", "2")],
+        }
+        assert [net.code for net in netlist.nets] == ["1", "2", "3", "4"]
+
+    def test_connected_pins(self, schematic, make_wire):
+        """Test pins joined by a wire share a net named after a pin"""
+        schematic.wires.append(make_wire(100, 93.81, 120, 93.81))
+        schematic.wires.append(make_wire(120, 93.81, 120, 96.19))
+        nets = _nets(schematic.to_netlist())
+        assert nets["Net-(C1-Pad1)"] == [("C1", "1"), ("R1", "2")]
+
+    def test_labelled_net(self, schematic, make_wire):
+        """Test nets with a label are named after it"""
+        schematic.wires.append(make_wire(100, 80, 100, 86.19))
+        nets = _nets(schematic.to_netlist())
+        assert nets["/SIGNAL_A"] == [("R1", "1")]
+
+    def test_global_label(self, schematic, make_wire):
+        """Test global labels name nets without a sheet prefix"""
+        schematic.wires.append(make_wire(120, 103.81, 130, 103.81))
+        schematic.global_labels.append(
+            Label.model_validate({"VCC": {"at": [130, 103.81, 0]}})
+        )
+        nets = _nets(schematic.to_netlist())
+        assert nets["VCC"] == [("C1", "2")]
+
+    def test_power_symbols_are_not_components(self, schematic):
+        """Test power symbols name their net but are not listed"""
+        # A power symbol placed over R1, so both its pins land on R1
+        lib_symbol = schematic.lib_symbols[0]
+        schematic.lib_symbols.append(
+            lib_symbol.model_copy(update={"library": "power:GND"})
+        )
+        power = schematic.symbols[0].model_copy(
+            update={"lib_id": "power:GND", "value": "GND"}
+        )
+        schematic.symbols.append(power)
+        netlist = schematic.to_netlist()
+        assert [c.refdes for c in netlist.components] == ["C1", "R1"]
+        assert _nets(netlist)["GND"] == [("R1", "1"), ("R1", "2")]
+
+    def test_written_netlist_reads_back(self, schematic, make_wire):
+        """Test the built netlist survives writing and reading"""
+        schematic.wires.append(make_wire(100, 93.81, 120, 93.81))
+        schematic.wires.append(make_wire(120, 93.81, 120, 96.19))
+        netlist = schematic.to_netlist("sample.kicad_sch")
+        assert read_in_netlist_from_string(write_netlist_to_string(netlist)) == netlist
@@ -0,0 +1,102 @@
+import pytest
+
+from pykicad.models.netlist import Net, Node
+from pykicad.parser.kicad_sexp import read_in_netlist_from_netlist
+
+
+@pytest.fixture
+def netlist():
+    return read_in_netlist_from_netlist("testdata/sample.net")
+
+
+def _net(code, name, *pins):
+    nodes = [Node(ref=ref, pin=pin) for ref, pin in pins]
+    return Net(code=code, name=name, class_name="Default", nodes=nodes)
+
+
+class TestLookups:
+    """Test the indexed lookups of a netlist"""
+
+    def test_component_by_ref(self, netlist):
+        """Test finding components by reference designator"""
+        assert netlist.component_by_ref("R1") is netlist.components[1]
+        assert netlist.component_by_ref("R9") is None
+
+    def test_net_by_name_and_code(self, netlist):
+        """Test finding nets by name and by code"""
+        assert netlist.net_by_name("GND") is netlist.nets[1]
+        assert netlist.net_by_code("1") is netlist.nets[0]
+        assert netlist.net_by_code(2) is netlist.nets[1]
+        assert netlist.net_by_name("VCC") is None
+
+    def test_net_of_pin(self, netlist):
+        """Test finding the net of a component pin"""
+        assert netlist.net_of_pin("C1", "2").name == "GND"
+        assert netlist.net_of_pin("C1", "3") is None
+
+    def test_nets_of_component(self, netlist):
+        """Test finding the nets of a component in netlist order"""
+        names = [net.name for net in netlist.nets_of_component("R1")]
+        assert names == ["/SIGNAL_A", "GND"]
+        assert netlist.nets_of_component("R9") == []
+
+    def test_component_on_a_net_twice(self, netlist):
+        """Test a net is listed once for a component with several pins on it"""
+        netlist.nets = [_net("1", "GND", ("R1", "1"), ("C1", "1"), ("R1", "2"))]
+        assert netlist.nets_of_component("R1") == netlist.nets
+
+    def test_model_unchanged(self, netlist):
+        """Test indexing does not change equality or serialisation"""
+        expected = read_in_netlist_from_netlist("testdata/sample.net")
+        netlist.component_by_ref("R1")
+        assert netlist == expected
+        assert netlist.model_dump() == expected.model_dump()
+
+
+class TestInvalidation:
+    """Test the indexes follow changes to the netlist"""
+
+    def test_append_component(self, netlist):
+        """Test a component appended after a lookup is found"""
+        assert netlist.component_by_ref("U1") is None
+        component = netlist.components[0].model_copy(update={"refdes": "U1"})
+        netlist.components.append(component)
+        assert netlist.component_by_ref("U1") is component
+
+    def test_remove_net(self, netlist):
+        """Test a removed net is no longer found"""
+        assert netlist.net_of_pin("R1", "2") is not None
+        del netlist.nets[1]
+        assert netlist.net_of_pin("R1", "2") is None
+        assert netlist.net_by_name("GND") is None
+
+    def test_replace_list(self, netlist):
+        """Test assigning a new list of nets"""
+        netlist.net_by_name("GND")
+        netlist.nets = [_net("1", "VCC", ("R1", "1"))]
+        assert netlist.net_by_name("GND") is None
+        assert netlist.net_of_pin("R1", "1").name == "VCC"
+
+    def test_change_nodes(self, netlist):
+        """Test nodes added to a net after a lookup are found"""
+        assert netlist.net_of_pin("U1", "1") is None
+        netlist.nets[0].nodes.append(Node(ref="U1", pin="1"))
+        assert netlist.net_of_pin("U1", "1") is netlist.nets[0]
+
+    def test_setitem(self, netlist):
+        """Test replacing an item in place"""
+        netlist.net_by_name("GND")
+        netlist.nets[1] = _net("2", "AGND", ("C1", "2"))
+        assert netlist.net_by_name("GND") is None
+        assert netlist.net_of_pin("C1", "2").name == "AGND"
+        assert netlist.net_of_pin("R1", "2") is None
+
+    def test_index_reused(self, netlist):
+        """Test the index is only rebuilt after a change"""
+        netlist.component_by_ref("R1")
+        index = netlist._index
+        netlist.net_by_name("GND")
+        assert netlist._index is index
+        netlist.components.reverse()
+        netlist.component_by_ref("R1")
+        assert netlist._index is not index
@@ -1,8 +1,29 @@
-import pytest
+import copy
+import pickle
+import random
+import sys
+import warnings
 
-from pykicad.parser.kicad_sexp import (_normalized_bools, _parse_all_strings,
-                                       _strip_single_element_lists, parse_sexp,
-                                       read_in_schematic_from_kicad_sch)
+import pytest
+from simp_sexp import Sexp
+
+from pykicad.models.schematic import (Point, PointTuple, Position,
+                                      PositionTuple, Schematic)
+from pykicad.parser import kicad_sexp
+from pykicad.parser.kicad_sexp import (ATOM, CLOSE, OPEN, _normalized_bools,
+                                       _parse_all_strings,
+                                       _parse_sexp_recursive,
+                                       _strip_single_element_lists,
+                                       iter_global_labels,
+                                       iter_hierarchical_labels,
+                                       iter_junctions, iter_labels,
+                                       iter_sexp_events, iter_symbols,
+                                       iter_wires, parse_sexp,
+                                       read_in_netlist_from_netlist,
+                                       read_in_schematic_from_kicad_sch,
+                                       read_in_schematic_from_string,
+                                       read_sexp_fields, read_sexp_from_file,
+                                       read_sexp_from_string, stream_netlist)
 
 
 class TestParseAllStrings:
@@ -192,3 +213,566 @@ class TestParseKiCadSch:
                 assert hasattr(label, "fields_autoplaced")
                 assert hasattr(label, "effects")
                 assert hasattr(label, "uuid")
+
+
+def _outcome(parse, text):
+    """Return the repr of the parsed result, or the exception type raised"""
+    try:
+        return repr(parse(text))
+    except Exception as e:
+        return type(e)
+
+
+class TestReadSexpFromString:
+    """Test that the single-pass parser matches Sexp followed by parse_sexp"""
+
+    def _legacy(self, text):
+        return _parse_sexp_recursive(Sexp(text))
+
+    SNIPPETS = [
+        "(key value1 value2)",
+        "(key (item1) (item2))",
+        "((key1 value1) (key2 value2))",
+        "((key value1) (key value2) (other other_value))",
+        '(property "Reference" "R1" (at 1 2 0) (effects (font (size 1.27 1.27)) hide))',
+        "(pin passive line (at 0 3.81 270) (length 1.27))",
+        "(pin_numbers hide)",
+        "(effects (font (size 1 1)) (hide yes))",
+        "(comment 1 \"a\") ",
+        "(a (hide) (hide no))",
+        "((a b) \"c\")",
+        '(text "escaped \\"quote\\" and \\\\ backslash\\n" (at 0 0 0))',
+        "(value 0x10 010 1e3 -2.5 nan inf)",
+        "(single 'quoted' \"mixed'quote\")",
+        "(unclosed (list",
+        "(extra))) (second)",
+        "(key value) trailing",
+        "atom",
+        "",
+        "()",
+        "(key ())",
+        '"unclosed',
+        "(a (b) c (d e))",
+    ]
+
+    def test_sample_schematic_identical(self):
+        """Test the sample schematic parses to exactly the same structure"""
+        with open("testdata/sample.kicad_sch") as f:
+            content = f.read()
+        expected = _parse_sexp_recursive(Sexp(content))
+        result = read_sexp_from_string(content)
+        assert result == expected
+        assert repr(result) == repr(expected)
+        assert read_sexp_from_file("testdata/sample.kicad_sch") == expected
+
+    @pytest.mark.parametrize("text", SNIPPETS)
+    def test_snippets_identical(self, text):
+        """Test hand written snippets, including invalid ones"""
+        legacy = _outcome(self._legacy, text)
+        assert _outcome(read_sexp_from_string, text) == legacy
+
+    def test_random_expressions_identical(self):
+        """Test randomly generated expressions give identical results or errors"""
+        atoms = ["a", "key", "hide", "yes", "no", "xy", "pin", "_required",
+                 "1", "2.5", "-3", "nan", '"s"', '""', '"a\\"b"', "'q'"]
+
+        def generate(depth):
+            if depth > 4 or rng.random() < 0.3:
+                return rng.choice(atoms)
+            items = [generate(depth + 1) for _ in range(rng.randint(0, 5))]
+            return "(" + " ".join(items) + ")"
+
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = generate(0)
+            legacy = _outcome(self._legacy, text)
+            assert _outcome(read_sexp_from_string, text) == legacy, text
+
+    @pytest.mark.parametrize("memory_map", [False, True])
+    def test_repeated_strings_are_shared(self, tmp_path, memory_map):
+        """Test repeated keywords and short strings are single objects"""
+        path = tmp_path / "repeated.sexp"
+        path.write_text('(root (property "Value" "10k") (property "Value" "10k"))')
+        parsed = read_sexp_from_file(str(path), memory_map=memory_map)
+        first, second = parsed["root"]["properties"]
+        assert next(iter(first)) is next(iter(second))
+        assert first["Value"] is second["Value"]
+        assert next(iter(parsed)) is sys.intern("root")
+
+    def test_sharing_does_not_change_result(self, monkeypatch):
+        """Test a schematic parses the same with strings shared or not"""
+        with open("testdata/sample.kicad_sch") as f:
+            content = f.read()
+        shared = read_in_schematic_from_string(content)
+        monkeypatch.setattr(kicad_sexp, "_MAX_SHARED_STRING", 0)
+        assert read_in_schematic_from_string(content) == shared
+
+
+class TestIterativeParseSexp:
+    """Test that parse_sexp matches the recursive reference implementation"""
+
+    def test_sample_schematic_identical(self):
+        """Test the sample schematic gives the same structure"""
+        with open("testdata/sample.kicad_sch") as f:
+            content = f.read()
+        result = parse_sexp(Sexp(content))
+        assert repr(result) == repr(_parse_sexp_recursive(Sexp(content)))
+
+    def test_input_is_not_modified(self):
+        """Test parse_sexp leaves the input lists untouched"""
+        sexp = ["effects", ["font", ["size", 1, 1]], "hide"]
+        assert parse_sexp(sexp) == {
+            "effects": {"font": {"size": [1, 1]}, "hide": "yes"}
+        }
+        assert sexp == ["effects", ["font", ["size", 1, 1]], "hide"]
+
+    def test_random_expressions_identical(self):
+        """Test randomly generated lists give identical results or errors"""
+        atoms = ["a", "key", "hide", "yes", "no", "xy", "_required", 1, 2.5]
+
+        def generate(depth):
+            if depth > 4 or rng.random() < 0.3:
+                return rng.choice(atoms)
+            return [generate(depth + 1) for _ in range(rng.randint(0, 5))]
+
+        rng = random.Random(1)
+        for _ in range(2000):
+            sexp = generate(0)
+            if not isinstance(sexp, list):
+                continue
+            legacy = _outcome(_parse_sexp_recursive, Sexp(sexp))
+            assert _outcome(parse_sexp, sexp) == legacy, sexp
+
+
+def _lists_from_events(events):
+    """Rebuild nested lists from S-expression events"""
+    stack = [[]]
+    for event, value in events:
+        if event == OPEN:
+            stack.append([])
+        elif event == CLOSE:
+            item = stack.pop()
+            stack[-1].append(item)
+        else:
+            stack[-1].append(value)
+    return stack[0]
+
+
+class TestIterSexpEvents:
+    """Test the streaming event reader"""
+
+    def test_simple_events(self, tmp_path):
+        """Test the events produced for a small expression"""
+        path = tmp_path / "simple.kicad_sch"
+        path.write_text('(kicad_sch (version 20250824) (paper "A4"))')
+        assert list(iter_sexp_events(path)) == [
+            (OPEN, None),
+            (ATOM, "kicad_sch"),
+            (OPEN, None),
+            (ATOM, "version"),
+            (ATOM, 20250824),
+            (CLOSE, None),
+            (OPEN, None),
+            (ATOM, "paper"),
+            (ATOM, "A4"),
+            (CLOSE, None),
+            (CLOSE, None),
+        ]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+    def test_sample_schematic_any_chunk_size(self, chunk_size):
+        """Test events rebuild the sample schematic whatever the chunk size"""
+        events = iter_sexp_events("testdata/sample.kicad_sch", chunk_size)
+        (sexp,) = _lists_from_events(events)
+        assert parse_sexp(sexp) == read_sexp_from_file("testdata/sample.kicad_sch")
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+    def test_tokens_split_across_chunks(self, tmp_path, chunk_size):
+        """Test quoted strings, escapes and numbers split between chunks"""
+        path = tmp_path / "escapes.kicad_sch"
+        path.write_text(
+            '(text "a \\"quoted\\" \\\\ string" \'single\' -12.5e3 a\\ b))'
+        )
+        assert _lists_from_events(iter_sexp_events(path, chunk_size)) == [
+            ["text", 'a "quoted" \\ string', "single", -12.5e3, "a\\ b"]
+        ]
+
+    def test_unclosed_quote_raises(self, tmp_path):
+        """Test an unterminated string is reported"""
+        path = tmp_path / "unclosed.kicad_sch"
+        path.write_text('(text "never closed)')
+        with pytest.raises(ValueError):
+            list(iter_sexp_events(path, 4))
+
+    def test_unclosed_lists_are_closed(self, tmp_path):
+        """Test lists left open at the end of the file are closed"""
+        path = tmp_path / "open.kicad_sch"
+        path.write_text("(a (b c")
+        assert _lists_from_events(iter_sexp_events(path)) == [["a", ["b", "c"]]]
+
+
+class TestReadSexpFields:
+    """Test reading only selected top-level items"""
+
+    def test_header_fields(self):
+        """Test the header fields match a full parse"""
+        full = read_sexp_from_file("testdata/sample.kicad_sch")["kicad_sch"]
+        fields = read_sexp_fields(
+            "testdata/sample.kicad_sch", ["version", "uuid", "title_block"]
+        )
+        assert fields == {
+            "version": full["version"],
+            "uuid": full["uuid"],
+            "title_block": full["title_block"],
+        }
+
+    def test_missing_fields_are_left_out(self):
+        """Test names that are not in the file are not in the result"""
+        fields = read_sexp_fields("testdata/sample.kicad_sch", ["paper", "missing"])
+        assert fields == {"paper": "A4"}
+
+    def test_stops_reading_once_found(self, tmp_path):
+        """Test nothing after the requested items is read"""
+        path = tmp_path / "truncated.kicad_sch"
+        path.write_text('(kicad_sch (version 1) (uuid "u") (text "never closed')
+        with pytest.raises(ValueError):
+            read_sexp_from_file(path)
+        assert read_sexp_fields(path, ["version", "uuid"], chunk_size=8) == {
+            "version": 1,
+            "uuid": "u",
+        }
+
+
+class TestElementIterators:
+    """Test streaming schematic elements as models"""
+
+    @pytest.mark.parametrize(
+        "iterate, field",
+        [
+            (iter_wires, "wires"),
+            (iter_junctions, "junctions"),
+            (iter_symbols, "symbols"),
+            (iter_labels, "labels"),
+            (iter_global_labels, "global_labels"),
+            (iter_hierarchical_labels, "hierarchical_labels"),
+        ],
+    )
+    def test_matches_schematic(self, iterate, field):
+        """Test each iterator yields the same models as the full schematic"""
+        schematic = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        items = list(iterate("testdata/sample.kicad_sch"))
+        assert items
+        assert items == getattr(schematic, field)
+
+    def test_symbols_skip_library_symbols(self):
+        """Test only placed symbols are yielded, not lib_symbols entries"""
+        lib_ids = [s.lib_id for s in iter_symbols("testdata/sample.kicad_sch")]
+        assert lib_ids == ["Device:R", "Device:C"]
+
+    def test_is_lazy(self):
+        """Test elements are produced one at a time"""
+        wires = iter_wires("testdata/sample.kicad_sch")
+        first = next(wires)
+        assert first.uuid == "cccccccc-cccc-cccc-cccc-cccccccccccc"
+        wires.close()
+
+
+class TestStreamNetlist:
+    """Test streaming the components, libparts and nets of a netlist"""
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    @pytest.mark.parametrize("chunk_size", [7, 1 << 16])
+    def test_matches_netlist(self, trusted, chunk_size):
+        """Test the streamed models equal those of the full netlist"""
+        netlist = read_in_netlist_from_netlist("testdata/sample.net")
+        stream = stream_netlist("testdata/sample.net", trusted, chunk_size)
+        assert stream.version == netlist.version
+        assert stream.design == netlist.design
+        assert list(stream.items) == [
+            *netlist.components,
+            *netlist.libparts,
+            *netlist.nets,
+        ]
+
+    def test_is_lazy(self, tmp_path):
+        """Test items are read as they are requested"""
+        path = tmp_path / "truncated.net"
+        with open("testdata/sample.net") as f:
+            content = f.read()
+        # Cut the file inside the second component
+        path.write_text(content[: content.index('(ref "R1")')])
+        stream = stream_netlist(str(path), chunk_size=16)
+        assert next(stream.items).refdes == "C1"
+        stream.items.close()
+
+    def test_missing_design(self, tmp_path):
+        """Test a file without a design is rejected"""
+        path = tmp_path / "empty.net"
+        path.write_text('(export (version "E") (nets (net (code "1"))))')
+        with pytest.raises(ValueError):
+            stream_netlist(str(path))
+
+
+class TestProjectionLoading:
+    """Test loading only some schematic fields"""
+
+    def test_selected_fields_match_full_load(self):
+        """Test selected fields are identical to a full load"""
+        full = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        schematic = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", fields={"symbols", "wires"}
+        )
+        assert schematic.symbols == full.symbols
+        assert schematic.wires == full.wires
+        assert schematic.uuid == full.uuid
+        assert schematic.version == full.version
+
+    def test_other_fields_are_defaults(self):
+        """Test fields that were not selected are left at their defaults"""
+        schematic = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", fields={"title_block"}
+        )
+        assert schematic.title_block.rev == "v1.0"
+        assert schematic.lib_symbols == []
+        assert schematic.symbols == []
+        assert schematic.labels == []
+        assert schematic.sheet_instances is None
+
+    def test_unknown_field_raises(self):
+        """Test a field that is not on Schematic is rejected"""
+        with pytest.raises(ValueError):
+            read_in_schematic_from_kicad_sch(
+                "testdata/sample.kicad_sch", fields={"wire"}
+            )
+
+    def test_skipped_items_with_parentheses_in_strings(self, tmp_path):
+        """Test parentheses inside strings of skipped items are ignored"""
+        path = tmp_path / "strings.kicad_sch"
+        path.write_text(
+            '(kicad_sch (version 1) (text "(unbalanced \\" (" (at 0 0 0))'
+            " (paper A4) (odd \\( name) (uuid u))"
+        )
+        parsed = read_sexp_from_file(path, ["version", "paper", "uuid"])
+        assert parsed == {"kicad_sch": {"version": 1, "paper": "A4", "uuid": "u"}}
+
+
+class TestLazyLoading:
+    """Test loading schematic sections on first use"""
+
+    def test_fields_match_full_load(self):
+        """Test every field equals the eagerly loaded one"""
+        full = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        lazy = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch", lazy=True)
+        for name in Schematic.model_fields:
+            assert getattr(lazy, name) == getattr(full, name)
+        assert lazy.model_fields_set == full.model_fields_set
+
+    def test_sections_load_on_access(self):
+        """Test only the sections that are read are loaded"""
+        lazy = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch", lazy=True)
+        assert "wires" in lazy.unloaded_fields
+        assert lazy.uuid == "11111111-1111-1111-1111-111111111111"
+        wires = lazy.wires
+        assert len(wires) == 2
+        assert "wires" not in lazy.unloaded_fields
+        assert "symbols" in lazy.unloaded_fields
+        assert lazy.wires is wires
+
+    def test_is_a_schematic(self):
+        """Test a lazy schematic compares and dumps like an eager one"""
+        full = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        lazy = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch", lazy=True)
+        assert isinstance(lazy, Schematic)
+        assert full == lazy
+        assert lazy.model_dump() == full.model_dump()
+        assert lazy.unloaded_fields == ()
+
+    def test_pickle_and_copy(self):
+        """Test pickling and copying load the remaining fields"""
+        full = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        lazy = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch", lazy=True)
+        assert pickle.loads(pickle.dumps(lazy)) == full
+        lazy = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch", lazy=True)
+        assert copy.deepcopy(lazy) == full
+
+    def test_trusted(self):
+        """Test lazy loading without validation"""
+        full = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        lazy = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", trusted=True, lazy=True
+        )
+        assert lazy.symbols == full.symbols
+
+    def test_missing_section_is_default(self, tmp_path):
+        """Test a section absent from the file loads as its default"""
+        path = tmp_path / "header.kicad_sch"
+        path.write_text(
+            '(kicad_sch (version 1) (generator "g") (generator_version "1")'
+            ' (uuid "u") (paper "A4"))'
+        )
+        lazy = read_in_schematic_from_kicad_sch(str(path), lazy=True)
+        assert lazy.wires == []
+        assert "wires" not in lazy.model_fields_set
+
+    def test_fields_cannot_be_combined(self):
+        """Test lazy loading rejects a field selection"""
+        with pytest.raises(ValueError):
+            read_in_schematic_from_kicad_sch(
+                "testdata/sample.kicad_sch", fields={"wires"}, lazy=True
+            )
+
+
+class TestMemoryMappedInput:
+    """Test parsing files from memory-mapped bytes"""
+
+    @pytest.mark.parametrize(
+        "path", ["testdata/sample.kicad_sch", "testdata/sample.net"]
+    )
+    def test_matches_text_parse(self, path):
+        """Test the result equals parsing the text of the file"""
+        assert read_sexp_from_file(path, memory_map=True) == read_sexp_from_file(path)
+
+    def test_models_match(self):
+        """Test the schematic and netlist loaders give equal models"""
+        path = "testdata/sample.kicad_sch"
+        assert read_in_schematic_from_kicad_sch(
+            path, memory_map=True
+        ) == read_in_schematic_from_kicad_sch(path)
+        assert read_in_schematic_from_kicad_sch(
+            path, trusted=True, memory_map=True
+        ) == read_in_schematic_from_kicad_sch(path)
+        path = "testdata/sample.net"
+        assert read_in_netlist_from_netlist(
+            path, memory_map=True
+        ) == read_in_netlist_from_netlist(path)
+
+    def test_strings(self, tmp_path):
+        """Test escapes, line endings and non-ASCII text in strings"""
+        path = tmp_path / "strings.sexp"
+        path.write_bytes(
+            '(root (a "say \\"hi\\"") (b "one\r\ntwo\rthree") (c "µΩ 1.5"))'.encode()
+        )
+        parsed = read_sexp_from_file(path, memory_map=True)
+        assert parsed == read_sexp_from_file(path)
+        assert parsed["root"]["b"] == "one\ntwo\nthree"
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file fails like the text parse does"""
+        path = tmp_path / "empty.sexp"
+        path.write_text("")
+        with pytest.raises(Exception) as expected:
+            read_sexp_from_file(path)
+        with pytest.raises(expected.type):
+            read_sexp_from_file(path, memory_map=True)
+
+    def test_cannot_select_items(self):
+        """Test memory mapping rejects item selection"""
+        with pytest.raises(ValueError):
+            read_sexp_from_file("testdata/sample.net", ["nets"], memory_map=True)
+        with pytest.raises(ValueError):
+            read_in_schematic_from_kicad_sch(
+                "testdata/sample.kicad_sch", lazy=True, memory_map=True
+            )
+
+
+class TestTrustedLoading:
+    """Test building models without validation"""
+
+    def test_schematic_matches_validated(self):
+        """Test the trusted schematic equals the validated one"""
+        validated = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        trusted = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", trusted=True
+        )
+        assert trusted == validated
+        assert repr(trusted) == repr(validated)
+        assert trusted.model_dump(exclude_unset=True) == validated.model_dump(
+            exclude_unset=True
+        )
+
+    def test_netlist_matches_validated(self):
+        """Test the trusted netlist equals the validated one"""
+        validated = read_in_netlist_from_netlist("testdata/sample.net")
+        trusted = read_in_netlist_from_netlist("testdata/sample.net", trusted=True)
+        assert trusted == validated
+        assert repr(trusted) == repr(validated)
+
+    def test_with_fields(self):
+        """Test trusted loading of selected fields"""
+        trusted = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", fields={"wires"}, trusted=True
+        )
+        assert trusted.wires == read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch"
+        ).wires
+        assert trusted.symbols == []
+
+
+class TestPointTuples:
+    """Test loading points and positions as named tuples"""
+
+    @pytest.mark.parametrize("options", [{}, {"lazy": True}, {"memory_map": True}])
+    def test_matches_models(self, options):
+        """Test the tuples equal the models of a plain load"""
+        plain = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        tuples = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", trusted=True, point_tuples=True, **options
+        )
+        assert tuples == plain
+        assert plain == tuples
+        assert isinstance(tuples.wires[0].points[0], PointTuple)
+        assert isinstance(tuples.junctions[0].at, PointTuple)
+        assert isinstance(tuples.labels[0].at, PositionTuple)
+        assert isinstance(tuples.symbols[0].properties[0].at, PositionTuple)
+
+    def test_tuple_behaviour(self):
+        """Test the tuples keep the attributes of the models and hash"""
+        point = PointTuple.from_data([1, "2.5"])
+        assert (point.x, point.y) == (1.0, 2.5)
+        assert point == (1.0, 2.5)
+        assert point == Point.model_validate([1, 2.5])
+        assert point != Point.model_validate([1, 3])
+        assert point != Position.model_validate([1, 2.5, 0])
+        assert {point: 1}[(1.0, 2.5)] == 1
+        position = PositionTuple.from_data([1, 2, 90])
+        assert position.angle == 90.0
+        assert position == Position.model_validate([1, 2, 90])
+
+    def test_requires_trusted(self):
+        """Test validated loads cannot build tuples"""
+        with pytest.raises(ValueError, match="trusted"):
+            read_in_schematic_from_kicad_sch(
+                "testdata/sample.kicad_sch", point_tuples=True
+            )
+        with pytest.raises(ValueError, match="trusted"):
+            read_in_schematic_from_kicad_sch(
+                "testdata/sample.kicad_sch", memory_map=True, point_tuples=True
+            )
+
+    def test_dump(self):
+        """Test the tuples dump like the models without warnings"""
+        plain = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        tuples = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", trusted=True, point_tuples=True
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert tuples.model_dump() == plain.model_dump()
+            assert tuples.model_dump_json() == plain.model_dump_json()
+
+    def test_pickle(self):
+        """Test tuples survive pickling"""
+        tuples = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", trusted=True, point_tuples=True
+        )
+        loaded = pickle.loads(pickle.dumps(tuples))
+        assert loaded == tuples
+        assert isinstance(loaded.wires[0].points[0], PointTuple)
+
+    def test_connectivity(self):
+        """Test nets are found the same way from tuples"""
+        plain = read_in_schematic_from_kicad_sch("testdata/sample.kicad_sch")
+        tuples = read_in_schematic_from_kicad_sch(
+            "testdata/sample.kicad_sch", trusted=True, point_tuples=True
+        )
+        assert tuples.to_netlist() == plain.to_netlist()
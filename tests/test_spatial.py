@@ -0,0 +1,73 @@
+from pykicad.models.spatial import (SpatialIndex, _point_segment_distance,
+                                    _segment_in_rect)
+
+
+class TestSpatialIndex:
+    """Test position queries over schematic items"""
+
+    def test_cached(self, schematic):
+        """Test the index is built once per schematic"""
+        index = schematic.spatial_index()
+        assert index is schematic.spatial_index()
+        assert len(index) == len(schematic.wires) + len(schematic.junctions) + len(
+            schematic.labels + schematic.global_labels + schematic.hierarchical_labels
+        )
+
+    def test_copied_or_changed(self, schematic):
+        """Test the index is built again when its lists are replaced or grow"""
+        first, second = schematic.wires
+        assert schematic.spatial_index().at(100, 80) == [first, second]
+        copied = schematic.model_copy(update={"wires": []})
+        assert copied.spatial_index().at(100, 80) == []
+        assert schematic.spatial_index().at(100, 80) == [first, second]
+        schematic.wires = [second]
+        assert schematic.spatial_index().at(100, 80) == [second]
+        schematic.wires.append(first)
+        assert schematic.spatial_index().at(90, 80) == [first]
+
+    def test_at(self, schematic):
+        """Test the wires touching a point are found"""
+        first, second = schematic.wires
+        index = schematic.spatial_index()
+        assert index.at(100, 80) == [first, second]
+        assert index.at(90, 80) == [first]
+        assert index.at(90, 80.5) == []
+        assert index.at(100, 100) == [schematic.junctions[0]]
+
+    def test_near(self, schematic):
+        """Test items within a radius are found"""
+        index = schematic.spatial_index()
+        assert index.near(90, 81, 0.5) == []
+        assert index.near(90, 81, 1) == [schematic.wires[0]]
+        assert index.near(110, 110, 15) == schematic.junctions
+        assert index.near(110, 110, 30) == [schematic.wires[1]] + schematic.junctions
+
+    def test_in_rect(self, schematic):
+        """Test items overlapping a rectangle are found"""
+        index = schematic.spatial_index()
+        assert index.in_rect(85, 75, 95, 85) == [schematic.wires[0]]
+        assert index.in_rect(119, 121, 121, 119) == [schematic.junctions[1]]
+        assert index.in_rect(0, 0, 50, 50) == []
+
+    def test_matches_brute_force(self):
+        """Test queries agree with checking every item on a large grid"""
+        index = SpatialIndex(cell_size=3)
+        segments = [
+            (i, j, i + 7, j + 2 * (i % 3)) for i in range(40) for j in range(0, 40, 5)
+        ]
+        for position, segment in enumerate(segments):
+            index.add(position, [segment])
+        for x, y, r in [(0, 0, 1), (10.5, 12, 2), (33, 7, 0.25), (20, 20, 50)]:
+            expected = [
+                p
+                for p, segment in enumerate(segments)
+                if _point_segment_distance(x, y, segment) <= r
+            ]
+            assert index.near(x, y, r) == expected
+        for rect in [(0, 0, 2, 2), (10.5, 12, 14, 30), (-5, -5, 100, 100)]:
+            expected = [
+                p
+                for p, segment in enumerate(segments)
+                if _segment_in_rect(segment, *rect)
+            ]
+            assert index.in_rect(*rect) == expected